@@ -0,0 +1,88 @@
+# compare.py
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+STATS = ("min", "median", "mean")
+# min is the least noisy stat on a shared machine (scheduler and cache hiccups only ever add
+# time); +50% keeps the check to real regressions, not run-to-run jitter.
+DEFAULT_STAT = "min"
+DEFAULT_THRESHOLD = 0.50
+
+
+def _load_run(path: Path) -> dict[str, dict[str, float]]:
+    """pytest-benchmark --benchmark-json output -> {test name: {stat: seconds}}."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {b["name"]: {k: float(b["stats"][k]) for k in (*STATS, "rounds")} for b in data["benchmarks"]}
+
+
+def save(run_path: Path, out: Path) -> int:
+    run = _load_run(run_path)
+    baseline = {
+        "machine": f"{platform.system()} {platform.machine()} {platform.python_implementation()} {platform.python_version()}",
+        "benchmarks": run,
+    }
+    out.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"Saved {len(run)} benchmarks -> {out}")
+    return 0
+
+
+def check(run_path: Path, baseline_path: Path, *, threshold: float, stat: str) -> int:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    base = baseline["benchmarks"]
+    run = _load_run(run_path)
+
+    print(f"baseline: {baseline_path} ({baseline.get('machine', '?')}), stat={stat}, threshold=+{100 * threshold:.0f}%")
+    regressions: list[str] = []
+    for name in sorted(set(base) | set(run)):
+        if name not in run:
+            print(f"  {name:<32} MISSING from this run")
+            regressions.append(name)
+            continue
+        if name not in base:
+            print(f"  {name:<32} new (no baseline) {1000 * run[name][stat]:10.3f} ms")
+            continue
+
+        old, new = base[name][stat], run[name][stat]
+        change = (new - old) / old if old > 0 else 0.0
+        bad = change > threshold
+        if bad:
+            regressions.append(name)
+        print(
+            f"  {name:<32} {1000 * old:10.3f} -> {1000 * new:10.3f} ms  {100 * change:+7.1f}%"
+            + ("  REGRESSION" if bad else "")
+        )
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("OK")
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Compare a pytest-benchmark JSON run against the stored baseline.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p_save = sub.add_parser("save", help="Store a run as the new baseline")
+    p_save.add_argument("run", type=Path, help="--benchmark-json output")
+    p_save.add_argument("--out", type=Path, default=BASELINE_PATH)
+
+    p_check = sub.add_parser("check", help="Fail (exit 1) if any benchmark regressed beyond the threshold")
+    p_check.add_argument("run", type=Path, help="--benchmark-json output")
+    p_check.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    p_check.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown, 0.50 = +50%%")
+    p_check.add_argument("--stat", choices=STATS, default=DEFAULT_STAT)
+
+    args = ap.parse_args()
+    if args.cmd == "save":
+        return save(args.run, args.out)
+    return check(args.run, args.baseline, threshold=args.threshold, stat=args.stat)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from zml_game_bridge.events.base import EventBase
+from zml_game_bridge.inputs.chat.interpreter import interpret_chat_line
+from zml_game_bridge.inputs.chat.model import ChatLine
+from zml_game_bridge.inputs.chat.parser import parse_chat_line
+from zml_game_bridge.testing.chat_log_gen import ChatLogGenerator, GenConfig
+
+# Fixed synthetic corpus: same seed, same lines on every run and machine.
+CORPUS_LINES = 5000
+CORPUS_SEED = 1234
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # The project-wide 3 s test timeout is for unit tests; a benchmark runs many rounds.
+    for item in items:
+        item.add_marker(pytest.mark.timeout(120))
+
+
+@pytest.fixture(scope="session")
+def corpus() -> list[str]:
+    gen = ChatLogGenerator(GenConfig(total_lines=CORPUS_LINES, sleep_ms_min=0, sleep_ms_max=0, seed=CORPUS_SEED))
+    return list(gen.iter_lines())
+
+
+@pytest.fixture(scope="session")
+def corpus_file(corpus: list[str], tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("corpus") / "chat.log"
+    path.write_text("\n".join(corpus) + "\n", encoding="utf-8", newline="\n")
+    return path
+
+
+@pytest.fixture(scope="session")
+def chat_lines(corpus: list[str]) -> list[ChatLine]:
+    return [cl for cl in map(parse_chat_line, corpus) if cl is not None]
+
+
+@pytest.fixture(scope="session")
+def events(chat_lines: list[ChatLine]) -> list[EventBase]:
+    return [ev for ev in map(interpret_chat_line, chat_lines) if ev is not None]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from zml_game_bridge.api.sse_hub import SseHub
+from zml_game_bridge.app.db_writer_worker import DbWriterWorker
+from zml_game_bridge.app.event_channel import EventChannel
+from zml_game_bridge.events.base import EventBase
+from zml_game_bridge.events.envelope import EventEnvelope
+from zml_game_bridge.events.in_memory_persisted_event_bus import InMemoryPersistedEventBus
+from zml_game_bridge.inputs.chat.interpreter import interpret_chat_line
+from zml_game_bridge.inputs.chat.model import ChatLine
+from zml_game_bridge.inputs.chat.parser import parse_chat_line
+from zml_game_bridge.inputs.chat.runner import start_chat_input
+from zml_game_bridge.inputs.chat.tailer import tail_lines
+from zml_game_bridge.storage.db_schema import ensure_schema
+from zml_game_bridge.storage.event_store import EventStore
+from zml_game_bridge.storage.sqlite import open_sqlite
+
+# Each benchmark round is one pass over the corpus (or its parsed/interpreted form).
+# Rounds for the hand-driven (pedantic) SQLite benchmarks: enough for a stable min.
+PEDANTIC_ROUNDS = 15
+
+
+def _envelopes(n: int) -> list[EventEnvelope]:
+    return [
+        EventEnvelope(
+            event_id=i,
+            created_ts_ms=1_768_000_000_000 + i,
+            event_dt="2026-01-10T12:37:00",
+            event_type="ItemReceived",
+            payload_json='{"item_name":"Zorn Star Ore","qty":4,"value_mpec":16000}',
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def test_tail_lines(benchmark: BenchmarkFixture, corpus: list[str], corpus_file: Path):
+    n = len(corpus)
+
+    def read_all() -> int:
+        got = 0
+        for _ in tail_lines(corpus_file, start_at_end=False, poll_interval_s=0.001):
+            got += 1
+            if got == n:
+                break
+        return got
+
+    assert benchmark(read_all) == n
+
+
+def test_parse_chat_line(benchmark: BenchmarkFixture, corpus: list[str]):
+    out = benchmark(lambda: [parse_chat_line(ln) for ln in corpus])
+    assert sum(1 for cl in out if cl is not None) > 0
+
+
+def test_interpret_chat_line(benchmark: BenchmarkFixture, chat_lines: list[ChatLine]):
+    out = benchmark(lambda: [interpret_chat_line(cl) for cl in chat_lines])
+    assert sum(1 for ev in out if ev is not None) > 0
+
+
+def test_event_store_append(benchmark: BenchmarkFixture, events: list[EventBase], tmp_path: Path):
+    conn = open_sqlite(tmp_path / "bench.sqlite3")
+    ensure_schema(conn)
+    store = EventStore(conn)
+    try:
+        benchmark.pedantic(lambda: [store.append(ev) for ev in events], rounds=PEDANTIC_ROUNDS, iterations=1)
+    finally:
+        conn.close()
+
+
+def test_bus_publish(benchmark: BenchmarkFixture):
+    bus = InMemoryPersistedEventBus()
+    seen = [0]
+
+    def handler(_env: EventEnvelope) -> None:
+        seen[0] += 1
+
+    # Runtime shape: recent-envelope ring, SSE hub, debug print.
+    for _ in range(3):
+        bus.subscribe(handler)
+    envs = _envelopes(5000)
+
+    def publish_all() -> None:
+        for env in envs:
+            bus.publish(env)
+
+    benchmark(publish_all)
+    assert seen[0] > 0
+
+
+def test_sse_hub_broadcast(benchmark: BenchmarkFixture):
+    loop = asyncio.new_event_loop()
+    try:
+        hub = SseHub(loop)
+        for _ in range(4):
+            hub.register()
+        envs = _envelopes(5000)
+
+        def broadcast_all() -> None:
+            # The runtime path: DbWriter thread -> on_envelope -> broadcast on the loop.
+            for env in envs:
+                hub.on_envelope(env)
+            loop.run_until_complete(asyncio.sleep(0))  # runs the scheduled broadcasts
+
+        benchmark(broadcast_all)
+    finally:
+        loop.close()
+
+
+class _PipelineRound:
+    """
+    One chat -> bus run on real threads. The threads start (untimed) tailing a chat.log
+    that does not exist yet; the timed part moves the corpus into place and waits for
+    the last envelope, so thread start-up and shutdown stay out of the measurement.
+    """
+
+    def __init__(self, corpus_file: Path, workdir: Path, expected: int, n: int) -> None:
+        self.expected = expected
+        self.staged = workdir / f"staged-{n}.log"
+        self.chat_log = workdir / f"chat-{n}.log"
+        shutil.copyfile(corpus_file, self.staged)
+
+        self.stop = threading.Event()
+        self.done = threading.Event()
+        self.got = 0
+
+        bus = InMemoryPersistedEventBus()
+        bus.subscribe(self._on_envelope)
+        channel = EventChannel()
+        writer = DbWriterWorker(db_path=workdir / f"pipeline-{n}.sqlite3", gateway=channel, bus=bus)
+
+        self._threads = [
+            threading.Thread(target=writer.run, kwargs={"stop_event": self.stop}, daemon=True),
+            threading.Thread(
+                target=start_chat_input,
+                kwargs={
+                    "path": self.chat_log,
+                    "event_sink": channel.emit,
+                    "stop_event": self.stop,
+                    "start_at_end": False,
+                    "poll_interval_s": 0.001,
+                },
+                daemon=True,
+            ),
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _on_envelope(self, _env: EventEnvelope) -> None:
+        self.got += 1
+        if self.got == self.expected:
+            self.done.set()
+
+    def run(self) -> int:
+        os.replace(self.staged, self.chat_log)
+        self.done.wait(timeout=60.0)
+        return self.got
+
+    def close(self) -> None:
+        self.stop.set()
+        for t in self._threads:
+            t.join(timeout=2.0)
+
+
+def test_chat_to_bus_pipeline(benchmark: BenchmarkFixture, corpus_file: Path, events: list[EventBase], tmp_path: Path):
+    """Whole path: tail -> parse -> interpret -> EventChannel -> DbWriter (SQLite) -> bus."""
+    rounds: list[_PipelineRound] = []
+
+    def setup() -> tuple[tuple[_PipelineRound], dict[str, object]]:
+        if rounds:
+            rounds[-1].close()
+        rounds.append(_PipelineRound(corpus_file, tmp_path, len(events), len(rounds)))
+        return (rounds[-1],), {}
+
+    try:
+        got = benchmark.pedantic(_PipelineRound.run, setup=setup, rounds=PEDANTIC_ROUNDS, iterations=1)
+    finally:
+        if rounds:
+            rounds[-1].close()
+    assert got == len(events)
@@ -8,17 +8,40 @@ from zml_game_bridge.api.routes import register_routes
 from zml_game_bridge.api.sse_hub import SseHub
 from zml_game_bridge.api.ws_hub import OcrPositionHub
 from zml_game_bridge.app.runtime import AppRuntime
+from zml_game_bridge.common.tracing import TRACER
+from zml_game_bridge.inputs.ocr.capture.frame_source import FrameSource
+from zml_game_bridge.inputs.ocr.capture.replay_source import open_replay_source
+from zml_game_bridge.inputs.ocr.runner import open_game_window
 from zml_game_bridge.settings import Settings
 
 
 
-def create_app() -> FastAPI:
-    settings = Settings()
+def create_app(settings: Settings | None = None) -> FastAPI:
+    settings = settings or Settings()
     print(f"Starting ZML Game Bridge with settings: {settings.chat_log_path}")
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        runtime = AppRuntime(db_path=settings.db_path, chat_log_path=settings.chat_log_path)
+        replay_path = settings.ocr_replay_path
+
+        def open_frame_source() -> FrameSource:
+            if replay_path is None:
+                return open_game_window()
+            return open_replay_source(
+                replay_path,
+                rate_hz=settings.ocr_replay_hz,
+                width=settings.ocr_replay_width,
+                height=settings.ocr_replay_height,
+            )
+
+        runtime = AppRuntime(
+            db_path=settings.db_path,
+            chat_log_path=settings.chat_log_path,
+            ocr_frame_source_factory=open_frame_source,
+            ocr_engine_pool_size=settings.ocr_engine_pool_size,
+            ocr_engine_batch=settings.ocr_engine_batch,
+            ocr_enabled=settings.ocr_enabled,
+        )
 
         loop = asyncio.get_running_loop()
         sse_hub = SseHub(loop)
@@ -28,12 +51,16 @@ def create_app() -> FastAPI:
         runtime.attach_position_hub(position_hub)
 
         app.state.runtime = runtime
+        TRACER.enabled = settings.tracing_enabled
+        sse_hub.start()
         runtime.start()
         try:
             yield
         finally:
             runtime.stop()
+            sse_hub.stop()
 
     app = FastAPI(title="ZML Game Bridge", version="0.1.0", lifespan=lifespan)
+    app.state.settings = settings
     register_routes(app)
     return app
\ No newline at end of file
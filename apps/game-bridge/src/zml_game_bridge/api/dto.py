@@ -3,6 +3,7 @@ from pydantic import BaseModel, ConfigDict
 from typing_extensions import Any
 
 from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition
+from zml_game_bridge.inputs.ocr.pipelines.text.model import OcrText
 
 
 class EventEnvelopeDto(BaseModel):
@@ -24,6 +25,7 @@ class PositionDto(BaseModel):
     x: int
     y: int
     z: int | None
+    confidence: float = 1.0
 
     @classmethod
     def from_domain(cls, pos: OcrPosition) -> "PositionDto":
@@ -33,4 +35,27 @@ class PositionDto(BaseModel):
             x=pos.position.x,
             y=pos.position.y,
             z=pos.position.z,
-        )
\ No newline at end of file
+            confidence=round(pos.confidence, 3),
+        )
+
+
+class TrackDto(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    from_ts_ms: int
+    to_ts_ms: int
+    raw_count: int
+    # [ts_ms, x, y] triples, ascending by ts_ms
+    points: list[tuple[int, int, int]]
+
+
+class OcrTextDto(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    source: str
+    ts_ms: int
+    lines: list[str]
+
+    @classmethod
+    def from_domain(cls, text: OcrText) -> "OcrTextDto":
+        return cls(source=text.source, ts_ms=text.ts_ms, lines=list(text.lines))
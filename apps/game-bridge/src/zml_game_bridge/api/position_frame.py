@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+
+from zml_game_bridge.api.dto import PositionDto
+from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition
+
+POSITION_FRAME_VERSION = 1
+FLAG_HAS_Z = 0x01
+
+# Compact WS frame, 24 bytes little-endian:
+#   u8 version | u8 flags | u8 confidence (0..255) | 1 pad | i32 x | i32 y | i32 z | i64 ts_ms
+# planet_name is not in the frame; binary clients get a JSON frame whenever it changes.
+# (confidence took a former pad byte, so the layout and version are unchanged.)
+POSITION_FRAME = struct.Struct("<BBBxiiiq")
+
+
+@dataclass(frozen=True, slots=True)
+class PositionFrame:
+    """One OCR fix, encoded once per publish and shared by every subscriber."""
+
+    pos: OcrPosition
+    json_text: str
+    binary: bytes
+
+    @classmethod
+    def encode(cls, pos: OcrPosition) -> PositionFrame:
+        p = pos.position
+        flags = FLAG_HAS_Z if p.z is not None else 0
+        return cls(
+            pos=pos,
+            json_text=PositionDto.from_domain(pos).model_dump_json(),
+            binary=POSITION_FRAME.pack(
+                POSITION_FRAME_VERSION,
+                flags,
+                round(255 * min(1.0, max(0.0, pos.confidence))),
+                p.x,
+                p.y,
+                p.z or 0,
+                pos.ts_ms,
+            ),
+        )
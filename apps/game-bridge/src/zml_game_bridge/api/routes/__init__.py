@@ -1,12 +1,20 @@
 from fastapi import FastAPI
 
+from .admin import router as admin_router
 from .health import router as health_router
+from .metrics import router as metrics_router
+from .ocr import router as ocr_router
 from .events import router as events_router
 from .ws_position import router as position_router
+from .positions import router as positions_router
 
 
 def register_routes(app: FastAPI) -> None:
     """Register all API routers on the app."""
     app.include_router(health_router)
+    app.include_router(metrics_router)
     app.include_router(events_router)
     app.include_router(position_router)
+    app.include_router(positions_router)
+    app.include_router(ocr_router)
+    app.include_router(admin_router)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from starlette.responses import PlainTextResponse
+
+from zml_game_bridge.app.profiler import SamplingProfiler
+from zml_game_bridge.common.tracing import TRACER
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+_PROFILER = SamplingProfiler()
+
+
+def _require_admin(request: Request) -> None:
+    """Admin routes exist only with Settings.profiler_enabled; 404 otherwise."""
+    settings = getattr(request.app.state, "settings", None)
+    if settings is None or not settings.profiler_enabled:
+        raise HTTPException(status_code=404, detail="admin routes disabled")
+
+
+@router.get("/profile", response_model=None)
+async def profile(
+    request: Request,
+    seconds: float = Query(default=5.0, gt=0, le=60),
+    format: Literal["collapsed", "json"] = Query(default="collapsed"),
+) -> PlainTextResponse | dict[str, Any]:
+    """
+    Sample the runtime threads for `seconds` and return folded stacks, one root per thread name.
+    Runs in a worker thread so the event loop itself can be sampled.
+    """
+    _require_admin(request)
+    runtime = getattr(request.app.state, "runtime", None)
+    if runtime is None:
+        raise HTTPException(status_code=404, detail="profiler disabled")
+    if _PROFILER.busy:
+        raise HTTPException(status_code=409, detail="a profile is already running")
+
+    try:
+        result = await asyncio.to_thread(_PROFILER.run, runtime.threads(), seconds)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+    if format == "json":
+        return {"seconds": result.seconds, "samples": result.samples, "threads": result.stacks}
+    return PlainTextResponse(result.collapsed())
+
+
+@router.get("/tracing")
+def tracing(request: Request) -> dict[str, bool]:
+    _require_admin(request)
+    return {"enabled": TRACER.enabled}
+
+
+@router.put("/tracing")
+def set_tracing(request: Request, enabled: bool = Query()) -> dict[str, bool]:
+    """Per-stage histograms land in /metrics as zml_trace_stage_seconds / zml_trace_total_seconds."""
+    _require_admin(request)
+    TRACER.enabled = enabled
+    return {"enabled": TRACER.enabled}
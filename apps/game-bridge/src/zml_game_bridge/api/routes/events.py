@@ -1,15 +1,18 @@
 import asyncio
 import json
 import os
-from collections.abc import Iterator
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Query, Request
 from starlette.responses import StreamingResponse
 
 from zml_game_bridge.api.dto import EventEnvelopeDto
+from zml_game_bridge.api.sse_hub import SseItem
 from zml_game_bridge.events.envelope import EventEnvelope
+from zml_game_bridge.events.recent_envelope_buffer import RecentEnvelopeBuffer
 from zml_game_bridge.storage.event_reader import EventReader
 
 router = APIRouter(prefix="/events", tags=["events"])
@@ -18,10 +21,15 @@ router = APIRouter(prefix="/events", tags=["events"])
 local_app_data = os.getenv("LOCALAPPDATA") or str(Path.home())
 db_path = Path(local_app_data) / "zabu-mining-log" / "db" / "zabu-mining-log.sqlite3"
 
+# SSE resume: rows per keyset page when replaying a gap from SQLite.
+_REPLAY_PAGE_SIZE = 500
+# SSE resume: client reconnect delay hint; EventSource resends Last-Event-ID on reconnect.
+_RECONNECT_RETRY_MS = 2000
 
-def get_event_reader() -> Iterator[EventReader]:
+
+@contextmanager
+def open_event_reader() -> Generator[EventReader]:
     """
-    FastAPI dependency:
     - opens DB
     - yields EventReader
     - always closes
@@ -33,6 +41,39 @@ def get_event_reader() -> Iterator[EventReader]:
     finally:
         event_reader.close()
 
+
+def _recent_events(request: Request) -> RecentEnvelopeBuffer | None:
+    runtime = getattr(request.app.state, "runtime", None)
+    return runtime.recent_events if runtime is not None else None
+
+
+def _read_latest(recent: RecentEnvelopeBuffer | None, *, limit: int) -> list[EventEnvelope]:
+    """Serve from the in-memory ring when it holds the window, else SQLite."""
+    rows = recent.read_latest(limit=limit) if recent is not None else None
+    if rows is None:
+        with open_event_reader() as db:
+            rows = db.read_latest(limit=limit)
+    return rows
+
+
+def _read_after(
+    recent: RecentEnvelopeBuffer | None,
+    after_event_id: int,
+    *,
+    limit: int,
+) -> list[EventEnvelope]:
+    """
+    One keyset page, ring first.
+    May run in a worker thread: the fallback opens its own short-lived connection
+    (sqlite connections are bound to the thread that opened them).
+    """
+    rows = recent.read_after(after_event_id, limit=limit) if recent is not None else None
+    if rows is None:
+        with open_event_reader() as db:
+            rows = db.read_after(after_event_id, limit=limit)
+    return rows
+
+
 def _to_dto(envelope: EventEnvelope) -> EventEnvelopeDto:
     return EventEnvelopeDto(
         event_id=envelope.event_id,
@@ -45,60 +86,157 @@ def _to_dto(envelope: EventEnvelope) -> EventEnvelopeDto:
 
 @router.get("/latest", response_model=list[EventEnvelopeDto])
 def latest(
+    request: Request,
     limit: int = Query(default=200, ge=1, le=2000),
-    db: EventReader = Depends(get_event_reader),
 ) -> list[EventEnvelopeDto]:
-    rows = db.read_latest(limit=limit)
+    rows = _read_latest(_recent_events(request), limit=limit)
     return [_to_dto(r) for r in rows]
 
 
 @router.get("/after/{after_event_id}", response_model=list[EventEnvelopeDto])
 def after(
+    request: Request,
     after_event_id: int,
     limit: int = Query(default=200, ge=1, le=2000),
-    db: EventReader = Depends(get_event_reader),
 ) -> list[EventEnvelopeDto]:
-    rows = db.read_after(after_event_id, limit=limit)
+    rows = _read_after(_recent_events(request), after_event_id, limit=limit)
     return [_to_dto(r) for r in rows]
 
 
+@router.get("/cache")
+def cache_stats(request: Request) -> dict[str, Any]:
+    recent = _recent_events(request)
+    if recent is None:
+        return {"enabled": False}
+    st = recent.stats()
+    return {
+        "enabled": True,
+        "capacity": st.capacity,
+        "size": st.size,
+        "first_event_id": st.first_event_id,
+        "last_event_id": st.last_event_id,
+        "hits": st.hits,
+        "misses": st.misses,
+        "hit_rate": st.hit_rate,
+    }
+
+
+async def _replay_persisted(
+    recent: RecentEnvelopeBuffer | None,
+    after_event_id: int,
+    *,
+    until_event_id: int | None = None,
+) -> AsyncIterator[EventEnvelope]:
+    """
+    Yield persisted envelopes with event_id > after_event_id (and < until_event_id if given),
+    paging (ring first, then SQLite) so a long gap never loads into memory at once.
+    """
+    while True:
+        rows = await asyncio.to_thread(_read_after, recent, after_event_id, limit=_REPLAY_PAGE_SIZE)
+        for env in rows:
+            if until_event_id is not None and env.event_id >= until_event_id:
+                return
+            yield env
+            after_event_id = env.event_id
+        if len(rows) < _REPLAY_PAGE_SIZE:
+            return
+
+
+def _resume_event_id(request: Request, after: int | None) -> int | None:
+    """
+    Where to resume the stream from.
+    EventSource sends Last-Event-ID on automatic reconnect; it wins over the ?after= of the
+    original URL, which still points at the first connect.
+    """
+    header = request.headers.get("last-event-id")
+    if header:
+        try:
+            return max(0, int(header.strip()))
+        except ValueError:
+            pass
+    return after
+
+
+def _format_sse(env: EventEnvelope) -> str:
+    dto = _to_dto(env)
+    data = dto.model_dump_json(exclude={"event_id", "event_type"})  # pydantic v2
+
+    # SSE format:
+    # id: <...>
+    # event: <...>
+    # data: <json>
+    return f"id: {dto.event_id}\nevent: {dto.event_type}\ndata: {data}\n\n"
+
+
 @router.get("/stream")
-async def events_stream(request: Request) -> StreamingResponse:
+async def events_stream(
+    request: Request,
+    after: int | None = Query(default=None, ge=0),
+) -> StreamingResponse:
     runtime = request.app.state.runtime
-    #TODO property/getter
-    hub = runtime._sse_hub
+    hub = runtime.sse_hub
 
     if hub is None:
         async def empty() -> AsyncIterator[str]:
             yield "event: error\ndata: {\"error\":\"sse hub not configured\"}\n\n"
         return StreamingResponse(empty(), media_type="text/event-stream")
 
+    resume_from = _resume_event_id(request, after)
+    recent = _recent_events(request)
+
+    # Register BEFORE the DB replay: everything published meanwhile queues up live,
+    # and the overlap with the replayed rows is skipped by event_id below.
     client = hub.register()
 
     async def gen() -> AsyncIterator[str]:
+        last_sent_id = resume_from
         try:
-            yield ": connected\n\n"
+            yield f"retry: {_RECONNECT_RETRY_MS}\n: connected\n\n"
+
+            if last_sent_id is not None:
+                async for env in _replay_persisted(recent, last_sent_id):
+                    yield _format_sse(env)
+                    last_sent_id = env.event_id
 
+            # No per-iteration is_disconnected() and no per-message timer: Starlette cancels
+            # this generator when the client goes away, a failing send ends it as well, and
+            # keep-alives come from the hub's shared ticker as KEEPALIVE queue items.
             while True:
-                if await request.is_disconnected():
-                    break
-
-                try:
-                    env: EventEnvelope = await asyncio.wait_for(client.queue.get(), timeout=15.0)
-                except asyncio.TimeoutError:
-                    yield ": keep-alive\n\n"
-                    continue
-
-                dto = _to_dto(env)
-                data = dto.model_dump_json(exclude={"event_id", "event_type"})  # pydantic v2
-
-                # SSE format:
-                # id: <...>
-                # event: <...>
-                # data: <json>
-                yield f"id: {dto.event_id}\n"
-                yield f"event: {dto.event_type}\n"
-                yield f"data: {data}\n\n"
+                batch: list[SseItem] = [await client.queue.get()]
+                while True:
+                    try:
+                        batch.append(client.queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                # Everything queued goes out as one write.
+                frames: list[str] = []
+                for env in batch:
+                    if env is None:  # KEEPALIVE tick
+                        continue
+
+                    if last_sent_id is not None:
+                        if env.event_id <= last_sent_id:
+                            # Already delivered by the DB replay.
+                            continue
+                        if env.event_id > last_sent_id + 1:
+                            # The live queue dropped envelopes (slow client / long replay):
+                            # fill the hole from SQLite instead of making the client reload.
+                            async for missed in _replay_persisted(
+                                recent, last_sent_id, until_event_id=env.event_id
+                            ):
+                                frames.append(_format_sse(missed))
+                                last_sent_id = missed.event_id
+
+                    frames.append(_format_sse(env))
+                    last_sent_id = env.event_id
+
+                yield "".join(frames) if frames else ": keep-alive\n\n"
+
+                # Resumed once the write went out (Starlette pulls the next chunk after send()).
+                for env in batch:
+                    if env is not None and env.trace is not None:
+                        env.trace.end("sse_write")
         finally:
             hub.unregister(client.client_id)
 
@@ -1,8 +1,45 @@
 from __future__ import annotations
-from fastapi import APIRouter
+
+from dataclasses import asdict
+from typing import Any
+
+from fastapi import APIRouter, Request, Response
+
+from zml_game_bridge.app.health import PipelineHealth, check_pipeline
+from zml_game_bridge.settings import Settings
 
 router = APIRouter()
 
+
+def _check(request: Request) -> PipelineHealth | None:
+    runtime = getattr(request.app.state, "runtime", None)
+    if runtime is None:
+        return None
+    settings = getattr(request.app.state, "settings", None) or Settings()
+    return check_pipeline(runtime, stall_s=settings.health_stall_s, min_ocr_hz=settings.health_min_ocr_hz)
+
+
 @router.get("/health")
-def health() -> dict[str, str]:
-    return {"status": "ok"}
+def health(request: Request, response: Response) -> dict[str, Any]:
+    """
+    Supervisor probe: 503 when the chat or DB writer loop died or stalled, 200 otherwise
+    (incl. "degraded", e.g. a lost OCR loop).
+    """
+    h = _check(request)
+    if h is None:
+        response.status_code = 503
+        return {"status": "down", "problems": ["runtime not started"]}
+    if h.status == "down":
+        response.status_code = 503
+    return {"status": h.status, "problems": h.problems}
+
+
+@router.get("/health/pipeline")
+def health_pipeline(request: Request, response: Response) -> dict[str, Any]:
+    h = _check(request)
+    if h is None:
+        response.status_code = 503
+        return {"status": "down", "problems": ["runtime not started"]}
+    if h.status == "down":
+        response.status_code = 503
+    return asdict(h)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import cast
+
+from fastapi import APIRouter, Request
+
+from zml_game_bridge.api.dto import OcrTextDto
+from zml_game_bridge.app.runtime import AppRuntime
+
+router = APIRouter(prefix="/ocr", tags=["ocr"])
+
+
+@router.get("/text", response_model=list[OcrTextDto])
+def latest_text(request: Request) -> list[OcrTextDto]:
+    """Latest lines read from each UI panel (finder, deeds, ...)."""
+    runtime = cast(AppRuntime, request.app.state.runtime)
+    return [OcrTextDto.from_domain(t) for t in runtime.ocr_text.latest()]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+from typing import cast
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from zml_game_bridge.api.dto import TrackDto
+from zml_game_bridge.app.runtime import AppRuntime
+from zml_game_bridge.services.position_track import TrackSlice, simplify_track
+from zml_game_bridge.storage.position_reader import PositionReader
+
+router = APIRouter(prefix="/positions", tags=["positions"])
+
+# Without from_ts_ms the track covers the last hour before to_ts_ms, not the whole table.
+DEFAULT_WINDOW_MS = 60 * 60 * 1000
+
+
+@router.get("/track", response_model=TrackDto)
+def track(
+    request: Request,
+    from_ts_ms: int | None = Query(default=None, ge=0),
+    to_ts_ms: int | None = Query(default=None, ge=0),
+    planet: str | None = Query(default=None, min_length=1),
+    max_points: int = Query(default=2000, ge=2, le=20_000),
+    tolerance: float = Query(default=1.0, ge=0.0),
+) -> TrackDto:
+    """
+    Position history in [from_ts_ms, to_ts_ms] (default: the hour up to now), optionally
+    on one planet, simplified server-side (Douglas-Peucker) to at most max_points.
+    Recent points come from memory, older ones from SQLite.
+    """
+    runtime = cast(AppRuntime, request.app.state.runtime)
+    position_track = runtime.position_track
+
+    if to_ts_ms is None:
+        to_ts_ms = time.time_ns() // 1_000_000
+    if from_ts_ms is None:
+        from_ts_ms = max(0, to_ts_ms - DEFAULT_WINDOW_MS)
+    if to_ts_ms < from_ts_ms:
+        raise HTTPException(status_code=422, detail="to_ts_ms must be >= from_ts_ms")
+
+    parts: list[TrackSlice] = []
+    mem_oldest = position_track.oldest_ts_ms()
+    if mem_oldest is None or from_ts_ms < mem_oldest:
+        db_to = to_ts_ms if mem_oldest is None else min(to_ts_ms, mem_oldest - 1)
+        reader = PositionReader(runtime.db_path)
+        reader.open()
+        try:
+            parts.append(TrackSlice.from_rows(reader.read_range(from_ts_ms, db_to, planet=planet)))
+        finally:
+            reader.close()
+    if mem_oldest is not None:
+        parts.append(
+            position_track.read_range(max(from_ts_ms, mem_oldest), to_ts_ms, planet=planet)
+        )
+
+    raw = TrackSlice.concat(parts)
+    out = simplify_track(raw, tolerance=tolerance, max_points=max_points)
+
+    return TrackDto(
+        from_ts_ms=from_ts_ms,
+        to_ts_ms=to_ts_ms,
+        raw_count=len(raw),
+        points=list(zip(out.ts_ms.tolist(), out.x.tolist(), out.y.tolist(), strict=True)),
+    )
@@ -2,31 +2,78 @@
 from __future__ import annotations
 
 import asyncio
-from typing import cast
+from typing import Literal, cast
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
-from zml_game_bridge.api.dto import PositionDto
+from zml_game_bridge.api.position_frame import PositionFrame
 from zml_game_bridge.app.runtime import AppRuntime
 
 router = APIRouter(prefix="/ws", tags=["ws"])
 
+PositionFormat = Literal["json", "binary"]
+
+
+class _FrameSender:
+    """
+    Per-connection send policy.
+    - json: PositionDto JSON text frames
+    - binary: 24-byte POSITION_FRAME; a JSON text frame first and whenever planet_name changes
+    """
+
+    def __init__(self, ws: WebSocket, fmt: PositionFormat) -> None:
+        self._ws = ws
+        self._fmt = fmt
+        self._planet_sent = False
+        self._planet_name: str | None = None
+
+    async def send(self, frame: PositionFrame) -> None:
+        if self._fmt == "json":
+            await self._ws.send_text(frame.json_text)
+            return
+
+        planet_name = frame.pos.position.planet_name
+        if not self._planet_sent or planet_name != self._planet_name:
+            self._planet_sent = True
+            self._planet_name = planet_name
+            await self._ws.send_text(frame.json_text)
+            return
+
+        await self._ws.send_bytes(frame.binary)
+
 
 @router.websocket("/position")
-async def ws_position(ws: WebSocket) -> None:
+async def ws_position(
+    ws: WebSocket,
+    format: PositionFormat = Query(default="json"),
+    max_hz: float | None = Query(default=None, gt=0),
+) -> None:
     await ws.accept()
 
     runtime = cast(AppRuntime, ws.app.state.runtime)
     hub = runtime.position_hub  # property -> never None
 
+    sender = _FrameSender(ws, format)
+    min_interval_s = (1.0 / max_hz) if max_hz else 0.0
+    loop = asyncio.get_running_loop()
+
     q, last = hub.subscribe()
     try:
         if last is not None:
-            await ws.send_json(PositionDto.from_domain(last).model_dump())
+            await sender.send(last)
+        next_send_t = loop.time() + min_interval_s
 
         while True:
-            pos = await q.get()
-            await ws.send_json(PositionDto.from_domain(pos).model_dump())
+            if min_interval_s:
+                # Rate cap: wait out the interval first; the latest-only queue
+                # then hands us the newest fix and skips the ones in between.
+                delay = next_send_t - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            frame = await q.get()
+            await sender.send(frame)
+            next_send_t = loop.time() + min_interval_s
 
     except WebSocketDisconnect:
         return
@@ -5,13 +5,24 @@ import threading
 from dataclasses import dataclass
 from typing import Dict
 
+from zml_game_bridge.common.metrics import REGISTRY
 from zml_game_bridge.events.envelope import EventEnvelope
 
+# Queue item meaning "nothing sent for a while, write a keep-alive comment".
+KEEPALIVE = None
+
+SseItem = EventEnvelope | None
+
+_HELP_DROPPED = "Envelopes dropped for slow SSE clients, by policy"
+_BROADCAST = REGISTRY.counter("zml_sse_broadcast_total", "Envelopes broadcast to SSE clients")
+_DROPPED_OLDEST = REGISTRY.counter("zml_sse_dropped_total", _HELP_DROPPED, policy="oldest")
+_DROPPED_NEWEST = REGISTRY.counter("zml_sse_dropped_total", _HELP_DROPPED, policy="newest")
+
 
 @dataclass(frozen=True, slots=True)
 class SseClient:
     client_id: int
-    queue: asyncio.Queue[EventEnvelope]
+    queue: asyncio.Queue[SseItem]
 
 
 class SseHub:
@@ -21,27 +32,51 @@ class SseHub:
     - on_envelope() can be called from ANY thread (e.g., DbWriter thread)
     - each SSE connection registers its own asyncio.Queue
     - broadcasting is scheduled onto the event loop thread
+    - one shared ticker (not a timer per connection/message) drops a KEEPALIVE
+      into every idle queue; start()/stop() run on the event-loop thread
     """
 
-    def __init__(self, loop: asyncio.AbstractEventLoop, *, queue_maxsize: int = 200) -> None:
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        queue_maxsize: int = 200,
+        keepalive_s: float = 15.0,
+    ) -> None:
         self._loop = loop
         self._queue_maxsize = queue_maxsize
+        self._keepalive_s = keepalive_s
 
         self._lock = threading.Lock()
         self._next_id = 1
-        self._clients: Dict[int, asyncio.Queue[EventEnvelope]] = {}
+        self._clients: Dict[int, asyncio.Queue[SseItem]] = {}
+        self._ticker: asyncio.Task[None] | None = None
+        self.last_event_id: int | None = None  # latest envelope broadcast (event-loop thread)
+        REGISTRY.gauge("zml_sse_clients", "Connected SSE clients").set_function(self.client_count)
+
+    def start(self) -> None:
+        if self._ticker is None:
+            self._ticker = self._loop.create_task(self._keepalive_loop())
+
+    def stop(self) -> None:
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
 
     def register(self) -> SseClient:
         """
         Called from the event-loop thread (FastAPI request handler).
         """
-        q: asyncio.Queue[EventEnvelope] = asyncio.Queue(maxsize=self._queue_maxsize)
+        q: asyncio.Queue[SseItem] = asyncio.Queue(maxsize=self._queue_maxsize)
         with self._lock:
             client_id = self._next_id
             self._next_id += 1
             self._clients[client_id] = q
         return SseClient(client_id=client_id, queue=q)
 
+    def client_count(self) -> int:
+        return len(self._clients)
+
     def unregister(self, client_id: int) -> None:
         with self._lock:
             self._clients.pop(client_id, None)
@@ -51,6 +86,8 @@ class SseHub:
         Called from DbWriter thread (or any thread).
         Must not block.
         """
+        if env.trace is not None:
+            env.trace.mark("publish")
         try:
             self._loop.call_soon_threadsafe(self._broadcast, env)
         except RuntimeError:
@@ -64,16 +101,34 @@ class SseHub:
         with self._lock:
             queues = list(self._clients.values())
 
+        _BROADCAST.inc()
+        self.last_event_id = env.event_id
         for q in queues:
             # Backpressure policy for slow clients:
             # keep the stream "near-real-time" by dropping oldest.
             if q.full():
                 try:
                     _ = q.get_nowait()
+                    _DROPPED_OLDEST.inc()
                 except asyncio.QueueEmpty:
                     pass
             try:
                 q.put_nowait(env)
             except asyncio.QueueFull:
                 # if still full -> drop newest
+                _DROPPED_NEWEST.inc()
                 continue
+
+    async def _keepalive_loop(self) -> None:
+        """
+        Runs on event-loop thread.
+        A queue that already holds something will be written anyway, so only idle ones get a tick.
+        Writing is also how dead connections are found: the send fails and the stream ends.
+        """
+        while True:
+            await asyncio.sleep(self._keepalive_s)
+            with self._lock:
+                queues = list(self._clients.values())
+            for q in queues:
+                if q.empty():
+                    q.put_nowait(KEEPALIVE)
@@ -2,38 +2,53 @@ from __future__ import annotations
 
 import asyncio
 
+from zml_game_bridge.api.position_frame import PositionFrame
+from zml_game_bridge.common.metrics import REGISTRY
 from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition
 
+_PUBLISHED = REGISTRY.counter("zml_ws_position_published_total", "Position frames published to /ws/position")
+_REPLACED = REGISTRY.counter(
+    "zml_ws_position_replaced_total", "Unsent frames replaced by a newer one (slow /ws/position client)"
+)
+
 
 class OcrPositionHub:
     def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
         self._loop = loop
-        self._queues: set[asyncio.Queue[OcrPosition]] = set()
-        self._last: OcrPosition | None = None
+        self._queues: set[asyncio.Queue[PositionFrame]] = set()
+        self._last: PositionFrame | None = None
+        REGISTRY.gauge("zml_ws_position_clients", "Connected /ws/position clients").set_function(self.client_count)
 
     def publish_threadsafe(self, pos: OcrPosition) -> None:
         """Called from non-async threads."""
         self._loop.call_soon_threadsafe(self._publish_on_loop, pos)
 
     def _publish_on_loop(self, pos: OcrPosition) -> None:
-        self._last = pos
+        # Encode once here; every subscriber sends the same bytes/text.
+        frame = PositionFrame.encode(pos)
+        self._last = frame
+        _PUBLISHED.inc()
         for q in list(self._queues):
             # "Latest only": keep queue size at 1.
             while q.full():
                 try:
                     q.get_nowait()
+                    _REPLACED.inc()
                 except asyncio.QueueEmpty:
                     break
             try:
-                q.put_nowait(pos)
+                q.put_nowait(frame)
             except asyncio.QueueFull:
                 # Shouldn't happen due to full() draining, but keep safe.
                 pass
 
-    def subscribe(self) -> tuple[asyncio.Queue[OcrPosition], OcrPosition | None]:
-        q: asyncio.Queue[OcrPosition] = asyncio.Queue(maxsize=1)
+    def subscribe(self) -> tuple[asyncio.Queue[PositionFrame], PositionFrame | None]:
+        q: asyncio.Queue[PositionFrame] = asyncio.Queue(maxsize=1)
         self._queues.add(q)
         return q, self._last
 
-    def unsubscribe(self, q: asyncio.Queue[OcrPosition]) -> None:
+    def client_count(self) -> int:
+        return len(self._queues)
+
+    def unsubscribe(self, q: asyncio.Queue[PositionFrame]) -> None:
         self._queues.discard(q)
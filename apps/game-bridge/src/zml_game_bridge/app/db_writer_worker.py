@@ -2,26 +2,57 @@ from __future__ import annotations
 
 import sqlite3
 import threading
+import time
+from dataclasses import replace
 from pathlib import Path
 
 from zml_game_bridge.app.event_channel import EventChannel
+from zml_game_bridge.common.heartbeat import heartbeat
+from zml_game_bridge.common.metrics import REGISTRY
 from zml_game_bridge.events.bus import PersistedEventBus
+from zml_game_bridge.services.position_track import PositionTrack
 from zml_game_bridge.storage.db_schema import ensure_schema
 from zml_game_bridge.storage.event_store import EventStore
+from zml_game_bridge.storage.position_store import PositionStore
 from zml_game_bridge.storage.sqlite import open_sqlite
 
+_APPEND = REGISTRY.histogram("zml_db_append_seconds", "EventStore.append (insert + commit) per event")
+_PUBLISH = REGISTRY.histogram("zml_db_publish_seconds", "PersistedEventBus.publish per envelope")
+_POSITION_ROWS = REGISTRY.histogram(
+    "zml_db_position_flush_rows",
+    "Positions per batched insert",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+_POSITION_FLUSH = REGISTRY.histogram("zml_db_position_flush_seconds", "Batched position insert + commit")
+_HEARTBEAT = heartbeat("db_writer")
+
 
 class DbWriterWorker:
     db_path: Path
     gateway: EventChannel
     bus: PersistedEventBus
+    position_track: PositionTrack | None
 
-    def __init__(self, *, db_path: Path, gateway: EventChannel, bus: PersistedEventBus) -> None:
+    def __init__(
+        self,
+        *,
+        db_path: Path,
+        gateway: EventChannel,
+        bus: PersistedEventBus,
+        position_track: PositionTrack | None = None,
+        position_flush_interval_s: float = 1.0,
+    ) -> None:
         self.db_path = db_path
         self.gateway = gateway
         self.bus = bus
+        self.position_track = position_track
+        self.position_flush_interval_s = position_flush_interval_s
         self.conn: sqlite3.Connection | None = None
 
+        # Progress for /health; written by the writer thread only.
+        self.written = 0
+        self.last_event_id: int | None = None
+
     def open(self) -> None:
         self.conn = open_sqlite(self.db_path)
 
@@ -42,12 +73,27 @@ class DbWriterWorker:
             raise
 
         event_store = EventStore(self.conn)
+        position_store = PositionStore(self.conn)
+        next_position_flush = time.monotonic() + self.position_flush_interval_s
 
         try:
             while not stop_event.is_set():
-                event = self.gateway.take(timeout_s=0.1)
-                if event is None:
+                _HEARTBEAT.beat()
+                if self.position_track is not None and time.monotonic() >= next_position_flush:
+                    # OCR fixes arrive at ~10 Hz: one batched insert per interval, not one per fix.
+                    pending = self.position_track.drain_pending()
+                    t0 = time.perf_counter()
+                    position_store.append_many(pending)
+                    _POSITION_FLUSH.observe(time.perf_counter() - t0)
+                    _POSITION_ROWS.observe(len(pending))
+                    next_position_flush = time.monotonic() + self.position_flush_interval_s
+
+                item = self.gateway.take_traced(timeout_s=0.1)
+                if item is None:
                     continue
+                event, trace = item
+                if trace is not None:
+                    trace.mark("dequeue")
 
                 # TODO: Decide policy on DB failure:
                 # - retry? (how many times)
@@ -56,7 +102,21 @@ class DbWriterWorker:
                 # Also: log exceptions with enough context (event_type).
 
                 # TODO batching?
+                t0 = time.perf_counter()
                 event_envelope = event_store.append(event)
+                t1 = time.perf_counter()
+                if trace is not None:
+                    trace.mark("commit")
+                    event_envelope = replace(event_envelope, trace=trace)
                 self.bus.publish(event_envelope)
+                self.written += 1
+                self.last_event_id = event_envelope.event_id
+                _APPEND.observe(t1 - t0)
+                _PUBLISH.observe(time.perf_counter() - t1)
         finally:
+            if self.position_track is not None:
+                try:
+                    position_store.append_many(self.position_track.drain_pending())
+                except sqlite3.Error as e:
+                    print(f"Failed to flush positions on shutdown: {e}")
             self.close()
\ No newline at end of file
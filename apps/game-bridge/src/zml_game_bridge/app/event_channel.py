@@ -1,26 +1,46 @@
 from __future__ import annotations
 
+import time
 from queue import Queue, Empty
 
+from zml_game_bridge.common.metrics import REGISTRY
+from zml_game_bridge.common.tracing import Trace
 from zml_game_bridge.events.base import EventBase
 
+_PUT_WAIT = REGISTRY.histogram(
+    "zml_event_channel_put_wait_seconds",
+    "Time emit() spent in Queue.put (backpressure from the DB writer)",
+)
+
 
 class EventChannel:
-    _q: Queue[EventBase]
+    _q: Queue[tuple[EventBase, Trace | None]]
 
     def __init__(self, *, maxsize: int = 10_000) -> None:
         self._q = Queue(maxsize=maxsize)
+        self.emitted = 0  # written by the emitting (chat) thread only
+        REGISTRY.gauge("zml_event_channel_depth", "Events queued for the DB writer").set_function(self.size)
 
-    def emit(self, event: EventBase) -> None:
+    def emit(self, event: EventBase, trace: Trace | None = None) -> None:
         """Blocking by default (backpressure)."""
         # TODO: Backpressure policy:
         # - block indefinitely (current)
         # - block with timeout + drop
         # - non-blocking drop (put_nowait)
-        self._q.put(event)
+        t0 = time.perf_counter()
+        self._q.put((event, trace))
+        _PUT_WAIT.observe(time.perf_counter() - t0)
+        self.emitted += 1
+        if trace is not None:
+            trace.mark("enqueue")
 
     def take(self, *, timeout_s: float) -> EventBase | None:
         """Consumer side. Returns None on timeout."""
+        item = self.take_traced(timeout_s=timeout_s)
+        return item[0] if item is not None else None
+
+    def take_traced(self, *, timeout_s: float) -> tuple[EventBase, Trace | None] | None:
+        """Like take(), with the trace emitted alongside the event (None when tracing was off)."""
         try:
             return self._q.get(timeout=timeout_s)
         except Empty:
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from zml_game_bridge.app.runtime import AppRuntime
+from zml_game_bridge.common.heartbeat import heartbeat
+
+# Losing these loops costs a feature, not the event pipeline: dead/stalled -> "degraded".
+# OCR only feeds live positions; chat -> DB -> SSE keeps working without it.
+_OPTIONAL_LOOPS = frozenset({"ocr"})
+
+
+@dataclass(frozen=True, slots=True)
+class LoopHealth:
+    name: str
+    alive: bool
+    last_beat_age_s: float | None  # None = never beat
+    stalled: bool
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineHealth:
+    status: str  # "ok" | "degraded" (slow, or OCR loop lost) | "down" (dead or stalled chat/DB loop)
+    problems: list[str]
+    uptime_s: float
+    loops: list[LoopHealth]
+
+    event_channel_depth: int
+    events_emitted: int
+    events_written: int
+    db_lag_events: int  # emitted into the channel, not yet committed
+    db_last_event_id: int | None
+    sse_last_event_id: int | None
+    sse_lag_ids: int  # committed, not yet broadcast to SSE clients
+
+    ocr_hz: float | None  # None when OCR is off
+    sse_clients: int
+    ws_position_clients: int
+
+
+def check_pipeline(runtime: AppRuntime, *, stall_s: float, min_ocr_hz: float) -> PipelineHealth:
+    """
+    Snapshot from plain counters and heartbeats; takes no locks the pipeline threads hold.
+    Reads race with the writers by design: numbers may be one event apart.
+    """
+    now = time.monotonic()
+    started_at = runtime.started_at
+    uptime_s = now - started_at if started_at is not None else 0.0
+    problems: list[str] = []
+    down = started_at is None
+
+    if started_at is None:
+        problems.append("runtime not started")
+
+    loops: list[LoopHealth] = []
+    for name, thread in runtime.loops().items():
+        alive = thread is not None and thread.is_alive()
+        age = heartbeat(name).age_s(now)
+        # A loop that has not beaten yet gets stall_s of grace from start().
+        stalled = alive and (age > stall_s if age is not None else uptime_s > stall_s)
+        required = name not in _OPTIONAL_LOOPS
+        if started_at is not None and not alive:
+            problems.append(f"{name} thread is not running")
+            down = down or required
+        elif stalled:
+            problems.append(f"{name} loop stalled ({'never ran' if age is None else f'{age:.1f}s since last run'})")
+            down = down or required
+        loops.append(LoopHealth(name=name, alive=alive, last_beat_age_s=age, stalled=stalled))
+
+    ocr_hz: float | None = None
+    if runtime.ocr_enabled:
+        ocr_hz = heartbeat("ocr").hz
+        if uptime_s > stall_s and ocr_hz < min_ocr_hz:
+            problems.append(f"ocr loop at {ocr_hz:.1f} Hz (< {min_ocr_hz:g})")
+
+    channel = runtime.event_channel
+    writer = runtime.db_writer
+    emitted = channel.emitted
+    written = writer.written
+    db_last = writer.last_event_id
+
+    sse_hub = runtime.sse_hub
+    sse_last = sse_hub.last_event_id if sse_hub is not None else None
+    sse_lag = (db_last - (sse_last or 0)) if db_last is not None and sse_hub is not None else 0
+
+    try:
+        ws_clients = runtime.position_hub.client_count()
+    except RuntimeError:
+        ws_clients = 0
+
+    status = "down" if down else ("degraded" if problems else "ok")
+    return PipelineHealth(
+        status=status,
+        problems=problems,
+        uptime_s=uptime_s,
+        loops=loops,
+        event_channel_depth=channel.size(),
+        events_emitted=emitted,
+        events_written=written,
+        db_lag_events=max(0, emitted - written),
+        db_last_event_id=db_last,
+        sse_last_event_id=sse_last,
+        sse_lag_ids=max(0, sse_lag),
+        ocr_hz=ocr_hz,
+        sse_clients=sse_hub.client_count() if sse_hub is not None else 0,
+        ws_position_clients=ws_clients,
+    )
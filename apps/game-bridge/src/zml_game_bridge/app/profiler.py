@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileResult:
+    seconds: float
+    samples: int  # sampling ticks taken
+    # thread name -> collapsed stack ("root;...;leaf") -> times seen
+    stacks: dict[str, dict[str, int]]
+
+    def collapsed(self) -> str:
+        """
+        Folded-stack text (flamegraph.pl / speedscope / inferno): one "stack count" per line,
+        the thread name as the root frame.
+        """
+        lines: list[str] = []
+        for name in sorted(self.stacks):
+            for stack, n in sorted(self.stacks[name].items(), key=lambda kv: -kv[1]):
+                lines.append(f"{name};{stack} {n}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampler over chosen threads: every interval_s it reads sys._current_frames()
+    from its own thread and counts each target thread's stack. Nothing is installed in the
+    sampled threads (no settrace/setprofile), so it costs nothing until run() is called and
+    only the GIL hand-offs of the sampler itself while it runs.
+    Blocked threads (queue waits, sleeps) show up too: the time is wall time, not CPU.
+    """
+
+    def __init__(self, *, interval_s: float = 0.005, max_depth: int = 128) -> None:
+        if interval_s <= 0:
+            raise ValueError("interval_s must be > 0")
+        self._interval_s = interval_s
+        self._max_depth = max_depth
+        # One profile at a time: two samplers would skew each other.
+        self._busy = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._busy.locked()
+
+    def run(self, threads: Mapping[str, threading.Thread], seconds: float) -> ProfileResult:
+        """Blocks for `seconds`. Raises RuntimeError if another profile is running."""
+        if not self._busy.acquire(blocking=False):
+            raise RuntimeError("A profile is already running")
+        try:
+            return self._sample(threads, seconds)
+        finally:
+            self._busy.release()
+
+    def _sample(self, threads: Mapping[str, threading.Thread], seconds: float) -> ProfileResult:
+        idents = {t.ident: name for name, t in threads.items() if t.ident is not None}
+        idents.pop(threading.get_ident(), None)
+        counts: dict[str, Counter[str]] = {name: Counter() for name in idents.values()}
+        labels: dict[object, str] = {}
+
+        samples = 0
+        t0 = time.perf_counter()
+        deadline = t0 + seconds
+        next_t = t0
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            # The only stdlib way to read other threads' stacks; documented, underscore or not.
+            frames = sys._current_frames()  # pyright: ignore[reportPrivateUsage]
+            for ident, name in idents.items():
+                frame = frames.get(ident)
+                if frame is not None:
+                    counts[name][self._stack(frame, labels)] += 1
+            del frames
+            samples += 1
+
+            next_t += self._interval_s
+            sleep_s = next_t - time.perf_counter()
+            if sleep_s > 0:
+                time.sleep(sleep_s)
+            else:
+                next_t = time.perf_counter()  # behind: resync, don't burst
+
+        return ProfileResult(
+            seconds=time.perf_counter() - t0,
+            samples=samples,
+            stacks={name: dict(c) for name, c in counts.items() if c},
+        )
+
+    def _stack(self, frame: FrameType | None, labels: dict[object, str]) -> str:
+        out: list[str] = []
+        while frame is not None and len(out) < self._max_depth:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = f"{Path(code.co_filename).stem}.{code.co_qualname}"
+            out.append(label)
+            frame = frame.f_back
+        out.reverse()
+        return ";".join(out)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import threading
+import time
 from threading import Thread
 from pathlib import Path
 
@@ -8,54 +9,150 @@ from zml_game_bridge.api.sse_hub import SseHub
 from zml_game_bridge.api.ws_hub import OcrPositionHub
 from zml_game_bridge.app.event_channel import EventChannel
 from zml_game_bridge.app.db_writer_worker import DbWriterWorker
-from zml_game_bridge.inputs.ocr.runner import start_ocr_input
+from zml_game_bridge.inputs.ocr.capture.frame_source import FrameSourceFactory
+from zml_game_bridge.inputs.ocr.runner import open_game_window, start_ocr_input
 from zml_game_bridge.events.in_memory_persisted_event_bus import (
     InMemoryPersistedEventBus,
 )
+from zml_game_bridge.events.recent_envelope_buffer import RecentEnvelopeBuffer
 from zml_game_bridge.inputs.chat.runner import start_chat_input
+from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition
+from zml_game_bridge.inputs.ocr.scheduler import PipelineScheduler
+from zml_game_bridge.services.ocr_text_board import OcrTextBoard
+from zml_game_bridge.services.position_track import PositionTrack
 
 
 class AppRuntime:
-    def __init__(self, *, db_path: Path, chat_log_path: Path | None) -> None:
+    def __init__(
+        self,
+        *,
+        db_path: Path,
+        chat_log_path: Path | None,
+        ocr_frame_source_factory: FrameSourceFactory = open_game_window,
+        ocr_engine_pool_size: int = 2,
+        ocr_engine_batch: bool = False,
+        ocr_enabled: bool = True,
+    ) -> None:
         self._db_path = db_path
         self._chat_log_path = chat_log_path
+        self._ocr_frame_source_factory = ocr_frame_source_factory
+        self._ocr_engine_pool_size = ocr_engine_pool_size
+        self._ocr_engine_batch = ocr_engine_batch
+        self._ocr_enabled = ocr_enabled
+        self._ocr_scheduler = PipelineScheduler()
 
         self._stop_event = threading.Event()
         self._bus = InMemoryPersistedEventBus()
         self._gateway = EventChannel()
-        self._db_writer_worker = DbWriterWorker(db_path=self._db_path, gateway=self._gateway, bus=self._bus)
+        self._position_track = PositionTrack()
+        self._db_writer_worker = DbWriterWorker(
+            db_path=self._db_path,
+            gateway=self._gateway,
+            bus=self._bus,
+            position_track=self._position_track,
+        )
+        self._recent_events = RecentEnvelopeBuffer()
+        self._ocr_text = OcrTextBoard()
 
         self._t_db: Thread | None = None
         self._t_chat: Thread | None = None
         self._t_ocr: Thread | None = None
+        self._t_loop: Thread | None = None
+        self._started_at: float | None = None
 
         self._sub_print = None
         self._sub_sse = None
+        self._sub_recent = None
 
         self._sse_hub: SseHub | None = None
         self._position_hub: OcrPositionHub | None = None
 
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    @property
+    def position_track(self) -> PositionTrack:
+        return self._position_track
+
+    @property
+    def recent_events(self) -> RecentEnvelopeBuffer:
+        return self._recent_events
+
+    @property
+    def ocr_text(self) -> OcrTextBoard:
+        return self._ocr_text
+
+    @property
+    def ocr_scheduler(self) -> PipelineScheduler:
+        return self._ocr_scheduler
+
+    @property
+    def sse_hub(self) -> SseHub | None:
+        return self._sse_hub
+
     @property
     def position_hub(self) -> OcrPositionHub:
         if self._position_hub is None:
             raise RuntimeError("Position hub not attached")
         return self._position_hub
 
+    @property
+    def event_channel(self) -> EventChannel:
+        return self._gateway
+
+    @property
+    def db_writer(self) -> DbWriterWorker:
+        return self._db_writer_worker
+
+    @property
+    def ocr_enabled(self) -> bool:
+        return self._ocr_enabled
+
+    @property
+    def started_at(self) -> float | None:
+        """time.monotonic() when start() ran."""
+        return self._started_at
+
+    def loops(self) -> dict[str, Thread | None]:
+        """Heartbeat name -> thread running that loop (None until started)."""
+        out = {"db_writer": self._t_db, "chat": self._t_chat}
+        if self._ocr_enabled:
+            out["ocr"] = self._t_ocr
+        return out
+
     def attach_sse_hub(self, hub: SseHub) -> None:
         self._sse_hub = hub
 
     def attach_position_hub(self, hub: OcrPositionHub) -> None:
         self._position_hub = hub
 
+    def threads(self) -> dict[str, Thread]:
+        """Started runtime threads by name, incl. the asyncio loop and OCR pipeline workers."""
+        out = {t.name: t for t in (self._t_db, self._t_chat, self._t_ocr) if t is not None}
+        out.update(self._ocr_scheduler.threads())
+        if self._t_loop is not None:
+            # Not ours to rename (MainThread under uvicorn); reported under a stable name.
+            out["zml-loop"] = self._t_loop
+        return out
+
 
     def start(self) -> None:
         # TODO: idempotency guard (if already started -> return)
 
-        hub = self.position_hub
+        _ = self.position_hub  # fail fast: raises if not attached
+
+        # Called from the lifespan handler, i.e. on the event-loop thread.
+        self._t_loop = threading.current_thread()
+        self._started_at = time.monotonic()
+
+        # Subscribe before the DB writer can publish: the ring must not miss the first envelopes.
+        self._sub_recent = self._bus.subscribe(self._recent_events.on_envelope)
 
         self._t_db = Thread(
             target=self._db_writer_worker.run,
             kwargs={"stop_event": self._stop_event},
+            name="zml-db-writer",
             daemon=True,
         )
         self._t_db.start()
@@ -71,20 +168,27 @@ class AppRuntime:
                 "stop_event": self._stop_event,
                 "start_at_end": True,
             },
+            name="zml-chat",
             daemon=True,
         )
         self._t_chat.start()
 
-
-        self._t_ocr = Thread(
-            target=start_ocr_input,
-            kwargs={
-                "position_sink": hub.publish_threadsafe,
-                "stop_event": self._stop_event,
-            },
-            daemon=True,
-        )
-        self._t_ocr.start()
+        if self._ocr_enabled:
+            self._t_ocr = Thread(
+                target=start_ocr_input,
+                kwargs={
+                    "position_sink": self._on_ocr_position,
+                    "stop_event": self._stop_event,
+                    "frame_source_factory": self._ocr_frame_source_factory,
+                    "engine_pool_size": self._ocr_engine_pool_size,
+                    "engine_batch": self._ocr_engine_batch,
+                    "text_sink": self._ocr_text.on_text,
+                    "scheduler": self._ocr_scheduler,
+                },
+                name="zml-ocr",
+                daemon=True,
+            )
+            self._t_ocr.start()
 
         self._sub_print = self._bus.subscribe(lambda env: print(f"New event stored: {env}"))
 
@@ -92,6 +196,11 @@ class AppRuntime:
         if self._sse_hub is not None:
             self._sub_sse = self._bus.subscribe(self._sse_hub.on_envelope)
 
+    def _on_ocr_position(self, pos: OcrPosition) -> None:
+        """OCR thread: record history, then fan out to WS clients."""
+        self._position_track.append(pos)
+        self.position_hub.publish_threadsafe(pos)
+
     def stop(self) -> None:
         self._stop_event.set()
 
@@ -103,6 +212,10 @@ class AppRuntime:
             self._sub_print.close()
             self._sub_print = None
 
+        if self._sub_recent is not None:
+            self._sub_recent.close()
+            self._sub_recent = None
+
         if self._t_chat is not None:
             self._t_chat.join(timeout=2.0)
         if self._t_db is not None:
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from zml_game_bridge.common.metrics import REGISTRY
+
+# Smoothing for the beat rate; ~10 beats to follow a step change.
+_HZ_ALPHA = 0.1
+
+
+class Heartbeat:
+    """
+    Last-activity stamp for one loop, beaten by its own thread on every iteration (idle
+    polls included), read by /health. Plain attribute writes: no lock, nothing to wait on.
+    """
+
+    __slots__ = ("beats", "hz", "last", "name")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.last: float | None = None  # time.monotonic() of the latest beat
+        self.beats = 0
+        self.hz = 0.0  # smoothed beat rate; meaningful for fixed-rate loops (OCR)
+
+    def beat(self) -> None:
+        now = time.monotonic()
+        last = self.last
+        if last is not None and now > last:
+            inst = 1.0 / (now - last)
+            self.hz = inst if self.hz == 0.0 else self.hz + _HZ_ALPHA * (inst - self.hz)
+        self.last = now
+        self.beats += 1
+
+    def age_s(self, now: float | None = None) -> float | None:
+        """Seconds since the latest beat; None if it never beat."""
+        last = self.last
+        if last is None:
+            return None
+        return (time.monotonic() if now is None else now) - last
+
+
+_lock = threading.Lock()
+_HEARTBEATS: dict[str, Heartbeat] = {}
+
+
+def heartbeat(name: str) -> Heartbeat:
+    """Process-wide heartbeat by loop name (get or create); keep the handle, like metrics."""
+    with _lock:
+        hb = _HEARTBEATS.get(name)
+        if hb is None:
+            hb = _HEARTBEATS[name] = Heartbeat(name)
+            REGISTRY.gauge(
+                "zml_heartbeat_age_seconds", "Seconds since the loop last ran (-1 = never)", loop=name
+            ).set_function(lambda: _age_or_minus_one(hb))
+        return hb
+
+
+def _age_or_minus_one(hb: Heartbeat) -> float:
+    age = hb.age_s()
+    return -1.0 if age is None else age
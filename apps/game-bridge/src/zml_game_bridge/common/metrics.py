@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+
+# Seconds; covers sub-ms parsing up to multi-second stalls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+class Counter:
+    """
+    Monotonic count. inc() is a plain attribute add: no lock on the hot path.
+    Series are normally written by one thread; concurrent writers may lose an
+    increment now and then, which is acceptable for rates.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Gauge:
+    """Current value; either set() by the owner or read from a function at scrape time."""
+
+    __slots__ = ("_fn", "_value")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._fn: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._value -= amount
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        """Sampled on every scrape (e.g. a queue's qsize); the hot path pays nothing."""
+        self._fn = fn
+
+    @property
+    def value(self) -> float:
+        fn = self._fn
+        return float(fn()) if fn is not None else self._value
+
+
+class Histogram:
+    """Fixed upper bounds; observe() is one bisect plus two adds."""
+
+    __slots__ = ("_bounds", "_counts", "_sum")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._bounds) + 1)  # last = +Inf
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def snapshot(self) -> tuple[list[tuple[float, int]], float, int]:
+        """(cumulative (le, count) pairs incl. +Inf, sum, count)."""
+        counts = list(self._counts)
+        out: list[tuple[float, int]] = []
+        acc = 0
+        for le, n in zip((*self._bounds, math.inf), counts, strict=True):
+            acc += n
+            out.append((le, acc))
+        return out, self._sum, acc
+
+
+Metric = Counter | Gauge | Histogram
+
+
+class _Family:
+    __slots__ = ("buckets", "help", "kind", "series")
+
+    def __init__(self, kind: type[Metric], help: str, buckets: tuple[float, ...] | None) -> None:
+        self.kind = kind
+        self.help = help
+        self.buckets = buckets
+        self.series: dict[LabelKey, Metric] = {}
+
+
+class MetricsRegistry:
+    """
+    Named metric families with optional labels, rendered in the Prometheus text
+    format. Look metrics up once (at construction) and keep the handle: lookups
+    take a lock, recording on the handle does not.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._families: dict[str, _Family] = {}
+
+    def counter(self, name: str, help: str = "", **labels: str) -> Counter:
+        return self._get(name, Counter, help, None, labels)  # type: ignore[return-value]
+
+    def gauge(self, name: str, help: str = "", **labels: str) -> Gauge:
+        return self._get(name, Gauge, help, None, labels)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help: str = "",
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        return self._get(name, Histogram, help, buckets, labels)  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._families.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            families = [(name, fam, list(fam.series.items())) for name, fam in sorted(self._families.items())]
+
+        lines: list[str] = []
+        for name, fam, series in families:
+            kind = {Counter: "counter", Gauge: "gauge", Histogram: "histogram"}[fam.kind]
+            if fam.help:
+                lines.append(f"# HELP {name} {_escape_help(fam.help)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, metric in series:
+                if isinstance(metric, Histogram):
+                    buckets, total, count = metric.snapshot()
+                    for le, n in buckets:
+                        lines.append(f"{name}_bucket{_labels(key, le=_fmt(le))} {n}")
+                    lines.append(f"{name}_sum{_labels(key)} {_fmt(total)}")
+                    lines.append(f"{name}_count{_labels(key)} {count}")
+                    continue
+                try:
+                    value = metric.value
+                except Exception as e:
+                    print(f"[metrics] {name} sample failed: {e!r}")
+                    continue
+                lines.append(f"{name}{_labels(key)} {_fmt(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get(
+        self,
+        name: str,
+        kind: type[Metric],
+        help: str,
+        buckets: tuple[float, ...] | None,
+        labels: dict[str, str],
+    ) -> Metric:
+        key: LabelKey = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            fam = self._families.get(name)
+            if fam is None:
+                fam = self._families[name] = _Family(kind, help, buckets)
+            elif fam.kind is not kind:
+                raise ValueError(f"Metric {name!r} already registered as {fam.kind.__name__}")
+            metric = fam.series.get(key)
+            if metric is None:
+                metric = fam.series[key] = Histogram(fam.buckets or DEFAULT_BUCKETS) if kind is Histogram else kind()
+            return metric
+
+
+def _fmt(v: float) -> str:
+    if v == math.inf:
+        return "+Inf"
+    if v == -math.inf:
+        return "-Inf"
+    if float(v).is_integer():
+        return str(int(v))
+    return repr(float(v))
+
+
+def _escape_label(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _labels(key: LabelKey, **extra: str) -> str:
+    pairs = [*key, *extra.items()]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+# Process-wide registry served by GET /metrics.
+REGISTRY = MetricsRegistry()
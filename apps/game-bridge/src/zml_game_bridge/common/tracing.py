@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+
+from zml_game_bridge.common.metrics import REGISTRY
+
+# Stamp order along the chat path; each stamp closes the stage since the previous one.
+# "dequeue" splits the EventChannel wait from the SQLite insert + commit.
+STAGES: tuple[str, ...] = ("tail", "parse", "interpret", "enqueue", "dequeue", "commit", "publish", "sse_write")
+
+_HELP_STAGE = "Traced chat event: time from the previous stamp to this one"
+_STAGE = {stage: REGISTRY.histogram("zml_trace_stage_seconds", _HELP_STAGE, stage=stage) for stage in STAGES[1:]}
+_TOTAL = REGISTRY.histogram(
+    "zml_trace_total_seconds",
+    "Traced chat event: chat.log read -> written to an SSE client (one per client)",
+)
+
+
+class Trace:
+    """
+    Monotonic-ns stamps for one chat event. Rides next to the event (EventChannel item,
+    EventEnvelope.trace) and never reaches the payload or SQLite.
+    Stamps are appended by one thread at a time as the event moves down the pipeline.
+    """
+
+    __slots__ = ("stamps",)
+
+    def __init__(self) -> None:
+        self.stamps: list[tuple[str, int]] = [("tail", time.monotonic_ns())]
+
+    def mark(self, stage: str) -> None:
+        now = time.monotonic_ns()
+        _STAGE[stage].observe((now - self.stamps[-1][1]) / 1e9)
+        self.stamps.append((stage, now))
+
+    def end(self, stage: str) -> None:
+        """
+        Final stamp taken once per consumer (e.g. per SSE client): observed, not stored,
+        so several consumers don't pile stamps onto the shared trace.
+        """
+        now = time.monotonic_ns()
+        _STAGE[stage].observe((now - self.stamps[-1][1]) / 1e9)
+        _TOTAL.observe((now - self.stamps[0][1]) / 1e9)
+
+    def as_dict(self) -> dict[str, int]:
+        """Stage -> ns since the tail stamp."""
+        t0 = self.stamps[0][1]
+        return {stage: ns - t0 for stage, ns in self.stamps}
+
+
+class Tracer:
+    """Runtime on/off switch; start() is the only call on the hot path when tracing is off."""
+
+    __slots__ = ("enabled",)
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled = enabled
+
+    def start(self) -> Trace | None:
+        return Trace() if self.enabled else None
+
+
+# Process-wide switch, flipped by Settings.tracing_enabled at startup and /admin/tracing.
+TRACER = Tracer()
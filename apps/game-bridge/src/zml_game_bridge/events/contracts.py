@@ -1,5 +1,12 @@
-from collections.abc import Callable
+from __future__ import annotations
 
+from typing import Protocol
+
+from zml_game_bridge.common.tracing import Trace
 from zml_game_bridge.events.base import EventBase
 
-EventSink = Callable[[EventBase], None]
\ No newline at end of file
+
+class EventSink(Protocol):
+    """Takes interpreted events; trace is passed only while tracing is on."""
+
+    def __call__(self, event: EventBase, trace: Trace | None = None, /) -> None: ...
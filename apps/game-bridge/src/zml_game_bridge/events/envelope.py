@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from zml_game_bridge.common.tracing import Trace
 
 
 @dataclass(frozen=True, slots=True)
@@ -8,3 +10,5 @@ class EventEnvelope:
     event_dt: str | None
     event_type: str
     payload_json: str
+    # Live envelopes only, while tracing is on; never persisted or serialized.
+    trace: Trace | None = field(default=None, compare=False, repr=False)
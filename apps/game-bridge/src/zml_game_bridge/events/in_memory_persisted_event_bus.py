@@ -1,9 +1,13 @@
 from threading import Lock
 
+from zml_game_bridge.common.metrics import REGISTRY
 from zml_game_bridge.events.bus import PersistedEventBus, EventHandler, Subscription
 from zml_game_bridge.events.envelope import EventEnvelope
 
 
+_HANDLER_ERRORS = REGISTRY.counter("zml_bus_handler_errors_total", "Bus handlers that raised")
+
+
 class InMemoryPersistedEventBus(PersistedEventBus):
     def __init__(self) -> None:
         self._handlers: dict[int, EventHandler] = {}
@@ -19,6 +23,7 @@ class InMemoryPersistedEventBus(PersistedEventBus):
                 handler(envelope)
             except Exception as e:
                 #TODO log error properly
+                _HANDLER_ERRORS.inc()
                 print(f"Error in event handler: {e}")
                 continue
 
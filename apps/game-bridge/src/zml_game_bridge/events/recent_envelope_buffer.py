@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+
+from zml_game_bridge.events.envelope import EventEnvelope
+
+
+@dataclass(frozen=True, slots=True)
+class RecentBufferStats:
+    capacity: int
+    size: int
+    first_event_id: int | None
+    last_event_id: int | None
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
+
+
+class RecentEnvelopeBuffer:
+    """
+    Bounded ring of the most recently persisted envelopes, ordered by event_id.
+
+    - on_envelope() is a PersistedEventBus handler (DbWriter thread)
+    - reads come from API worker threads
+    - a read is answered only when the ring provably holds the whole window;
+      otherwise it returns None and the caller falls back to SQLite
+
+    Must be subscribed before the DbWriter starts publishing, so the ring has
+    no holes between its first and last envelope.
+    """
+
+    def __init__(self, *, capacity: int = 10_000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._capacity = capacity
+        self._items: list[EventEnvelope | None] = [None] * capacity
+        self._start = 0  # physical index of the oldest envelope
+        self._count = 0
+
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def on_envelope(self, env: EventEnvelope) -> None:
+        with self._lock:
+            if self._count and env.event_id <= self._at(self._count - 1).event_id:
+                # Ids come from a single writer and only grow; ignore replays.
+                return
+            if self._count < self._capacity:
+                self._items[(self._start + self._count) % self._capacity] = env
+                self._count += 1
+            else:
+                self._items[self._start] = env
+                self._start = (self._start + 1) % self._capacity
+
+    def read_after(self, after_event_id: int, *, limit: int) -> list[EventEnvelope] | None:
+        """Envelopes with event_id > after_event_id (ascending), or None on a miss."""
+        with self._lock:
+            if self._count == 0 or after_event_id < self._at(0).event_id - 1:
+                self._misses += 1
+                return None
+            self._hits += 1
+            lo = self._first_index_after(after_event_id)
+            hi = min(self._count, lo + limit)
+            return [self._at(i) for i in range(lo, hi)]
+
+    def read_latest(self, *, limit: int) -> list[EventEnvelope] | None:
+        """Last `limit` envelopes (ascending), or None when the ring holds fewer than that."""
+        with self._lock:
+            if self._count < limit:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return [self._at(i) for i in range(self._count - limit, self._count)]
+
+    def stats(self) -> RecentBufferStats:
+        with self._lock:
+            return RecentBufferStats(
+                capacity=self._capacity,
+                size=self._count,
+                first_event_id=self._at(0).event_id if self._count else None,
+                last_event_id=self._at(self._count - 1).event_id if self._count else None,
+                hits=self._hits,
+                misses=self._misses,
+            )
+
+    def _at(self, i: int) -> EventEnvelope:
+        """Logical index (0 = oldest) -> envelope. Caller holds the lock."""
+        env = self._items[(self._start + i) % self._capacity]
+        assert env is not None
+        return env
+
+    def _first_index_after(self, after_event_id: int) -> int:
+        """Binary search: first logical index with event_id > after_event_id."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._at(mid).event_id <= after_event_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
@@ -4,6 +4,7 @@ import re
 from collections.abc import Callable
 from decimal import Decimal, InvalidOperation
 
+from zml_game_bridge.common.metrics import REGISTRY, Counter
 from zml_game_bridge.common.types import Mpec
 
 from .model import ChatLine, ChannelType
@@ -60,8 +61,10 @@ def _interpret_system(line: ChatLine) -> ChatEventBase | None:
         try:
             event_output = matcher(line)
         except Exception:
+            _MATCHER_ERRORS[matcher].inc()
             continue
         if event_output is not None:
+            _MATCHER_HITS[matcher].inc()
             return event_output
     return None
 
@@ -224,11 +227,30 @@ def _parse_ped_to_mpec(s: str) -> Mpec | None:
     return Mpec(int(mpec))
 
 
-_SYSTEM_MATCHERS: tuple[Callable[[ChatLine], ChatEventBase | None], ...] = (
+_Matcher = Callable[[ChatLine], ChatEventBase | None]
+
+_SYSTEM_MATCHERS: tuple[_Matcher, ...] = (
     _try_match_enhancer_broke,
     _try_match_item_received,
     _try_match_resource_claimed,
     _try_match_resource_depleted,
     _try_match_position_ping,
     _try_match_skill_gained,
-)
\ No newline at end of file
+)
+
+_MATCHER_HITS: dict[_Matcher, Counter] = {
+    m: REGISTRY.counter(
+        "zml_interpreter_matches_total",
+        "System lines turned into events, per matcher",
+        matcher=m.__name__.removeprefix("_try_match_"),
+    )
+    for m in _SYSTEM_MATCHERS
+}
+_MATCHER_ERRORS: dict[_Matcher, Counter] = {
+    m: REGISTRY.counter(
+        "zml_interpreter_errors_total",
+        "Matchers that raised (line skipped by that matcher)",
+        matcher=m.__name__.removeprefix("_try_match_"),
+    )
+    for m in _SYSTEM_MATCHERS
+}
\ No newline at end of file
@@ -1,11 +1,18 @@
 import threading
 from pathlib import Path
 
+from zml_game_bridge.common.metrics import REGISTRY
+from zml_game_bridge.common.tracing import TRACER
 from zml_game_bridge.events.contracts import EventSink
 from zml_game_bridge.inputs.chat.interpreter import interpret_chat_line
 from zml_game_bridge.inputs.chat.parser import parse_chat_line
 from zml_game_bridge.inputs.chat.tailer import tail_lines
 
+_HELP_LINES = "chat.log lines by outcome: unparsed, no_event (parsed, not interpreted), event"
+_UNPARSED = REGISTRY.counter("zml_chat_lines_total", _HELP_LINES, result="unparsed")
+_NO_EVENT = REGISTRY.counter("zml_chat_lines_total", _HELP_LINES, result="no_event")
+_EVENT = REGISTRY.counter("zml_chat_lines_total", _HELP_LINES, result="event")
+
 def start_chat_input(
     path: Path,
     event_sink: EventSink,
@@ -20,10 +27,20 @@ def start_chat_input(
     # 2026-01-12 15:18:40 [System] [] You have claimed a resource! (Zorn Star Ore)
     # 2026-01-12 15:18:40 [System] [] You have claimed a resource! (Blue Crystal)
     for line in tail_lines(path, start_at_end=start_at_end, poll_interval_s=poll_interval_s, stop_event=stop_event):
+        trace = TRACER.start()
         chat_line = parse_chat_line(line)
         if chat_line is None:
+            _UNPARSED.inc()
             continue
+        if trace is not None:
+            trace.mark("parse")
         chat_event = interpret_chat_line(chat_line)
         if chat_event is None:
+            _NO_EVENT.inc()
             continue
-        event_sink(chat_event)
+        _EVENT.inc()
+        if trace is None:
+            event_sink(chat_event)
+        else:
+            trace.mark("interpret")
+            event_sink(chat_event, trace)
@@ -5,6 +5,14 @@ import time
 from collections.abc import Iterator
 from pathlib import Path
 
+from zml_game_bridge.common.heartbeat import heartbeat
+from zml_game_bridge.common.metrics import REGISTRY
+
+_LINES = REGISTRY.counter("zml_tailer_lines_total", "Lines read from chat.log")
+_BYTES = REGISTRY.counter("zml_tailer_bytes_total", "Bytes read from chat.log")
+# Beaten on every poll and every line, so a consumer blocked downstream shows up as a stall.
+_HEARTBEAT = heartbeat("chat")
+
 # TODO: read in fixed-size chunks (avoid unbounded read())
 # TODO: guard buffer growth if no newline appears
 
@@ -28,6 +36,7 @@ def tail_lines(
     should_skip_existing_once = start_at_end and path.exists()
 
     while not stop_event.is_set():
+        _HEARTBEAT.beat()
         if not path.exists():
             time.sleep(poll_interval_s)
             continue
@@ -42,6 +51,7 @@ def tail_lines(
                     f.seek(offset, 0)
 
                 while not stop_event.is_set():
+                    _HEARTBEAT.beat()
                     chunk = f.read()
                     if not chunk:
                         # Optional: truncation detection
@@ -59,7 +69,9 @@ def tail_lines(
                         continue
 
                     buf += chunk
-                    offset = f.tell()
+                    pos = f.tell()
+                    _BYTES.inc(pos - offset)
+                    offset = pos
 
                     while True:
                         nl = buf.find("\n")
@@ -70,6 +82,8 @@ def tail_lines(
 
                         if line.endswith("\r"):
                             line = line[:-1]
+                        _LINES.inc()
+                        _HEARTBEAT.beat()
                         yield line
 
         except OSError:
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Protocol
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect
+
+
+class FrameSourceExhausted(Exception):
+    """Raised by grab() when a finite source (e.g. a non-looping replay) has no more frames."""
+
+
+class FrameSource(Protocol):
+    """Where the OCR loop gets frames from (live window, recorded frames, ...)."""
+
+    def grab(self) -> np.ndarray:
+        """Return the next frame as uint8 HxWx3 (BGR) or HxWx4 (BGRA)."""
+        ...
+
+    def grab_rois(self, rois: Sequence[RoiRect]) -> list[np.ndarray | None]:
+        """
+        Capture the next frame but deliver only the requested regions, as contiguous uint8
+        grayscale (None for a roi outside the frame). Cheaper than grab() + crop.
+        """
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+# Sources are created on the OCR thread (GDI handles must live on the thread that uses them).
+FrameSourceFactory = Callable[[], FrameSource]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Optional
 
+import cv2
 import numpy as np
 
 
@@ -13,21 +14,90 @@ class RoiRect:
     y1: int
     y2: int
 
-    def crop(self, frame: np.ndarray) -> Optional[np.ndarray]:
-        h: int = int(frame.shape[0])
-        w: int = int(frame.shape[1])
-
+    def clamp(self, w: int, h: int) -> RoiRect | None:
+        """Clip to a w x h frame; None if nothing is left."""
         x1 = max(0, min(self.x1, w))
         x2 = max(0, min(self.x2, w))
         y1 = max(0, min(self.y1, h))
         y2 = max(0, min(self.y2, h))
         if x2 <= x1 or y2 <= y1:
             return None
+        return RoiRect(x1=x1, x2=x2, y1=y1, y2=y2)
+
+    def offset(self, dx: int, dy: int) -> RoiRect:
+        return RoiRect(x1=self.x1 + dx, x2=self.x2 + dx, y1=self.y1 + dy, y2=self.y2 + dy)
+
+    def view(self, frame: np.ndarray) -> np.ndarray | None:
+        """Zero-copy slice of the frame (may be non-contiguous)."""
+        r = self.clamp(int(frame.shape[1]), int(frame.shape[0]))
+        if r is None:
+            return None
+        return frame[r.y1:r.y2, r.x1:r.x2]
 
-        roi = frame[y1:y2, x1:x2]
+    def crop(self, frame: np.ndarray) -> np.ndarray | None:
+        roi = self.view(frame)
+        if roi is None:
+            return None
         roi = np.ascontiguousarray(roi)
 
         if roi.dtype != np.uint8:
             raise ValueError(f"Unsupported ROI dtype: {roi.dtype}")
 
         return roi
+
+
+def union_rect(rois: Sequence[RoiRect]) -> RoiRect:
+    """Smallest rect covering all rois."""
+    if not rois:
+        raise ValueError("union_rect() needs at least one roi")
+    return RoiRect(
+        x1=min(r.x1 for r in rois),
+        x2=max(r.x2 for r in rois),
+        y1=min(r.y1 for r in rois),
+        y2=max(r.y2 for r in rois),
+    )
+
+
+def group_rois(rois: Sequence[RoiRect], *, max_gap: int = 64) -> list[list[int]]:
+    """
+    Indices of rois grouped so each group's union is worth one capture: rois that overlap or
+    sit within max_gap px of each other (on both axes) share a group, far-apart ones
+    (compass bottom-right, panels top-left) do not. Groups are in first-index order.
+    """
+    groups: list[tuple[RoiRect, list[int]]] = [(r, [i]) for i, r in enumerate(rois)]
+    merged = True
+    while merged:
+        merged = False
+        for a in range(len(groups)):
+            for b in range(a + 1, len(groups)):
+                ra, rb = groups[a][0], groups[b][0]
+                gap_x = max(ra.x1, rb.x1) - min(ra.x2, rb.x2)
+                gap_y = max(ra.y1, rb.y1) - min(ra.y2, rb.y2)
+                if gap_x <= max_gap and gap_y <= max_gap:
+                    groups[a] = (union_rect((ra, rb)), groups[a][1] + groups[b][1])
+                    del groups[b]
+                    merged = True
+                    break
+            if merged:
+                break
+    return [sorted(idx) for _, idx in groups]
+
+
+def crop_gray(frame: np.ndarray, roi: RoiRect) -> np.ndarray | None:
+    """
+    ROI of a BGR/BGRA/gray frame as contiguous uint8 grayscale.
+    The color conversion reads straight from the (strided) view, so the ROI is copied
+    exactly once, already as gray.
+    """
+    view = roi.view(frame)
+    if view is None:
+        return None
+    if view.dtype != np.uint8:
+        raise ValueError(f"Unsupported ROI dtype: {view.dtype}")
+    if view.ndim == 2:
+        return np.ascontiguousarray(view)
+    if view.shape[2] == 4:
+        return cv2.cvtColor(view, cv2.COLOR_BGRA2GRAY)
+    if view.shape[2] == 3:
+        return cv2.cvtColor(view, cv2.COLOR_BGR2GRAY)
+    raise ValueError(f"Unsupported ROI shape: {view.shape}")
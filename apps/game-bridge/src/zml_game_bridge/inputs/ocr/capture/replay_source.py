@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.capture.frame_source import FrameSourceExhausted
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect, crop_gray
+
+
+class _Pacer:
+    """Hands out frames no faster than rate_hz (None = as fast as grab() is called)."""
+
+    def __init__(self, rate_hz: float | None) -> None:
+        self._period = (1.0 / rate_hz) if rate_hz else 0.0
+        self._next_t = time.perf_counter()
+
+    def wait(self) -> None:
+        if not self._period:
+            return
+        now = time.perf_counter()
+        if self._next_t > now:
+            time.sleep(self._next_t - now)
+        else:
+            self._next_t = now
+        self._next_t += self._period
+
+
+class DirectoryReplaySource:
+    """
+    Replays recorded frames (png/jpg/bmp) from a directory in filename order.
+    Frames are decoded up front by default so decode cost does not show up in OCR timings.
+    """
+
+    _SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".bmp"})
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        rate_hz: float | None = None,
+        loop: bool = True,
+        preload: bool = True,
+    ) -> None:
+        self._paths = sorted(
+            p for p in directory.iterdir() if p.is_file() and p.suffix.lower() in self._SUFFIXES
+        )
+        if not self._paths:
+            raise FileNotFoundError(f"No frames found in: {directory}")
+        self._loop = loop
+        self._pacer = _Pacer(rate_hz)
+        self._frames: list[np.ndarray] | None = (
+            [self._decode(p) for p in self._paths] if preload else None
+        )
+        self._i = 0
+
+    def grab(self) -> np.ndarray:
+        if self._i >= len(self._paths):
+            if not self._loop:
+                raise FrameSourceExhausted()
+            self._i = 0
+        self._pacer.wait()
+
+        i = self._i
+        self._i += 1
+        if self._frames is not None:
+            return self._frames[i]
+        return self._decode(self._paths[i])
+
+    def grab_rois(self, rois: Sequence[RoiRect]) -> list[np.ndarray | None]:
+        frame = self.grab()
+        return [crop_gray(frame, r) for r in rois]
+
+    def close(self) -> None:
+        self._frames = None
+
+    @staticmethod
+    def _decode(path: Path) -> np.ndarray:
+        img = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if img is None:
+            raise FileNotFoundError(f"Failed to read frame: {path}")
+        return img
+
+
+class RawVideoReplaySource:
+    """
+    Replays a headerless raw video file (frames of height x width x channels uint8,
+    e.g. `ffmpeg ... -pix_fmt bgra -f rawvideo out.raw`) through np.memmap.
+    grab() returns read-only views into the mapping; no per-frame copy.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        width: int,
+        height: int,
+        channels: int = 4,
+        rate_hz: float | None = None,
+        loop: bool = True,
+    ) -> None:
+        if channels not in (3, 4):
+            raise ValueError(f"Unsupported channel count: {channels}")
+        frame_bytes = width * height * channels
+        size = path.stat().st_size
+        n_frames = size // frame_bytes
+        if n_frames == 0:
+            raise ValueError(f"File smaller than one {width}x{height}x{channels} frame: {path}")
+
+        self._mm: np.memmap | None = np.memmap(
+            path, dtype=np.uint8, mode="r", shape=(n_frames, height, width, channels)
+        )
+        self._n_frames = n_frames
+        self._loop = loop
+        self._pacer = _Pacer(rate_hz)
+        self._i = 0
+
+    def grab(self) -> np.ndarray:
+        mm = self._mm
+        if mm is None:
+            raise RuntimeError("RawVideoReplaySource is closed")
+        if self._i >= self._n_frames:
+            if not self._loop:
+                raise FrameSourceExhausted()
+            self._i = 0
+        self._pacer.wait()
+
+        frame = mm[self._i]
+        self._i += 1
+        return frame
+
+    def grab_rois(self, rois: Sequence[RoiRect]) -> list[np.ndarray | None]:
+        # grab() is a view into the mapping: only ROI pages are touched, converted once to gray.
+        frame = self.grab()
+        return [crop_gray(frame, r) for r in rois]
+
+    def close(self) -> None:
+        self._mm = None
+
+
+def open_replay_source(
+    path: Path,
+    *,
+    rate_hz: float | None = None,
+    width: int = 2560,
+    height: int = 1440,
+    channels: int = 4,
+) -> DirectoryReplaySource | RawVideoReplaySource:
+    """Directory -> DirectoryReplaySource; file -> RawVideoReplaySource of width x height x channels."""
+    if path.is_dir():
+        return DirectoryReplaySource(path, rate_hz=rate_hz)
+    return RawVideoReplaySource(path, width=width, height=height, channels=channels, rate_hz=rate_hz)
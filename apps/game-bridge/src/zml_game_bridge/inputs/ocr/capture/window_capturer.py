@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Optional, Tuple, cast
 
@@ -8,9 +9,22 @@ import win32gui
 import win32ui
 from ctypes import windll
 
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect, crop_gray, group_rois, union_rect
+
 
 PW_CLIENTONLY = 0x00000001
 PW_RENDERFULLCONTENT = 0x00000002
+SRCCOPY = 0x00CC0020
+
+_dpi_aware = False
+
+
+def _ensure_dpi_aware() -> None:
+    """Once per process: otherwise client sizes/coords are scaled on high-DPI displays."""
+    global _dpi_aware
+    if not _dpi_aware:
+        windll.user32.SetProcessDPIAware()
+        _dpi_aware = True
 
 
 def _find_window_by_title_contains(title_substr: str) -> int:
@@ -40,14 +54,26 @@ class _GdiState:
     bitmap: Any
 
 
+@dataclass
+class _RegionState:
+    """Small DC/bitmap sized to the union of requested ROIs (client coords)."""
+    rect: RoiRect
+    dc: Any
+    bitmap: Any
+
+
 class WindowCapturer:
     def __init__(self, *, title_contains: str, flags: int = PW_CLIENTONLY | PW_RENDERFULLCONTENT) -> None:
+        _ensure_dpi_aware()
         self._title_contains = title_contains
         self._flags = flags
         self._state: Optional[_GdiState] = None
+        # One small bitmap per capture group; the ROI set is fixed, so this stays a handful.
+        self._regions: dict[RoiRect, _RegionState] = {}
         self._ensure_open()
 
     def close(self) -> None:
+        self._close_regions()
         st = self._state
         if st is None:
             return
@@ -58,6 +84,63 @@ class WindowCapturer:
         self._state = None
 
     def grab(self) -> np.ndarray:
+        st = self._render()
+
+        bmpinfo = cast(dict, st.bitmap.GetInfo())
+        bmpstr = cast(bytes, st.bitmap.GetBitmapBits(True))
+
+        height = int(bmpinfo.get("bmHeight", 0))
+        width = int(bmpinfo.get("bmWidth", 0))
+
+        if width <= 0 or height <= 0:
+            raise RuntimeError("Window has non-positive client size.")
+
+        expected = width * height * 4
+        if len(bmpstr) < expected:
+            raise RuntimeError(f"Bitmap has non-positive size.: {len(bmpstr)} < {expected}")
+
+        img = np.frombuffer(bmpstr, dtype=np.uint8).reshape((height, width, 4))
+        # PrintWindow returns BGRA; drop alpha.
+        return np.ascontiguousarray(img[:, :, :3])
+
+    def grab_rois(self, rois: Sequence[RoiRect]) -> list[np.ndarray | None]:
+        """
+        Only the requested pixels leave GDI: ROIs close together are BitBlt'ed as one union
+        into a small bitmap, far-apart ones (compass vs. top-left panels) each get their own,
+        so a panel tick never pulls the whole window. Each ROI is converted BGRA->gray
+        straight from a view of its group's bytes.
+        """
+        st = self._render()
+
+        out: list[np.ndarray | None] = [None] * len(rois)
+        present: list[tuple[int, RoiRect]] = []
+        for i, r in enumerate(rois):
+            c = r.clamp(st.w, st.h)
+            if c is not None:
+                present.append((i, c))
+
+        for group in group_rois([r for _, r in present]):
+            members = [present[g] for g in group]
+            union = union_rect([r for _, r in members])
+            img = self._blit(st, union)
+            for i, r in members:
+                out[i] = crop_gray(img, r.offset(-union.x1, -union.y1))
+        return out
+
+    def _blit(self, st: _GdiState, rect: RoiRect) -> np.ndarray:
+        """BGRA view of `rect` of the rendered window (valid until the next blit of the same rect)."""
+        region = self._ensure_region(st, rect)
+        uw, uh = rect.x2 - rect.x1, rect.y2 - rect.y1
+        region.dc.BitBlt((0, 0), (uw, uh), st.save_dc, (rect.x1, rect.y1), SRCCOPY)
+
+        bmpstr = cast(bytes, region.bitmap.GetBitmapBits(True))
+        expected = uw * uh * 4
+        if len(bmpstr) < expected:
+            raise RuntimeError(f"Region bitmap too small: {len(bmpstr)} < {expected}")
+        return np.frombuffer(bmpstr, dtype=np.uint8).reshape((uh, uw, 4))
+
+    def _render(self) -> _GdiState:
+        """PrintWindow the client area into the window-sized memory DC."""
         self._ensure_open()
 
         st = self._state
@@ -79,22 +162,27 @@ class WindowCapturer:
             if ok2 != 1:
                 raise RuntimeError(f"PrintWindow failed: {ok} / fallback {ok2}")
 
-        bmpinfo = cast(dict, st.bitmap.GetInfo())
-        bmpstr = cast(bytes, st.bitmap.GetBitmapBits(True))
+        return st
 
-        height = int(bmpinfo.get("bmHeight", 0))
-        width = int(bmpinfo.get("bmWidth", 0))
+    def _ensure_region(self, st: _GdiState, rect: RoiRect) -> _RegionState:
+        region = self._regions.get(rect)
+        if region is not None:
+            return region
 
-        if width <= 0 or height <= 0:
-            raise RuntimeError("Window has non-positive client size.")
+        w, h = rect.x2 - rect.x1, rect.y2 - rect.y1
+        dc: Any = st.mfc_dc.CreateCompatibleDC()
+        bitmap: Any = win32ui.CreateBitmap()
+        bitmap.CreateCompatibleBitmap(st.mfc_dc, w, h)
+        dc.SelectObject(bitmap)
 
-        expected = width * height * 4
-        if len(bmpstr) < expected:
-            raise RuntimeError(f"Bitmap has non-positive size.: {len(bmpstr)} < {expected}")
+        region = self._regions[rect] = _RegionState(rect=rect, dc=dc, bitmap=bitmap)
+        return region
 
-        img = np.frombuffer(bmpstr, dtype=np.uint8).reshape((height, width, 4))
-        # PrintWindow returns BGRA; drop alpha.
-        return np.ascontiguousarray(img[:, :, :3])
+    def _close_regions(self) -> None:
+        for region in self._regions.values():
+            win32gui.DeleteObject(cast(int, region.bitmap.GetHandle()))
+            region.dc.DeleteDC()
+        self._regions.clear()
 
     def _ensure_open(self) -> None:
         if self._state is not None:
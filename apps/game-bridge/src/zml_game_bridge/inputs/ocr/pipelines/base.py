@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Protocol
+
+import numpy as np
+
+
+class RoiPipeline(Protocol):
+    """An OCR pipeline fed one captured ROI at a time; results go to its own sink."""
+
+    def step(self, roi: np.ndarray, ts_ms: int) -> None: ...
+
+    def close(self) -> None: ...
+
+
+# Called on the pipeline's own worker thread: engines inside (Tesseract) stay on the thread that uses them.
+RoiPipelineFactory = Callable[[], RoiPipeline]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeGateConfig:
+    # Fingerprint = ROI area-downsampled by this factor (absorbs sub-pixel shimmer).
+    downscale: int = 2
+    # Mean absolute difference (gray levels, 0..255) above which the ROI counts as changed.
+    mad_threshold: float = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeGateStats:
+    checks: int
+    skips: int
+
+    @property
+    def skip_rate(self) -> float:
+        return (self.skips / self.checks) if self.checks else 0.0
+
+
+class RoiChangeGate:
+    """
+    Cheap "did these pixels change?" check in front of OCR.
+
+    The reference fingerprint is the one from the last time the gate said "changed"
+    (i.e. the last time OCR ran), so slow drift still adds up to a change.
+    One gate per ROI; not thread-safe.
+    """
+
+    def __init__(self, cfg: ChangeGateConfig | None = None) -> None:
+        self.cfg = cfg or ChangeGateConfig()
+        self._ref: np.ndarray | None = None
+        self._checks = 0
+        self._skips = 0
+
+    def changed(self, img: np.ndarray) -> bool:
+        self._checks += 1
+        fp = self._fingerprint(img)
+        ref = self._ref
+        if ref is None or ref.shape != fp.shape:
+            self._ref = fp
+            return True
+
+        mad = cv2.norm(fp, ref, cv2.NORM_L1) / float(fp.size)
+        if mad > self.cfg.mad_threshold:
+            self._ref = fp
+            return True
+
+        self._skips += 1
+        return False
+
+    def reset(self) -> None:
+        """Forget the reference: the next check reports a change."""
+        self._ref = None
+
+    def stats(self) -> ChangeGateStats:
+        return ChangeGateStats(checks=self._checks, skips=self._skips)
+
+    def _fingerprint(self, img: np.ndarray) -> np.ndarray:
+        if img.ndim == 3:
+            img = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+        ds = self.cfg.downscale
+        if ds <= 1:
+            return img.copy()
+        h, w = img.shape[:2]
+        return cv2.resize(img, (max(1, w // ds), max(1, h // ds)), interpolation=cv2.INTER_AREA)
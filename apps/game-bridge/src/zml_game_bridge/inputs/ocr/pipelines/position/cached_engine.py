@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.engine import DigitsEngine
+
+
+@dataclass(frozen=True, slots=True)
+class EngineCacheStats:
+    capacity: int
+    size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits / total) if total else 0.0
+
+
+class CachedDigitsEngine:
+    """
+    LRU memo in front of a DigitsEngine, keyed by a hash of the binarized line.
+
+    After preprocessing the HUD digits are binary, so the same number tends to
+    produce byte-identical images; only novel images reach the inner engine.
+    The key covers shape + pixels, so equal keys mean equal engine input.
+    """
+
+    def __init__(self, inner: DigitsEngine, *, max_entries: int = 4096) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        self._inner = inner
+        self._max_entries = max_entries
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def recognize_digits(self, img_u8: np.ndarray) -> str:
+        key = self._key(img_u8)
+        with self._lock:
+            text = self._cache.get(key)
+            if text is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return text
+            self._misses += 1
+
+        # Inner engine runs outside the lock (it may be slow, or shared by a pool).
+        text = self._inner.recognize_digits(img_u8)
+        self._store([(key, text)])
+        return text
+
+    def recognize_many(self, imgs: Sequence[np.ndarray]) -> list[str]:
+        keys = [self._key(img) for img in imgs]
+        out: list[str | None] = [None] * len(keys)
+        with self._lock:
+            for i, key in enumerate(keys):
+                text = self._cache.get(key)
+                if text is not None:
+                    self._cache.move_to_end(key)
+                    out[i] = text
+            hits = sum(1 for t in out if t is not None)
+            self._hits += hits
+            self._misses += len(keys) - hits
+
+        # Only the novel lines go to the inner engine, still as one batch.
+        todo = [i for i, t in enumerate(out) if t is None]
+        if todo:
+            texts = self._inner.recognize_many([imgs[i] for i in todo])
+            for i, text in zip(todo, texts, strict=True):
+                out[i] = text
+            self._store([(keys[i], out[i] or "") for i in todo])
+        return [t or "" for t in out]
+
+    def _store(self, items: list[tuple[bytes, str]]) -> None:
+        with self._lock:
+            for key, text in items:
+                self._cache[key] = text
+                self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+    def stats(self) -> EngineCacheStats:
+        with self._lock:
+            return EngineCacheStats(
+                capacity=self._max_entries,
+                size=len(self._cache),
+                hits=self._hits,
+                misses=self._misses,
+            )
+
+    def close(self) -> None:
+        self._inner.close()
+
+    @staticmethod
+    def _key(img_u8: np.ndarray) -> bytes:
+        img = np.ascontiguousarray(img_u8)
+        h = hashlib.blake2b(digest_size=16)
+        h.update(np.asarray(img.shape, dtype=np.int32).tobytes())
+        h.update(img.data)
+        return h.digest()
@@ -1,20 +1,83 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Protocol, cast
 
 import numpy as np
 
 import zml_game_bridge
 
 
+class DigitsEngine(Protocol):
+    """Binary line image in, raw digit text out (callers filter to [0-9])."""
+
+    def recognize_digits(self, img_u8: np.ndarray) -> str: ...
+
+    def recognize_many(self, imgs: Sequence[np.ndarray]) -> list[str]:
+        """Several lines at once (same order). Pooled engines run them concurrently."""
+        ...
+
+    def close(self) -> None: ...
+
+
+# (text, (x1, y1, x2, y2)) of one line Tesseract found on a stacked canvas.
+FoundLine = tuple[str, tuple[int, int, int, int]]
+
+
+def stack_lines(
+    imgs: Sequence[np.ndarray],
+    *,
+    min_gap: int = 16,
+    fill: int = 255,
+) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    """
+    Line crops left-aligned on one white canvas, separated (and framed) by at
+    least min_gap px of background, or half the tallest line. Returns the canvas
+    and each line's (y0, y1) rows on it.
+    """
+    gap = max(min_gap, max(img.shape[0] for img in imgs) // 2)
+    width = max(img.shape[1] for img in imgs) + 2 * gap
+    height = sum(img.shape[0] for img in imgs) + gap * (len(imgs) + 1)
+
+    canvas = np.full((height, width), fill, dtype=np.uint8)
+    spans: list[tuple[int, int]] = []
+    y = gap
+    for img in imgs:
+        h, w = img.shape
+        canvas[y : y + h, gap : gap + w] = img
+        spans.append((y, y + h))
+        y += h + gap
+    return canvas, spans
+
+
+def split_textlines(found: Sequence[FoundLine], spans: Sequence[tuple[int, int]]) -> list[str]:
+    """
+    Text per input line: each found line goes to the span holding its vertical
+    centre (nearest span if it sits in a gap); several in one span are joined
+    left to right. Spans nothing landed in read as "".
+    """
+    parts: list[list[tuple[int, str]]] = [[] for _ in spans]
+    for text, (x1, y1, _x2, y2) in found:
+        cy = (y1 + y2) / 2.0
+        row = min(
+            range(len(spans)),
+            key=lambda i: 0.0 if spans[i][0] <= cy < spans[i][1] else min(abs(cy - spans[i][0]), abs(cy - spans[i][1])),
+        )
+        parts[row].append((x1, text.strip()))
+    return ["".join(t for _, t in sorted(p)) for p in parts]
+
+
 class TesserDigitsEngine:
-    def __init__(self, *, tessdata_dir: str | None = None) -> None:
+    def __init__(self, *, tessdata_dir: str | None = None, batch: bool = False) -> None:
+        """batch=True: recognize_many() reads all lines in one pass (recognize_batch)."""
         try:
             import tesserocr  # type: ignore
         except Exception as e:
             raise RuntimeError(f"tesserocr import failed: {e}") from e
 
         self._tesserocr = tesserocr
+        self._batch = batch
 
         if tessdata_dir is None:
             tessdata_dir = str(Path(zml_game_bridge.__file__).resolve().parent.parent.parent / "resources" / "tessdata/")
@@ -53,5 +116,44 @@ class TesserDigitsEngine:
         self._api.SetImageBytes(img.tobytes(), w, h, 1, w)
         return self._api.GetUTF8Text() or ""
 
+    def recognize_many(self, imgs: Sequence[np.ndarray]) -> list[str]:
+        if self._batch:
+            return self.recognize_batch(imgs)
+        # One PyTessBaseAPI is not re-entrant; EnginePool gives concurrency.
+        return [self.recognize_digits(img) for img in imgs]
+
+    def recognize_batch(self, imgs: Sequence[np.ndarray]) -> list[str]:
+        """
+        Several lines in one SetImageBytes + Recognize: the crops are stacked on
+        one canvas (stack_lines), read as a block, and the TEXTLINE results are
+        mapped back to the input rows by their bounding boxes.
+        """
+        if len(imgs) <= 1:
+            return [self.recognize_digits(img) for img in imgs]
+        for img in imgs:
+            if img.ndim != 2 or img.dtype != np.uint8:
+                raise ValueError(f"Expected grayscale/binary uint8 2D image, got {img.dtype} shape={img.shape}")
+
+        canvas, spans = stack_lines(imgs)
+        h, w = canvas.shape
+        tess = self._tesserocr
+        level = tess.RIL.TEXTLINE
+        found: list[FoundLine] = []
+
+        self._api.SetPageSegMode(tess.PSM.SINGLE_BLOCK)
+        try:
+            self._api.SetImageBytes(canvas.tobytes(), w, h, 1, w)
+            self._api.Recognize()
+            it = self._api.GetIterator()
+            if it is not None:
+                for r in tess.iterate_level(it, level):
+                    box = cast(tuple[int, int, int, int] | None, r.BoundingBox(level))
+                    if box is not None:
+                        found.append((cast(str, r.GetUTF8Text(level) or ""), box))
+        finally:
+            self._api.SetPageSegMode(tess.PSM.SINGLE_LINE)
+
+        return split_textlines(found, spans)
+
     def close(self) -> None:
         self._api.End()
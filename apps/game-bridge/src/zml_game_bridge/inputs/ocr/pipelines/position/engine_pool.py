@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.engine import DigitsEngine
+
+DigitsEngineFactory = Callable[[], DigitsEngine]
+
+
+class EnginePool:
+    """
+    N digit engines, each created on and owned by one worker thread.
+
+    Tesseract releases the GIL while recognizing, so lon/lat (and later other
+    ROIs) submitted together via recognize_many() run in parallel: per-frame
+    latency ~ max() of the lines instead of sum(). Itself a DigitsEngine.
+    """
+
+    def __init__(self, factory: DigitsEngineFactory, *, size: int = 2) -> None:
+        if size <= 0:
+            raise ValueError("size must be > 0")
+        self._factory = factory
+        self._local = threading.local()
+        self._engines: list[DigitsEngine] = []
+        self._engines_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=size,
+            thread_name_prefix="ocr-engine",
+            initializer=self._init_worker,
+        )
+
+    def recognize_digits(self, img_u8: np.ndarray) -> str:
+        return self._executor.submit(self._recognize, img_u8).result()
+
+    def recognize_many(self, imgs: Sequence[np.ndarray]) -> list[str]:
+        futures = [self._executor.submit(self._recognize, img) for img in imgs]
+        return [f.result() for f in futures]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._engines_lock:
+            engines, self._engines = self._engines, []
+        for engine in engines:
+            try:
+                engine.close()
+            except Exception as e:
+                print(f"[EnginePool] close failed: {e!r}")
+
+    def _init_worker(self) -> None:
+        engine = self._factory()
+        self._local.engine = engine
+        with self._engines_lock:
+            self._engines.append(engine)
+
+    def _recognize(self, img_u8: np.ndarray) -> str:
+        engine: DigitsEngine = self._local.engine
+        return engine.recognize_digits(img_u8)
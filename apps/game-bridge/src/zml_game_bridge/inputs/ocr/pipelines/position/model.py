@@ -8,6 +8,7 @@ from zml_game_bridge.inputs.ocr.capture.model import RoiRect
 class OcrPosition:
     ts_ms: int
     position: WorldPos
+    confidence: float = 1.0  # 0..1, from PositionTracker (1.0 when untracked)
 
 @dataclass(frozen=True, slots=True)
 class PositionRois:
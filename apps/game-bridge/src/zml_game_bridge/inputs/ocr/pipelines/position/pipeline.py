@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 
 import numpy as np
 
+from zml_game_bridge.common.metrics import REGISTRY
 from zml_game_bridge.common.models import WorldPos
-from zml_game_bridge.inputs.ocr.pipelines.position.engine import TesserDigitsEngine
+from zml_game_bridge.inputs.ocr.pipelines.change_gate import (
+    ChangeGateConfig,
+    ChangeGateStats,
+    RoiChangeGate,
+)
+from zml_game_bridge.inputs.ocr.pipelines.position.engine import DigitsEngine, TesserDigitsEngine
 from zml_game_bridge.inputs.ocr.pipelines.position.model import PositionRois, OcrPosition
+from zml_game_bridge.inputs.ocr.pipelines.position.planet import PlanetRecognizer
+from zml_game_bridge.inputs.ocr.pipelines.position.tracker import PositionTracker
 from zml_game_bridge.inputs.ocr.pipelines.position.preprocess import (
     DigitsPreprocessConfig,
     DigitsPreprocessor
 )
 
+_HELP_STAGE = "Position OCR time per stage (one observation per frame that reached the stage)"
+_STAGE_PLANET = REGISTRY.histogram("zml_ocr_stage_seconds", _HELP_STAGE, stage="planet")
+_STAGE_PREPROCESS = REGISTRY.histogram("zml_ocr_stage_seconds", _HELP_STAGE, stage="preprocess")
+_STAGE_QUICK = REGISTRY.histogram("zml_ocr_stage_seconds", _HELP_STAGE, stage="quick")
+_STAGE_ENGINE = REGISTRY.histogram("zml_ocr_stage_seconds", _HELP_STAGE, stage="engine")
+
 
 @dataclass(frozen=True, slots=True)
 class PositionPipelineConfig:
@@ -24,20 +39,47 @@ class PositionPipeline:
         self,
         rois: PositionRois,
         *,
-        engine: TesserDigitsEngine | None = None,
+        engine: DigitsEngine | None = None,
         pre_cfg: DigitsPreprocessConfig | None = None,
         cfg: PositionPipelineConfig | None = None,
+        gate_cfg: ChangeGateConfig | None = None,
+        planet: PlanetRecognizer | None = None,
+        tracker: PositionTracker | None = None,
+        quick_engine: DigitsEngine | None = None,
     ) -> None:
         self._rois = rois
-        self._engine = engine or TesserDigitsEngine()
+        self._engine: DigitsEngine = engine or TesserDigitsEngine()
         self._pre_cfg = pre_cfg or DigitsPreprocessConfig()
         self._pre = DigitsPreprocessor(pre_cfg)
         self._cfg = cfg or PositionPipelineConfig()
 
-        self._last_emitted: tuple[int, int] | None = None
+        # OCR runs for a coordinate only when its pixels changed; otherwise the last read stands.
+        self._lon_gate = RoiChangeGate(gate_cfg)
+        self._lat_gate = RoiChangeGate(gate_cfg)
+        self._last_lon: int | None = None
+        self._last_lat: int | None = None
+
+        self._planet = planet
+        self._planet_name = ""
+
+        # Plausibility filter; with quick_engine (e.g. TemplateDigitsEngine) a cheap read that
+        # lands within the tracker's gate around the prediction is taken without the full engine.
+        self._tracker = tracker
+        self._quick_engine = quick_engine
+        self.quick_reads = 0
+        self.full_reads = 0
+
+        self._last_emitted: tuple[str, int, int] | None = None
 
     def close(self) -> None:
         self._engine.close()
+        if self._planet is not None:
+            self._planet.close()
+        if self._quick_engine is not None:
+            self._quick_engine.close()
+
+    def gate_stats(self) -> dict[str, ChangeGateStats]:
+        return {"lon": self._lon_gate.stats(), "lat": self._lat_gate.stats()}
 
     def step(self, compass_roi: np.ndarray, ts_ms: int) -> OcrPosition | None:
         lon_img = self._rois.lon.crop(compass_roi)
@@ -45,31 +87,114 @@ class PositionPipeline:
 
         if lon_img is None or lat_img is None:
             return None
-        lon = self._read_int(lon_img)
-        lat = self._read_int(lat_img)
-        # TODO range check lat/lon?
+
+        t0 = time.perf_counter()
+        planet_changed = self._read_planet(compass_roi)
+        _STAGE_PLANET.observe(time.perf_counter() - t0)
+        lon_changed = self._lon_gate.changed(lon_img)
+        lat_changed = self._lat_gate.changed(lat_img)
+        if not lon_changed and not lat_changed and not planet_changed:
+            # Same pixels as the last OCR: same reading, nothing new to emit.
+            return None
+
+        if planet_changed and self._tracker is not None:
+            self._tracker.reset()  # another planet, another coordinate space
+
+        # Changed lines go to the engine together (a pooled engine reads them in parallel).
+        lines = [(axis, img) for axis, img, changed in ((0, lon_img, lon_changed), (1, lat_img, lat_changed)) if changed]
+        for (axis, _), val in zip(lines, self._read_axes(lines, ts_ms), strict=True):
+            if axis == 0:
+                self._last_lon = val
+            else:
+                self._last_lat = val
+            if val is None:
+                # The gate already took these pixels as its reference: without a reset a failed
+                # read would stick until the digits change (forever for a standing player).
+                (self._lon_gate if axis == 0 else self._lat_gate).reset()
+        lon = self._last_lon
+        lat = self._last_lat
 
         if lon is None or lat is None:
             return None
-        if (lon, lat) == self._last_emitted:
+
+        confidence = 1.0
+        if self._tracker is not None:
+            conf = self._tracker.update(lon, lat, ts_ms)
+            if conf is None:
+                # Implausible jump: re-read both lines next frame, even if the pixels hold still,
+                # so a real teleport is re-acquired instead of waiting for movement.
+                self._lon_gate.reset()
+                self._lat_gate.reset()
+                return None
+            confidence = conf
+
+        key = (self._planet_name, lon, lat)
+        if key == self._last_emitted:
             return None
 
-        self._last_emitted = (lon, lat)
+        self._last_emitted = key
 
         return OcrPosition(
             ts_ms=ts_ms,
             position=WorldPos(
-                planet_name="",  # fill later when planet OCR returns
+                planet_name=self._planet_name,  # "" until the planet is recognized
                 x=lon,
                 y=lat,
                 z=None,
             ),
+            confidence=confidence,
         )
 
-    def _read_int(self, img: np.ndarray) -> int | None:
-        pre = self._pre.process(img)
-        raw = self._engine.recognize_digits(pre)
-
+    def _read_planet(self, compass_roi: np.ndarray) -> bool:
+        """Refresh the cached planet name (cheap unless the header changed); True if it changed."""
+        if self._planet is None:
+            return False
+        planet_img = self._rois.planet.crop(compass_roi)
+        if planet_img is None:
+            return False
+        name = self._planet.read(planet_img) or ""
+        if name == self._planet_name:
+            return False
+        self._planet_name = name
+        return True
+
+    def _read_axes(self, lines: list[tuple[int, np.ndarray]], ts_ms: int) -> list[int | None]:
+        """Values for (axis, line image) pairs; axis 0 = lon/x, 1 = lat/y."""
+        if not lines:
+            return []
+        # One slot per line: all preprocessed lines must be alive for the batch.
+        t0 = time.perf_counter()
+        pres = [self._pre.process(img, slot=i) for i, (_, img) in enumerate(lines)]
+        t1 = time.perf_counter()
+        _STAGE_PREPROCESS.observe(t1 - t0)
+        out: list[int | None] = [None] * len(lines)
+        todo = list(range(len(lines)))
+
+        tracker = self._tracker
+        pred = tracker.predict(ts_ms) if tracker is not None else None
+        if tracker is not None and pred is not None and self._quick_engine is not None:
+            gate = tracker.gate(ts_ms)
+            todo: list[int] = []
+            for i, raw in enumerate(self._quick_engine.recognize_many(pres)):
+                val = self._parse_int(raw)
+                if val is not None and abs(val - pred[lines[i][0]]) <= gate:
+                    out[i] = val
+                else:
+                    todo.append(i)
+            self.quick_reads += len(lines) - len(todo)
+            t2 = time.perf_counter()
+            _STAGE_QUICK.observe(t2 - t1)
+            t1 = t2
+
+        if todo:
+            self.full_reads += len(todo)
+            raws = self._engine.recognize_many([pres[i] for i in todo])
+            for i, raw in zip(todo, raws, strict=True):
+                out[i] = self._parse_int(raw)
+            _STAGE_ENGINE.observe(time.perf_counter() - t1)
+        return out
+
+    def _parse_int(self, raw: str) -> int | None:
         digits = self._digits_only(raw)
         if not digits:
             return None
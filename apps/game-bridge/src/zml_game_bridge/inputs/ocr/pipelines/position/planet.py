@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.change_gate import ChangeGateConfig, RoiChangeGate
+from zml_game_bridge.inputs.ocr.pipelines.text.pipeline import (
+    TextEngine,
+    TextPipelineConfig,
+    binarize_text,
+)
+
+# Names as the compass header shows them. The list is closed on purpose: a read that
+# snaps to none of them is not passed through, because loading screens and overlays
+# OCR to plausible words ("Loading...") and a made-up planet name would split the
+# position track. An area missing here (event area, instance) keeps the previous
+# name; add it here or pass PlanetRecognizer(names=...) to recognize it.
+KNOWN_PLANETS: tuple[str, ...] = (
+    "Calypso",
+    "Planet Arkadia",
+    "Arkadia Underground",
+    "Planet Cyrene",
+    "ROCKtropia",
+    "Next Island",
+    "Planet Toulan",
+    "Monria",
+    "Setesh",
+    "Space",
+)
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance (insert/delete/substitute = 1)."""
+    if len(a) < len(b):
+        a, b = b, a
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        cur = [i]
+        for j, cb in enumerate(b, start=1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+def _norm(text: str) -> str:
+    return "".join(ch for ch in text.casefold() if ch.isalnum())
+
+
+def snap_to_known(text: str, names: Sequence[str], *, max_error_ratio: float = 0.34) -> str | None:
+    """
+    Closest known name to an OCR'd string, or None when nothing is close enough.
+    Case, spaces and punctuation are ignored; up to max_error_ratio of the
+    name's length may be wrong (at least one character).
+    """
+    got = _norm(text)
+    if not got:
+        return None
+
+    best: str | None = None
+    best_d = 0
+    for name in names:
+        d = edit_distance(got, _norm(name))
+        if best is None or d < best_d:
+            best, best_d = name, d
+    if best is None or best_d > max(1, int(max_error_ratio * len(_norm(best)))):
+        return None
+    return best
+
+
+class PlanetRecognizer:
+    """
+    Planet name from the compass header. The planet rarely changes, so OCR runs
+    only when the ROI pixels change; the answer is snapped to KNOWN_PLANETS and
+    cached. A read that snaps to nothing (loading screen, overlay) keeps the last
+    name; re-reading the same pixels would give the same text, so the next OCR
+    waits for the ROI to change again.
+    """
+
+    def __init__(
+        self,
+        engine: TextEngine,
+        *,
+        names: Sequence[str] = KNOWN_PLANETS,
+        cfg: TextPipelineConfig | None = None,
+        gate_cfg: ChangeGateConfig | None = None,
+    ) -> None:
+        self._engine = engine
+        self._names = tuple(names)
+        self._cfg = cfg or TextPipelineConfig()
+        self._gate = RoiChangeGate(gate_cfg)
+        self._name: str | None = None
+        self._reads = 0
+
+    @property
+    def reads(self) -> int:
+        """How many times OCR actually ran."""
+        return self._reads
+
+    def read(self, roi: np.ndarray) -> str | None:
+        if not self._gate.changed(roi):
+            return self._name
+
+        self._reads += 1
+        name = snap_to_known(self._engine.recognize_text(binarize_text(roi, self._cfg)), self._names)
+        if name is None:
+            return self._name
+
+        self._name = name
+        return name
+
+    def close(self) -> None:
+        self._engine.close()
@@ -1,11 +1,17 @@
 # preprocess.py
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 
 import cv2
 import numpy as np
 
+# Workspaces kept per thread. ROI shapes are fixed while the game window keeps its size,
+# so a handful covers every (shape, slot) in use; a resize makes new ones and the cap
+# drops the oldest instead of keeping buffers for every size the window ever had.
+_MAX_WORKSPACES = 8
+
 
 @dataclass(frozen=True, slots=True)
 class DigitsPreprocessConfig:
@@ -24,62 +30,30 @@ class DigitsPreprocessConfig:
     force_white_bg: bool = True
 
 
-def _to_gray_u8(img: np.ndarray) -> np.ndarray:
-    """Convert input image to single-channel uint8 grayscale."""
-    if img.ndim == 2:
-        gray = img
-    elif img.ndim == 3 and img.shape[2] == 3:
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    elif img.ndim == 3 and img.shape[2] == 4:
-        gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
-    else:
-        raise ValueError(f"Unsupported image shape: {img.shape}")
-
-    if gray.dtype != np.uint8:
-        raise ValueError(f"Unsupported grayscale dtype: {gray.dtype}")
-
-    return gray
-
-
-def _upscale(img: np.ndarray, scale: int, interpolation: int) -> np.ndarray:
-    """Upscale image by an integer factor."""
-    if scale <= 1:
-        return img
-    h, w = img.shape[:2]
-    return cv2.resize(img, (w * scale, h * scale), interpolation=interpolation)
-
+class _Workspace:
+    """Preallocated per-stage buffers for one input shape."""
 
-def _normalize_binary_background(binary: np.ndarray) -> np.ndarray:
-    """Ensure mostly white background (helps OCR)."""
-    white_ratio = float(np.count_nonzero(binary > 0)) / float(binary.size)
-    if white_ratio < 0.5:
-        return cv2.bitwise_not(binary)
-    return binary
+    __slots__ = ("a", "b", "gray", "labels", "up")
 
-
-def _remove_small_components(binary: np.ndarray, min_area: int) -> np.ndarray:
-    """Remove small connected components from a binary image (uint8 0/255)."""
-    if min_area <= 0:
-        return binary
-
-    bw = (binary > 0).astype(np.uint8)
-    num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(bw, connectivity=8)
-    if num_labels <= 1:
-        return binary
-
-    out = np.zeros_like(bw)
-    for label in range(1, num_labels):
-        area = int(stats[label, cv2.CC_STAT_AREA])
-        if area >= min_area:
-            out[labels == label] = 1
-
-    return (out * 255).astype(np.uint8)
+    def __init__(self, in_h: int, in_w: int, scale: int) -> None:
+        out_h, out_w = in_h * max(1, scale), in_w * max(1, scale)
+        self.gray = np.empty((in_h, in_w), dtype=np.uint8)
+        self.up = np.empty((out_h, out_w), dtype=np.uint8)
+        # Ping-pong pair: every stage reads one and writes the other.
+        self.a = np.empty((out_h, out_w), dtype=np.uint8)
+        self.b = np.empty((out_h, out_w), dtype=np.uint8)
+        self.labels = np.empty((out_h, out_w), dtype=np.int32)
 
 
 class DigitsPreprocessor:
     """
     Cache-heavy objects (kernels) are created once in __init__.
-    The process() method stays stateless and thread-safe.
+
+    process() writes every stage into preallocated buffers (one workspace per
+    thread, input shape and slot), so steady-state frames allocate almost nothing.
+    The returned image is such a buffer: it stays valid until the next call on the
+    same thread with the same shape and slot. Use distinct slots for results that
+    must be alive at the same time, and copy() anything kept longer.
     """
 
     def __init__(self, cfg: DigitsPreprocessConfig | None = None) -> None:
@@ -94,36 +68,86 @@ class DigitsPreprocessor:
         )
         self._close_kernel_mat = cv2.getStructuringElement(cv2.MORPH_RECT, (ckx, cky))
 
-    def process(self, img: np.ndarray) -> np.ndarray:
+        k = int(self.cfg.blur_ksize)
+        self._blur_ksize = (k + 1 if k % 2 == 0 else k) if k >= 3 else 0
+
+        self._local = threading.local()
+
+    def process(self, img: np.ndarray, *, slot: int = 0) -> np.ndarray:
         """
         Preprocess a single-line ROI containing bright digits on varying background.
         Returns binary uint8 (0/255).
         """
-        gray = _to_gray_u8(img)
-        work = _upscale(gray, self.cfg.upscale, self.cfg.interpolation)
+        if not (img.ndim == 2 or (img.ndim == 3 and img.shape[2] in (3, 4))):
+            raise ValueError(f"Unsupported image shape: {img.shape}")
+        if img.dtype != np.uint8:
+            raise ValueError(f"Unsupported grayscale dtype: {img.dtype}")
+
+        ws = self._workspace(img.shape[0], img.shape[1], slot)
+
+        if img.ndim == 2:
+            gray = img
+        else:
+            code = cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+            gray = cv2.cvtColor(img, code, dst=ws.gray)
+
+        work = gray
+        if self.cfg.upscale > 1:
+            h, w = ws.up.shape
+            work = cv2.resize(gray, (w, h), dst=ws.up, interpolation=self.cfg.interpolation)
 
-        top = cv2.morphologyEx(work, cv2.MORPH_TOPHAT, self._tophat_kernel_mat)
+        cur, nxt = ws.a, ws.b
+        cv2.morphologyEx(work, cv2.MORPH_TOPHAT, self._tophat_kernel_mat, dst=cur)
 
-        if self.cfg.blur_ksize and self.cfg.blur_ksize >= 3:
-            k = int(self.cfg.blur_ksize)
-            if k % 2 == 0:
-                k += 1
-            top = cv2.GaussianBlur(top, (k, k), 0)
+        if self._blur_ksize:
+            k = self._blur_ksize
+            cv2.GaussianBlur(cur, (k, k), 0, dst=nxt)
+            cur, nxt = nxt, cur
 
-        _, bw = cv2.threshold(top, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        cv2.threshold(cur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=nxt)
+        cur, nxt = nxt, cur
 
         if self.cfg.morph_close_iterations > 0:
-            bw = cv2.morphologyEx(
-                bw,
+            cv2.morphologyEx(
+                cur,
                 cv2.MORPH_CLOSE,
                 self._close_kernel_mat,
+                dst=nxt,
                 iterations=int(self.cfg.morph_close_iterations),
             )
+            cur, nxt = nxt, cur
 
-        if self.cfg.remove_small_cc:
-            bw = _remove_small_components(bw, int(self.cfg.min_cc_area))
+        if self.cfg.remove_small_cc and self.cfg.min_cc_area > 0:
+            remove_small_components(cur, int(self.cfg.min_cc_area), dst=nxt, labels=ws.labels)
+            cur, nxt = nxt, cur
 
-        if self.cfg.force_white_bg:
-            bw = _normalize_binary_background(bw)
+        if self.cfg.force_white_bg and 2 * cv2.countNonZero(cur) < cur.size:
+            # Ensure mostly white background (helps OCR).
+            cv2.bitwise_not(cur, dst=nxt)
+            cur, nxt = nxt, cur
 
-        return bw
+        return cur
+
+    def _workspace(self, h: int, w: int, slot: int) -> _Workspace:
+        cache: dict[tuple[int, int, int], _Workspace] | None = getattr(self._local, "ws", None)
+        if cache is None:
+            cache = self._local.ws = {}
+        ws = cache.get((h, w, slot))
+        if ws is None:
+            if len(cache) >= _MAX_WORKSPACES:
+                del cache[next(iter(cache))]  # oldest first (insertion order)
+            ws = cache[(h, w, slot)] = _Workspace(h, w, self.cfg.upscale)
+        return ws
+
+
+def remove_small_components(binary: np.ndarray, min_area: int, *, dst: np.ndarray, labels: np.ndarray) -> None:
+    """
+    Drop connected components (8-connectivity) smaller than min_area from a 0/255 image.
+    One labelling pass plus a lookup table: dst = keep[labels].
+    The small-cc stage of DigitsPreprocessor.process(), public for staged evaluators
+    (testing/OCR/sweep.py) that must match it pixel for pixel.
+    """
+    _, labels, stats, _ = cv2.connectedComponentsWithStats(binary, labels=labels, connectivity=8, ltype=cv2.CV_32S)
+    keep = np.where(stats[:, cv2.CC_STAT_AREA] >= min_area, 255, 0).astype(np.uint8)
+    keep[0] = 0  # background label
+    np.take(keep, labels, out=dst)
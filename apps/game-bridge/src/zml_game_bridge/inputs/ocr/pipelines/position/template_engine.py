@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+import zml_game_bridge
+
+DIGITS = "0123456789"
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateEngineConfig:
+    glyph_size: tuple[int, int] = (14, 20)  # (w, h) every glyph is normalized to
+    min_glyph_ink: int = 8  # column runs with fewer ink pixels are noise
+    min_score: float = 0.5  # correlation below this for any glyph -> reject the whole read
+
+
+@dataclass(frozen=True, slots=True)
+class DigitTemplates:
+    """One zero-mean, unit-norm template vector per digit (row i = digit i)."""
+
+    matrix: np.ndarray  # float32 (10, w*h)
+    glyph_size: tuple[int, int]
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, matrix=self.matrix, glyph_size=np.asarray(self.glyph_size, dtype=np.int32))
+
+    @classmethod
+    def load(cls, path: Path) -> DigitTemplates:
+        with np.load(path) as data:
+            matrix = data["matrix"].astype(np.float32)
+            gw, gh = (int(v) for v in data["glyph_size"])
+        if matrix.shape != (len(DIGITS), gw * gh):
+            raise ValueError(f"Bad template matrix shape {matrix.shape} for glyph_size={(gw, gh)}")
+        return cls(matrix=matrix, glyph_size=(gw, gh))
+
+
+def default_templates_path() -> Path:
+    return Path(zml_game_bridge.__file__).resolve().parent.parent.parent / "resources" / "digit_templates.npz"
+
+
+def segment_glyphs(binary: np.ndarray, *, min_ink: int = 8) -> list[tuple[int, int]]:
+    """
+    Column ranges [x0, x1) of glyphs in a white-background binary line.
+
+    Runs of ink columns are glyphs; the HUD font is fixed-pitch, so a run much wider
+    than the median run (touching digits) is split into equal parts.
+    """
+    ink = binary < 128
+    col_ink = np.count_nonzero(ink, axis=0)
+    edges = np.diff(np.concatenate(([0], (col_ink > 0).astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    csum = np.concatenate(([0], np.cumsum(col_ink)))
+    runs = [(int(a), int(b)) for a, b in zip(starts, ends, strict=True) if csum[b] - csum[a] >= min_ink]
+    if not runs:
+        return []
+
+    widths = np.array([b - a for a, b in runs], dtype=np.float64)
+    pitch = max(float(np.median(widths)), binary.shape[0] * 0.3)
+
+    out: list[tuple[int, int]] = []
+    for a, b in runs:
+        k = max(1, round((b - a) / pitch))
+        if k == 1:
+            out.append((a, b))
+            continue
+        cuts = np.linspace(a, b, k + 1).round().astype(int)
+        out.extend((int(x0), int(x1)) for x0, x1 in itertools.pairwise(cuts))
+    return out
+
+
+def glyph_vectors(binary: np.ndarray, glyphs: list[tuple[int, int]], glyph_size: tuple[int, int]) -> np.ndarray:
+    """(n, w*h) float32: each glyph cropped to its ink rows, resized, zero-mean, unit-norm."""
+    gw, gh = glyph_size
+    ink = (binary < 128).astype(np.float32)
+    out = np.zeros((len(glyphs), gw * gh), dtype=np.float32)
+    for i, (x0, x1) in enumerate(glyphs):
+        g = ink[:, x0:x1]
+        rows = np.flatnonzero(g.any(axis=1))
+        if rows.size:
+            g = g[rows[0] : rows[-1] + 1]
+        out[i] = cv2.resize(g, (gw, gh), interpolation=cv2.INTER_AREA).ravel()
+
+    out -= out.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(out, axis=1, keepdims=True)
+    np.divide(out, norms, out=out, where=norms > 0)
+    return out
+
+
+def train_templates(
+    lines: Iterable[tuple[np.ndarray, str]],
+    *,
+    cfg: TemplateEngineConfig | None = None,
+) -> tuple[DigitTemplates, int]:
+    """
+    Average glyph vectors per digit over labelled (binary line, digits) pairs.
+    Lines whose segmentation disagrees with the label length are skipped.
+    Returns (templates, lines_used).
+    """
+    cfg = cfg or TemplateEngineConfig()
+    sums = np.zeros((len(DIGITS), cfg.glyph_size[0] * cfg.glyph_size[1]), dtype=np.float64)
+    counts = np.zeros(len(DIGITS), dtype=np.int64)
+    used = 0
+
+    for binary, label in lines:
+        glyphs = segment_glyphs(binary, min_ink=cfg.min_glyph_ink)
+        if len(glyphs) != len(label) or not label.isdigit():
+            continue
+        vecs = glyph_vectors(binary, glyphs, cfg.glyph_size)
+        idx = np.frombuffer(label.encode("ascii"), dtype=np.uint8) - ord("0")
+        np.add.at(sums, idx, vecs)
+        np.add.at(counts, idx, 1)
+        used += 1
+
+    missing = [DIGITS[i] for i in np.flatnonzero(counts == 0)]
+    if missing:
+        raise ValueError(f"No training glyphs for digits: {''.join(missing)}")
+
+    matrix = (sums / counts[:, None]).astype(np.float32)
+    matrix -= matrix.mean(axis=1, keepdims=True)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return DigitTemplates(matrix=matrix, glyph_size=cfg.glyph_size), used
+
+
+class TemplateDigitsEngine:
+    """
+    Fixed-font digit reader: column-projection segmentation + correlation against
+    per-digit templates. Expects the same input as TesserDigitsEngine (binary,
+    dark digits on white, as produced by DigitsPreprocessor).
+
+    Returns "" (no read) when any glyph matches poorly, so the caller treats it
+    as a miss instead of a wrong number. Stateless; safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        templates: DigitTemplates | None = None,
+        *,
+        templates_path: Path | None = None,
+        cfg: TemplateEngineConfig | None = None,
+    ) -> None:
+        self.cfg = cfg or TemplateEngineConfig()
+        if templates is None:
+            path = templates_path or default_templates_path()
+            if not path.is_file():
+                raise RuntimeError(f"Digit templates not found: {path} (see testing/OCR/train_templates.py)")
+            templates = DigitTemplates.load(path)
+        self._templates = templates
+        self._t = np.ascontiguousarray(templates.matrix.T)  # (w*h, 10)
+
+    def recognize_digits(self, img_u8: np.ndarray) -> str:
+        if img_u8.ndim != 2 or img_u8.dtype != np.uint8:
+            raise ValueError(f"Expected grayscale/binary uint8 2D image, got {img_u8.dtype} shape={img_u8.shape}")
+
+        glyphs = segment_glyphs(img_u8, min_ink=self.cfg.min_glyph_ink)
+        if not glyphs:
+            return ""
+
+        scores = glyph_vectors(img_u8, glyphs, self._templates.glyph_size) @ self._t
+        best = scores.argmax(axis=1)
+        if float(scores[np.arange(best.shape[0]), best].min()) < self.cfg.min_score:
+            return ""
+        return "".join(DIGITS[i] for i in best)
+
+    def recognize_many(self, imgs: Sequence[np.ndarray]) -> list[str]:
+        return [self.recognize_digits(img) for img in imgs]
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class TrackerConfig:
+    # Fastest plausible travel (world units per second) and a flat allowance for
+    # OCR/frame-timing jitter. A fix further than max_speed * dt + slack from the
+    # track is treated as a misread.
+    max_speed_per_s: float = 100.0
+    slack: float = 25.0
+
+    # Velocity from the last two accepted fixes is trusted only over short gaps. The
+    # gate grows with dt up to this gap too: after the player idles (the change gate
+    # skips unchanged frames) a misread must not pass just because time went by;
+    # a real move past the capped gate is picked up by reacquire.
+    max_velocity_gap_s: float = 2.0
+
+    # Teleports/revives: this many consecutive rejected fixes that agree with each
+    # other (within reacquire_radius + max_speed * dt) move the track there.
+    reacquire_fixes: int = 3
+    reacquire_radius: float = 30.0
+
+    # Confidence of a fresh (unconfirmed) track; on-track fixes go up to 1.0.
+    initial_confidence: float = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class _Fix:
+    x: float
+    y: float
+    ts_ms: int
+
+
+class PositionTracker:
+    """
+    Constant-velocity track over accepted OCR fixes with max-speed gating.
+
+    update() returns a confidence for a plausible fix, or None for a rejected one
+    (typically a single misread digit that would teleport the player kilometres).
+    predict() lets the pipeline check cheap reads against where the player should be.
+    """
+
+    def __init__(self, cfg: TrackerConfig | None = None) -> None:
+        self.cfg = cfg or TrackerConfig()
+        self._last: _Fix | None = None
+        self._prev: _Fix | None = None
+        self._confidence = self.cfg.initial_confidence
+        self._rejected: deque[_Fix] = deque(maxlen=max(1, self.cfg.reacquire_fixes))
+        self.accepted = 0
+        self.rejected = 0
+        self.reacquired = 0
+
+    def predict(self, ts_ms: int) -> tuple[float, float] | None:
+        last = self._last
+        if last is None:
+            return None
+        vx, vy = self._velocity()
+        dt = self._dt_s(ts_ms, last)
+        return last.x + vx * dt, last.y + vy * dt
+
+    def gate(self, ts_ms: int) -> float:
+        """Max plausible distance from the prediction at ts_ms."""
+        if self._last is None:
+            return math.inf
+        return self.cfg.max_speed_per_s * self._dt_s(ts_ms, self._last) + self.cfg.slack
+
+    def update(self, x: int, y: int, ts_ms: int) -> float | None:
+        fix = _Fix(float(x), float(y), ts_ms)
+        pred = self.predict(ts_ms)
+        if pred is None:
+            self._accept(fix, self.cfg.initial_confidence)
+            return self._confidence
+
+        err = math.hypot(fix.x - pred[0], fix.y - pred[1])
+        gate = self.gate(ts_ms)
+        if err <= gate:
+            # Agreeing fixes build confidence; ones near the gate edge lower it.
+            quality = 1.0 - 0.5 * (err / gate)
+            self._accept(fix, min(1.0, 0.5 * self._confidence + 0.5 * quality + 0.1))
+            return self._confidence
+
+        self.rejected += 1
+        self._rejected.append(fix)
+        if self._consistent_rejections():
+            self.reacquired += 1
+            self._last = self._prev = None  # no velocity across the jump
+            self._accept(fix, self.cfg.initial_confidence)
+            return self._confidence
+        return None
+
+    def reset(self) -> None:
+        self._last = self._prev = None
+        self._confidence = self.cfg.initial_confidence
+        self._rejected.clear()
+
+    def _accept(self, fix: _Fix, confidence: float) -> None:
+        self._prev, self._last = self._last, fix
+        self._confidence = confidence
+        self._rejected.clear()
+        self.accepted += 1
+
+    def _dt_s(self, ts_ms: int, last: _Fix) -> float:
+        """Seconds since `last`, capped at max_velocity_gap_s (no extrapolation past it)."""
+        return min(max(0.0, (ts_ms - last.ts_ms) / 1000.0), self.cfg.max_velocity_gap_s)
+
+    def _velocity(self) -> tuple[float, float]:
+        a, b = self._prev, self._last
+        if a is None or b is None:
+            return 0.0, 0.0
+        dt = (b.ts_ms - a.ts_ms) / 1000.0
+        if dt <= 0.0 or dt > self.cfg.max_velocity_gap_s:
+            return 0.0, 0.0
+        return (b.x - a.x) / dt, (b.y - a.y) / dt
+
+    def _consistent_rejections(self) -> bool:
+        fixes = self._rejected
+        if len(fixes) < self.cfg.reacquire_fixes:
+            return False
+        for a, b in zip(fixes, list(fixes)[1:], strict=False):
+            dt = max(0.0, (b.ts_ms - a.ts_ms) / 1000.0)
+            if math.hypot(b.x - a.x, b.y - a.y) > self.cfg.reacquire_radius + self.cfg.max_speed_per_s * dt:
+                return False
+        return True
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+import zml_game_bridge
+
+
+class TesserTextEngine:
+    """General text on one PyTessBaseAPI (a block, or one line); not thread-safe."""
+
+    def __init__(self, *, tessdata_dir: str | None = None, single_line: bool = False) -> None:
+        try:
+            import tesserocr  # type: ignore
+        except Exception as e:
+            raise RuntimeError(f"tesserocr import failed: {e}") from e
+
+        if tessdata_dir is None:
+            tessdata_dir = str(Path(zml_game_bridge.__file__).resolve().parent.parent.parent / "resources" / "tessdata/")
+
+        self._api = tesserocr.PyTessBaseAPI(
+            path=tessdata_dir,
+            lang="eng",
+            psm=tesserocr.PSM.SINGLE_LINE if single_line else tesserocr.PSM.SINGLE_BLOCK,
+            oem=tesserocr.OEM.LSTM_ONLY,
+        )
+        self._api.SetVariable("user_defined_dpi", "300")
+
+    def recognize_text(self, img_u8: np.ndarray) -> str:
+        if img_u8.ndim != 2 or img_u8.dtype != np.uint8:
+            raise ValueError(f"Expected grayscale/binary uint8 2D image, got {img_u8.dtype} shape={img_u8.shape}")
+
+        img = np.ascontiguousarray(img_u8)
+        h, w = img.shape
+        self._api.SetImageBytes(img.tobytes(), w, h, 1, w)
+        return self._api.GetUTF8Text() or ""
+
+    def close(self) -> None:
+        self._api.End()
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class OcrText:
+    source: str  # pipeline name: "finder", "deeds", ...
+    ts_ms: int
+    lines: tuple[str, ...]
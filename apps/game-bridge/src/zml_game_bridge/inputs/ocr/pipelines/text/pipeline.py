@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+import cv2
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.change_gate import ChangeGateConfig, RoiChangeGate
+from zml_game_bridge.inputs.ocr.pipelines.text.model import OcrText
+
+TextSink = Callable[[OcrText], None]
+
+
+class TextEngine(Protocol):
+    def recognize_text(self, img_u8: np.ndarray) -> str: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class TextPipelineConfig:
+    upscale: int = 2
+    interpolation: int = cv2.INTER_CUBIC
+
+
+def binarize_text(roi: np.ndarray, cfg: TextPipelineConfig) -> np.ndarray:
+    """Upscale + Otsu, normalized to dark text on white."""
+    gray = roi if roi.ndim == 2 else cv2.cvtColor(roi, cv2.COLOR_BGRA2GRAY if roi.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+    if cfg.upscale > 1:
+        h, w = gray.shape
+        gray = cv2.resize(gray, (w * cfg.upscale, h * cfg.upscale), interpolation=cfg.interpolation)
+    _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if 2 * cv2.countNonZero(bw) < bw.size:
+        # Game UI is light text on dark panels; Tesseract wants dark on white.
+        bw = cv2.bitwise_not(bw)
+    return bw
+
+
+class TextPipeline:
+    """
+    Generic UI-panel text reader (finder, deeds, ...): change gate -> upscale +
+    Otsu (dark text on white) -> block OCR -> non-empty lines. Emits only when
+    the text differs from the last emission.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        sink: TextSink,
+        engine: TextEngine,
+        cfg: TextPipelineConfig | None = None,
+        gate_cfg: ChangeGateConfig | None = None,
+    ) -> None:
+        self._name = name
+        self._sink = sink
+        self._engine = engine
+        self._cfg = cfg or TextPipelineConfig()
+        self._gate = RoiChangeGate(gate_cfg)
+        self._last_lines: tuple[str, ...] | None = None
+
+    def step(self, roi: np.ndarray, ts_ms: int) -> None:
+        if not self._gate.changed(roi):
+            return
+
+        lines = tuple(ln.strip() for ln in self._engine.recognize_text(binarize_text(roi, self._cfg)).splitlines())
+        lines = tuple(ln for ln in lines if ln)
+        if lines == self._last_lines:
+            return
+
+        self._last_lines = lines
+        self._sink(OcrText(source=self._name, ts_ms=ts_ms, lines=lines))
+
+    def close(self) -> None:
+        self._engine.close()
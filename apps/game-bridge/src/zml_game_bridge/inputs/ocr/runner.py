@@ -3,29 +3,81 @@ from __future__ import annotations
 import time
 import threading
 from collections.abc import Callable
-from ctypes import windll
 
-from zml_game_bridge.inputs.ocr.capture.window_capturer import WindowCapturer
+from zml_game_bridge.common.heartbeat import heartbeat
+from zml_game_bridge.common.metrics import REGISTRY
+from zml_game_bridge.inputs.ocr.capture.frame_source import (
+    FrameSource,
+    FrameSourceExhausted,
+    FrameSourceFactory,
+)
 from zml_game_bridge.inputs.ocr.capture.model import RoiRect
+from zml_game_bridge.inputs.ocr.pipelines.position.cached_engine import CachedDigitsEngine
+from zml_game_bridge.inputs.ocr.pipelines.position.engine import DigitsEngine, TesserDigitsEngine
+from zml_game_bridge.inputs.ocr.pipelines.position.engine_pool import EnginePool
 from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition, PositionRois
 from zml_game_bridge.inputs.ocr.pipelines.position.pipeline import PositionPipeline
+from zml_game_bridge.inputs.ocr.pipelines.position.planet import PlanetRecognizer
+from zml_game_bridge.inputs.ocr.pipelines.position.template_engine import TemplateDigitsEngine
+from zml_game_bridge.inputs.ocr.pipelines.position.tracker import PositionTracker
+from zml_game_bridge.inputs.ocr.pipelines.text.engine import TesserTextEngine
+from zml_game_bridge.inputs.ocr.pipelines.text.pipeline import TextPipeline, TextSink
+from zml_game_bridge.inputs.ocr.scheduler import PipelineScheduler, PipelineSpec
 
 PositionSink = Callable[[OcrPosition], None]
 
+_FRAMES = REGISTRY.counter("zml_ocr_frames_total", "OCR loop ticks that grabbed a frame")
+_GRAB = REGISTRY.histogram("zml_ocr_stage_seconds", stage="grab")
+_STEP = REGISTRY.histogram("zml_ocr_stage_seconds", stage="step")
+_HEARTBEAT = heartbeat("ocr")
+REGISTRY.gauge("zml_ocr_loop_hz", "OCR loop rate actually achieved (smoothed)").set_function(lambda: _HEARTBEAT.hz)
+
 # MVP hardcode
 ROI_COMPASS = RoiRect(x1=2185, y1=965, x2=2551, y2=1411)
 ROI_FINDER  = RoiRect(x1=20,   y1=20,  x2=700,  y2=250)
 ROI_DEEDS   = RoiRect(x1=20,   y1=260, x2=700,  y2=520)
 
 
+def open_game_window() -> FrameSource:
+    """Default source: the live game client window (Windows only; imported lazily)."""
+    from zml_game_bridge.inputs.ocr.capture.window_capturer import WindowCapturer
+
+    return WindowCapturer(title_contains="Entropia Universe Client")
+
+
+def open_digits_engine(pool_size: int, *, batch: bool = False) -> DigitsEngine:
+    """
+    Tesseract behind the recognition cache; pool_size > 1 reads lines in parallel,
+    batch=True reads them in one pass on a single engine instead.
+    """
+    if batch:
+        return CachedDigitsEngine(TesserDigitsEngine(batch=True))
+    if pool_size <= 1:
+        return CachedDigitsEngine(TesserDigitsEngine())
+    return CachedDigitsEngine(EnginePool(TesserDigitsEngine, size=pool_size))
+
+
+def open_quick_digits_engine() -> DigitsEngine | None:
+    """Template matcher for cheap reads checked against the tracker; optional."""
+    try:
+        return TemplateDigitsEngine()
+    except RuntimeError as e:
+        print(f"[OCR] Quick digit reads disabled: {e}")
+        return None
+
+
 def start_ocr_input(
     *,
     position_sink: PositionSink,
     stop_event: threading.Event,
     target_hz: float = 10.0,
+    frame_source_factory: FrameSourceFactory = open_game_window,
+    engine_pool_size: int = 2,
+    engine_batch: bool = False,
+    text_sink: TextSink | None = None,
+    scheduler: PipelineScheduler | None = None,
 ) -> None:
-    windll.user32.SetProcessDPIAware()  # do once per process
-    cap = WindowCapturer(title_contains="Entropia Universe Client")
+    cap = frame_source_factory()
     period = 1.0 / target_hz
     next_t = time.perf_counter()
 
@@ -35,15 +87,27 @@ def start_ocr_input(
         lat=RoiRect(x1=90, x2=145, y1=375, y2=395),
     )
 
-    # pipelines (MVP stubs)
-    position_pipeline = PositionPipeline(lat_lon_rois)
-    # finder_pipeline = ...    # step(finder_roi, ts_ms) -> ...
-    # deeds_pipeline = ...     # step(deeds_roi, ts_ms) -> ...
+    position_pipeline = PositionPipeline(
+        lat_lon_rois,
+        engine=open_digits_engine(engine_pool_size, batch=engine_batch),
+        planet=PlanetRecognizer(TesserTextEngine(single_line=True)),
+        tracker=PositionTracker(),
+        quick_engine=open_quick_digits_engine(),
+    )
 
-    # optional: run slower pipelines less often
-    finder_every_n = 5   # 10Hz/5 = 2Hz
-    deeds_every_n = 10   # 1Hz
-    tick = 0
+    # Slower panels run on their own threads; position stays inline on this one.
+    if scheduler is None:
+        scheduler = PipelineScheduler()
+    if text_sink is not None:
+        scheduler.add(
+            PipelineSpec(name="finder", roi=ROI_FINDER, target_hz=2.0, budget_ms=150.0),
+            lambda: TextPipeline("finder", sink=text_sink, engine=TesserTextEngine()),
+        )
+        scheduler.add(
+            PipelineSpec(name="deeds", roi=ROI_DEEDS, target_hz=1.0, budget_ms=300.0),
+            lambda: TextPipeline("deeds", sink=text_sink, engine=TesserTextEngine()),
+        )
+    scheduler.start()
 
     try:
         while not stop_event.is_set():
@@ -55,30 +119,32 @@ def start_ocr_input(
                 # We're behind schedule: drop backlog and resync.
                 next_t = now
             next_t += period
-            tick += 1
 
+            _HEARTBEAT.beat()
+            t0 = time.perf_counter()
 
-            frame = cap.grab()
+            due = scheduler.due(t0)
+            try:
+                # Only the requested ROIs leave the capture layer, already grayscale.
+                compass, *panels = cap.grab_rois((ROI_COMPASS, *(spec.roi for spec in due)))
+            except FrameSourceExhausted:
+                break
+            t1 = time.perf_counter()
+            _GRAB.observe(t1 - t0)
+            _FRAMES.inc()
 
             ts_ms = time.time_ns() // 1_000_000
 
-            compass = ROI_COMPASS.crop(frame)
+            for spec, panel in zip(due, panels, strict=True):
+                if panel is not None:
+                    scheduler.submit(spec.name, panel, ts_ms)
+
             if compass is not None:
                 pos = position_pipeline.step(compass, ts_ms)
+                _STEP.observe(time.perf_counter() - t1)
                 if pos is not None:
                     position_sink(pos)
-
-            if tick % finder_every_n == 0:
-                pass
-                # finder = ROI_FINDER.crop(frame)
-                # if finder is not None:
-                #     finder_pipeline.step(finder, ts_ms)
-
-            if tick % deeds_every_n == 0:
-                pass
-                # deeds = ROI_DEEDS.crop(frame)
-                # if deeds is not None:
-                #     deeds_pipeline.step(deeds, ts_ms)
     finally:
+        scheduler.stop()
         cap.close()
-        position_pipeline.close()
\ No newline at end of file
+        position_pipeline.close()
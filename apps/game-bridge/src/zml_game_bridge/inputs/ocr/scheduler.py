@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from zml_game_bridge.common.metrics import REGISTRY
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect
+from zml_game_bridge.inputs.ocr.pipelines.base import RoiPipeline, RoiPipelineFactory
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineSpec:
+    name: str
+    roi: RoiRect  # screen coords, captured alongside the compass when due
+    target_hz: float
+    budget_ms: float  # a run slower than this pushes the next one back
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineStats:
+    name: str
+    runs: int
+    skipped_busy: int  # due while the previous run was still going
+    deferred: int  # runs pushed back because the previous one was over budget
+    last_ms: float
+    avg_ms: float
+    max_ms: float
+
+
+class _Slot:
+    def __init__(self, spec: PipelineSpec, factory: RoiPipelineFactory) -> None:
+        self.spec = spec
+        self.factory = factory
+        self.failed = False  # factory raised: never due again
+        self.period_s = 1.0 / spec.target_hz
+        self.next_due = 0.0
+
+        self.cond = threading.Condition()
+        self.job: tuple[np.ndarray, int] | None = None
+        self.busy = False
+        self.thread: threading.Thread | None = None
+
+        self.runs = 0
+        self.skipped_busy = 0
+        self.deferred = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+        name = spec.name
+        self.m_seconds = REGISTRY.histogram("zml_ocr_pipeline_seconds", "Scheduled OCR pipeline step time", pipeline=name)
+        self.m_skipped = REGISTRY.counter(
+            "zml_ocr_pipeline_skipped_total", "Due runs skipped, previous still busy", pipeline=name
+        )
+        self.m_deferred = REGISTRY.counter(
+            "zml_ocr_pipeline_deferred_total", "Runs over budget (next one pushed back)", pipeline=name
+        )
+
+
+class PipelineScheduler:
+    """
+    Runs slow OCR pipelines (finder, deeds, ...) at their own rate, each on its own
+    worker thread, against ROIs captured by the OCR loop.
+
+    The OCR loop asks due(now) every tick, captures those ROIs together with the
+    compass and hands them over with submit(); it never waits for a worker.
+    - due but the previous run is still busy -> that run is skipped
+    - a run over budget_ms -> the next one is deferred by whole periods
+      (ceil(run_ms / budget_ms)), so a slow pipeline sheds rate instead of piling up
+    """
+
+    def __init__(self) -> None:
+        self._slots: dict[str, _Slot] = {}
+        self._stop = threading.Event()
+
+    def add(self, spec: PipelineSpec, factory: RoiPipelineFactory) -> None:
+        """The pipeline is built by factory() on its worker thread, and closed there on stop()."""
+        if spec.target_hz <= 0 or spec.budget_ms <= 0:
+            raise ValueError("target_hz and budget_ms must be > 0")
+        if spec.name in self._slots:
+            raise ValueError(f"Duplicate pipeline name: {spec.name!r}")
+        self._slots[spec.name] = _Slot(spec, factory)
+
+    def start(self) -> None:
+        for slot in self._slots.values():
+            slot.thread = threading.Thread(target=self._worker, args=(slot,), name=f"ocr-{slot.spec.name}", daemon=True)
+            slot.thread.start()
+
+    def stop(self, timeout_s: float = 2.0) -> None:
+        self._stop.set()
+        for slot in self._slots.values():
+            with slot.cond:
+                slot.cond.notify()
+        for slot in self._slots.values():
+            if slot.thread is not None:
+                slot.thread.join(timeout=timeout_s)
+
+    def threads(self) -> dict[str, threading.Thread]:
+        """Started worker threads by name (ocr-<pipeline>)."""
+        return {t.name: t for t in (slot.thread for slot in self._slots.values()) if t is not None}
+
+    def due(self, now: float) -> list[PipelineSpec]:
+        """Pipelines to capture for this tick (advances their schedule)."""
+        out: list[PipelineSpec] = []
+        for slot in self._slots.values():
+            with slot.cond:
+                if slot.failed or now < slot.next_due:
+                    continue
+                slot.next_due += slot.period_s
+                if slot.next_due <= now:
+                    # Behind schedule (first tick, or the loop stalled): resync, no catch-up burst.
+                    slot.next_due = now + slot.period_s
+                if slot.busy or slot.job is not None:
+                    slot.skipped_busy += 1
+                    slot.m_skipped.inc()
+                    continue
+                out.append(slot.spec)
+        return out
+
+    def submit(self, name: str, roi: np.ndarray, ts_ms: int) -> None:
+        slot = self._slots[name]
+        with slot.cond:
+            slot.job = (roi, ts_ms)
+            slot.cond.notify()
+
+    def stats(self) -> list[PipelineStats]:
+        out: list[PipelineStats] = []
+        for slot in self._slots.values():
+            with slot.cond:
+                out.append(
+                    PipelineStats(
+                        name=slot.spec.name,
+                        runs=slot.runs,
+                        skipped_busy=slot.skipped_busy,
+                        deferred=slot.deferred,
+                        last_ms=slot.last_ms,
+                        avg_ms=(slot.total_ms / slot.runs) if slot.runs else 0.0,
+                        max_ms=slot.max_ms,
+                    )
+                )
+        return out
+
+    def _worker(self, slot: _Slot) -> None:
+        try:
+            pipeline = slot.factory()
+        except Exception as e:
+            print(f"[PipelineScheduler] {slot.spec.name} disabled, init failed: {e!r}")
+            with slot.cond:
+                slot.failed = True
+            return
+        try:
+            self._run(slot, pipeline)
+        finally:
+            try:
+                pipeline.close()
+            except Exception as e:
+                print(f"[PipelineScheduler] close {slot.spec.name} failed: {e!r}")
+
+    def _run(self, slot: _Slot, pipeline: RoiPipeline) -> None:
+        while True:
+            with slot.cond:
+                while slot.job is None and not self._stop.is_set():
+                    slot.cond.wait()
+                job = slot.job
+                if self._stop.is_set() or job is None:
+                    return
+                roi, ts_ms = job
+                slot.job = None
+                slot.busy = True
+
+            t0 = time.perf_counter()
+            try:
+                pipeline.step(roi, ts_ms)
+            except Exception as e:
+                print(f"[PipelineScheduler] {slot.spec.name} step failed: {e!r}")
+            t1 = time.perf_counter()
+            ms = (t1 - t0) * 1000.0
+            slot.m_seconds.observe(t1 - t0)
+
+            with slot.cond:
+                slot.busy = False
+                slot.runs += 1
+                slot.last_ms = ms
+                slot.total_ms += ms
+                slot.max_ms = max(slot.max_ms, ms)
+                if ms > slot.spec.budget_ms:
+                    slot.deferred += 1
+                    slot.m_deferred.inc()
+                    backoff = math.ceil(ms / slot.spec.budget_ms)
+                    slot.next_due = max(slot.next_due, t1 + backoff * slot.period_s)
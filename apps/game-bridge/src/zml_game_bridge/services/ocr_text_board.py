@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from zml_game_bridge.inputs.ocr.pipelines.text.model import OcrText
+
+
+class OcrTextBoard:
+    """
+    Latest OCR text per UI panel (finder, deeds, ...).
+
+    - on_text() is the TextPipeline sink (scheduler worker threads); pipelines emit only on change
+    - latest() serves GET /ocr/text
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._latest: dict[str, OcrText] = {}
+        self._updates = 0
+
+    def on_text(self, text: OcrText) -> None:
+        with self._lock:
+            self._latest[text.source] = text
+            self._updates += 1
+
+    def latest(self) -> list[OcrText]:
+        """One entry per source that has produced text, ordered by source name."""
+        with self._lock:
+            return [self._latest[k] for k in sorted(self._latest)]
+
+    @property
+    def updates(self) -> int:
+        return self._updates
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition
+from zml_game_bridge.storage.position_store import PositionRow
+
+
+@dataclass(frozen=True, slots=True)
+class TrackSlice:
+    ts_ms: np.ndarray  # int64
+    x: np.ndarray  # int32
+    y: np.ndarray  # int32
+
+    def __len__(self) -> int:
+        return int(self.ts_ms.shape[0])
+
+    @classmethod
+    def empty(cls) -> TrackSlice:
+        return cls(
+            ts_ms=np.empty(0, dtype=np.int64),
+            x=np.empty(0, dtype=np.int32),
+            y=np.empty(0, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple[int, int, int]]) -> TrackSlice:
+        if not rows:
+            return cls.empty()
+        arr = np.asarray(rows, dtype=np.int64)
+        return cls(ts_ms=arr[:, 0], x=arr[:, 1].astype(np.int32), y=arr[:, 2].astype(np.int32))
+
+    @classmethod
+    def concat(cls, parts: list[TrackSlice]) -> TrackSlice:
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        return cls(
+            ts_ms=np.concatenate([p.ts_ms for p in parts]),
+            x=np.concatenate([p.x for p in parts]),
+            y=np.concatenate([p.y for p in parts]),
+        )
+
+    def take(self, idx: np.ndarray) -> TrackSlice:
+        return TrackSlice(ts_ms=self.ts_ms[idx], x=self.x[idx], y=self.y[idx])
+
+
+class PositionTrack:
+    """
+    In-memory history of OCR positions.
+
+    - append() is called from the OCR thread (one fix = 16 bytes in preallocated arrays)
+    - drain_pending() is called from the DB writer thread, which batches rows into SQLite
+    - read_range() serves API threads from memory; older ranges live only in SQLite
+
+    ts_ms is assumed non-decreasing (wall clock of the OCR loop). The planet is kept per
+    point as a small code (interned names, 0 = unknown) so ranges can be filtered by it.
+    """
+
+    def __init__(self, *, capacity: int = 200_000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._capacity = capacity
+        self._ts = np.zeros(capacity, dtype=np.int64)
+        self._x = np.zeros(capacity, dtype=np.int32)
+        self._y = np.zeros(capacity, dtype=np.int32)
+        self._planet = np.zeros(capacity, dtype=np.int16)
+        self._planet_codes: dict[str, int] = {}
+        self._start = 0
+        self._count = 0
+
+        # Not yet in SQLite. Bounded: if the writer stalls, the oldest rows are dropped.
+        self._pending: deque[PositionRow] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def append(self, pos: OcrPosition) -> None:
+        p = pos.position
+        with self._lock:
+            i = (self._start + self._count) % self._capacity
+            if self._count < self._capacity:
+                self._count += 1
+            else:
+                self._start = (self._start + 1) % self._capacity
+            self._ts[i] = pos.ts_ms
+            self._x[i] = p.x
+            self._y[i] = p.y
+            self._planet[i] = self._planet_code(p.planet_name)
+            self._pending.append((pos.ts_ms, p.planet_name, p.x, p.y, p.z))
+
+    def drain_pending(self) -> list[PositionRow]:
+        with self._lock:
+            rows = list(self._pending)
+            self._pending.clear()
+        return rows
+
+    def oldest_ts_ms(self) -> int | None:
+        with self._lock:
+            return int(self._ts[self._start]) if self._count else None
+
+    def read_range(
+        self, from_ts_ms: int, to_ts_ms: int, *, planet: str | None = None
+    ) -> TrackSlice:
+        """
+        Points with from_ts_ms <= ts_ms <= to_ts_ms held in memory (copies);
+        only those on `planet` when given.
+        """
+        with self._lock:
+            if self._count == 0:
+                return TrackSlice.empty()
+            if planet is not None and planet not in self._planet_codes:
+                return TrackSlice.empty()
+            order = (np.arange(self._count) + self._start) % self._capacity
+            ts = self._ts[order]
+            lo = int(np.searchsorted(ts, from_ts_ms, side="left"))
+            hi = int(np.searchsorted(ts, to_ts_ms, side="right"))
+            sel = order[lo:hi]
+            if planet is not None:
+                sel = sel[self._planet[sel] == self._planet_codes[planet]]
+            return TrackSlice(ts_ms=self._ts[sel], x=self._x[sel], y=self._y[sel])
+
+    def _planet_code(self, name: str | None) -> int:
+        if name is None:
+            return 0
+        code = self._planet_codes.get(name)
+        if code is None:
+            # 1-based; int16 is plenty for planet names.
+            code = self._planet_codes[name] = len(self._planet_codes) + 1
+        return code
+
+
+def douglas_peucker(x: np.ndarray, y: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Indices of the points kept by Douglas-Peucker (always includes first and last).
+    Iterative; the distance pass per segment is vectorized.
+    """
+    n = int(x.shape[0])
+    if n <= 2:
+        return np.arange(n)
+
+    xs = x.astype(np.float64)
+    ys = y.astype(np.float64)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack: list[tuple[int, int]] = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        px, py = xs[a], ys[a]
+        dx, dy = xs[b] - px, ys[b] - py
+        sx, sy = xs[a + 1 : b] - px, ys[a + 1 : b] - py
+        norm = float(np.hypot(dx, dy))
+        dist = np.hypot(sx, sy) if norm == 0.0 else np.abs(dx * sy - dy * sx) / norm
+        i = int(np.argmax(dist))
+        if float(dist[i]) > epsilon:
+            k = a + 1 + i
+            keep[k] = True
+            stack.append((a, k))
+            stack.append((k, b))
+
+    return np.flatnonzero(keep)
+
+
+def simplify_track(track: TrackSlice, *, tolerance: float, max_points: int) -> TrackSlice:
+    """
+    Douglas-Peucker with `tolerance` (world units); while the result is still over
+    max_points, double the tolerance and simplify again. Bounded output for the UI.
+    """
+    if max_points < 2:
+        raise ValueError("max_points must be >= 2")
+
+    out = track
+    eps = max(tolerance, 0.0)
+    if eps > 0.0:
+        out = out.take(douglas_peucker(out.x, out.y, eps))
+    eps = max(eps, 1.0)
+    while len(out) > max_points:
+        eps *= 2.0
+        out = out.take(douglas_peucker(out.x, out.y, eps))
+    return out
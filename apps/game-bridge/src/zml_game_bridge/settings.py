@@ -89,3 +89,28 @@ class Settings:
     # chat_log_path: Path | None = find_entropia_chat_log()
     chat_log_path: Path = Path("testing/chat.log")
 
+    # False: no OCR thread at all (headless load tests, non-Windows dev)
+    ocr_enabled: bool = True
+
+    # OCR replay (headless profiling): directory of frames or raw video file instead of the game window
+    ocr_replay_path: Path | None = None
+    ocr_replay_hz: float | None = None
+    ocr_replay_width: int = 2560
+    ocr_replay_height: int = 1440
+
+    # Tesseract instances reading ROIs in parallel (1 = single engine on the OCR thread)
+    ocr_engine_pool_size: int = 2
+    # One Tesseract pass over lon+lat stacked into one image (replaces the pool when on)
+    ocr_engine_batch: bool = False
+
+    # /admin routes: GET /admin/profile (sampling profiler over the runtime threads) and
+    # GET/PUT /admin/tracing; off = they answer 404
+    profiler_enabled: bool = False
+    # Per-event stage stamps (chat.log -> SSE) at startup; switchable at runtime via /admin/tracing
+    # when profiler_enabled is on
+    tracing_enabled: bool = False
+
+    # /health: a loop silent this long counts as stalled (503); OCR below this rate is "degraded"
+    health_stall_s: float = 5.0
+    health_min_ocr_hz: float = 5.0
+
@@ -73,6 +73,20 @@ CREATE INDEX IF NOT EXISTS idx_events_created_ts_ms ON events(created_ts_ms);
 CREATE INDEX IF NOT EXISTS idx_events_event_type ON events(event_type);
 CREATE INDEX IF NOT EXISTS idx_events_run_id_event_id ON events(run_id, event_id);
 
+-- =========================
+-- OCR position track (high-frequency, not events)
+-- =========================
+CREATE TABLE IF NOT EXISTS positions (
+    position_id     INTEGER PRIMARY KEY,
+    ts_ms           INTEGER NOT NULL,
+    planet_name     TEXT,
+    x               INTEGER NOT NULL,
+    y               INTEGER NOT NULL,
+    z               INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_positions_ts_ms ON positions(ts_ms);
+
 -- =========================
 -- App state:
 -- which run is currently "selected/active" after restart
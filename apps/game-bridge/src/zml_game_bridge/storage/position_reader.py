@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from zml_game_bridge.storage.sqlite import open_sqlite
+
+
+class PositionReader:
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    def open(self) -> None:
+        self._conn = open_sqlite(self._db_path)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def read_range(
+        self, from_ts_ms: int, to_ts_ms: int, *, planet: str | None = None
+    ) -> list[tuple[int, int, int]]:
+        """(ts_ms, x, y) with from_ts_ms <= ts_ms <= to_ts_ms, ascending; only `planet` when given."""
+        assert self._conn is not None, "PositionReader not opened"
+        if planet is None:
+            cur = self._conn.execute(
+                """
+                SELECT ts_ms, x, y
+                FROM positions
+                WHERE ts_ms BETWEEN ? AND ?
+                ORDER BY ts_ms ASC
+                """,
+                (from_ts_ms, to_ts_ms),
+            )
+        else:
+            cur = self._conn.execute(
+                """
+                SELECT ts_ms, x, y
+                FROM positions
+                WHERE ts_ms BETWEEN ? AND ? AND planet_name = ?
+                ORDER BY ts_ms ASC
+                """,
+                (from_ts_ms, to_ts_ms, planet),
+            )
+        cur.row_factory = None  # plain tuples: cheaper than sqlite3.Row for bulk reads
+        return cur.fetchall()
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Sequence
+
+# (ts_ms, planet_name, x, y, z)
+PositionRow = tuple[int, str | None, int, int, int | None]
+
+
+class PositionStore:
+    """
+    Write access for the positions table.
+    Assumption: used from the single-writer DB thread.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def append_many(self, rows: Sequence[PositionRow]) -> None:
+        """Insert a batch in one transaction."""
+        if not rows:
+            return
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO positions (ts_ms, planet_name, x, y, z)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
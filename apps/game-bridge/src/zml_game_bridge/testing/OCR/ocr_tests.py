@@ -3,17 +3,25 @@ from __future__ import annotations
 
 import argparse
 import csv
+import json
+import os
 import re
 import time
-from dataclasses import dataclass
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 import pytesseract
 from PIL import Image
 
+from zml_game_bridge.inputs.ocr.pipelines.position.cached_engine import CachedDigitsEngine
+from zml_game_bridge.inputs.ocr.pipelines.position.engine import TesserDigitsEngine
+from zml_game_bridge.inputs.ocr.pipelines.position.template_engine import TemplateDigitsEngine
+from zml_game_bridge.testing.OCR.packed import PackedDataset
 from zml_game_bridge.testing.OCR.preprocess import (
     PreprocessConfig,
     PreprocessVariant,
@@ -22,13 +30,19 @@ from zml_game_bridge.testing.OCR.preprocess import (
 
 _FILENAME_RE = re.compile(r"^(?P<id>.+)_(?P<expected>\d+)$")
 
+# A line image: PNG path, or index into the packed dataset (--packed).
+LineRef = Union[Path, int]
+
+# Opened once per process (workers re-open the memory map; pages are shared).
+_packed: Optional[PackedDataset] = None
+
 
 @dataclass(frozen=True, slots=True)
 class Sample:
     sample_id: str
-    lon_path: Path
+    lon_path: LineRef
     lon_expected: int
-    lat_path: Path
+    lat_path: LineRef
     lat_expected: int
 
 
@@ -39,6 +53,9 @@ class LineResult:
     expected: int
     predicted: Optional[int]
     ok: bool
+    ms_decode: float
+    ms_preprocess: float
+    ms_ocr: float
     ms_total: float
 
 
@@ -104,6 +121,41 @@ def _collect_samples(root: Path) -> List[Sample]:
     return samples
 
 
+def _collect_packed_samples(ds: PackedDataset) -> List[Sample]:
+    lon_map: Dict[str, Tuple[int, int]] = {}
+    lat_map: Dict[str, Tuple[int, int]] = {}
+    for i in range(len(ds)):
+        m = lon_map if str(ds.kinds[i]) == "lon" else lat_map
+        m[str(ds.sample_ids[i])] = (i, int(ds.labels[i]))
+
+    missing = set(lon_map) ^ set(lat_map)
+    if missing:
+        raise ValueError(f"Missing pairs in packed dataset: {len(missing)}")
+
+    return [
+        Sample(
+            sample_id=sid,
+            lon_path=lon_map[sid][0],
+            lon_expected=lon_map[sid][1],
+            lat_path=lat_map[sid][0],
+            lat_expected=lat_map[sid][1],
+        )
+        for sid in sorted(lon_map)
+    ]
+
+
+def _open_packed(path: Optional[Path]) -> None:
+    global _packed
+    _packed = PackedDataset(path) if path is not None else None
+
+
+def _load_line(ref: LineRef) -> np.ndarray:
+    if isinstance(ref, int):
+        assert _packed is not None, "packed sample without --packed"
+        return _packed.image(ref)
+    return _read_gray(ref)
+
+
 def _read_gray(path: Path) -> np.ndarray:
     """
     Read as grayscale uint8.
@@ -182,6 +234,54 @@ class TesserOcrBackend(OcrBackend):
         self._api.End()
 
 
+class TemplateBackend(OcrBackend):
+    """
+    Template-matching digit reader (no Tesseract). Needs a binary white-background
+    variant (p3); on grayscale variants it rejects everything.
+    """
+
+    def __init__(self, templates_path: Optional[Path] = None) -> None:
+        self.name = "template"
+        self._engine = TemplateDigitsEngine(templates_path=templates_path)
+
+    def ocr_line(self, img_u8: np.ndarray) -> str:
+        return self._engine.recognize_digits(img_u8)
+
+    def close(self) -> None:
+        self._engine.close()
+
+
+class _BackendAsEngine:
+    """Adapts an OcrBackend to the DigitsEngine interface."""
+
+    def __init__(self, backend: OcrBackend) -> None:
+        self._backend = backend
+
+    def recognize_digits(self, img_u8: np.ndarray) -> str:
+        return self._backend.ocr_line(img_u8)
+
+    def recognize_many(self, imgs: Sequence[np.ndarray]) -> List[str]:
+        return [self._backend.ocr_line(img) for img in imgs]
+
+    def close(self) -> None:
+        if hasattr(self._backend, "close"):
+            self._backend.close()  # type: ignore[attr-defined]
+
+
+class CachedBackend(OcrBackend):
+    """Any backend behind CachedDigitsEngine (the production recognition cache)."""
+
+    def __init__(self, inner: OcrBackend, *, max_entries: int) -> None:
+        self.name = f"{inner.name}+cache"
+        self.engine = CachedDigitsEngine(_BackendAsEngine(inner), max_entries=max_entries)
+
+    def ocr_line(self, img_u8: np.ndarray) -> str:
+        return self.engine.recognize_digits(img_u8)
+
+    def close(self) -> None:
+        self.engine.close()
+
+
 def _run_one_line(
     *,
     backend: OcrBackend,
@@ -189,14 +289,17 @@ def _run_one_line(
     variant: PreprocessVariant,
     sample_id: str,
     kind: str,
-    path: Path,
+    path: LineRef,
     expected: int,
 ) -> LineResult:
     t0 = time.perf_counter()
-
-    img = _read_gray(path)
+    img = _load_line(path)
+    t1 = time.perf_counter()
     pre = preprocess_line(img, variant=variant, cfg=cfg)
+    t2 = time.perf_counter()
     raw_text = backend.ocr_line(pre)
+    t3 = time.perf_counter()
+
     digits = _digits_only(raw_text)
 
     predicted: Optional[int]
@@ -212,7 +315,6 @@ def _run_one_line(
         predicted = None
 
     ok = (predicted == expected)
-    ms_total = (time.perf_counter() - t0) * 1000.0
 
     return LineResult(
         sample_id=sample_id,
@@ -220,10 +322,241 @@ def _run_one_line(
         expected=expected,
         predicted=predicted,
         ok=ok,
-        ms_total=ms_total,
+        ms_decode=(t1 - t0) * 1000.0,
+        ms_preprocess=(t2 - t1) * 1000.0,
+        ms_ocr=(t3 - t2) * 1000.0,
+        ms_total=(t3 - t0) * 1000.0,
     )
 
 
+def _run_samples(
+    *,
+    backend: OcrBackend,
+    cfg: PreprocessConfig,
+    variant: PreprocessVariant,
+    samples: List[Sample],
+) -> List[LineResult]:
+    line_results: List[LineResult] = []
+    for s in samples:
+        line_results.append(
+            _run_one_line(
+                backend=backend,
+                cfg=cfg,
+                variant=variant,
+                sample_id=s.sample_id,
+                kind="lon",
+                path=s.lon_path,
+                expected=s.lon_expected,
+            )
+        )
+        line_results.append(
+            _run_one_line(
+                backend=backend,
+                cfg=cfg,
+                variant=variant,
+                sample_id=s.sample_id,
+                kind="lat",
+                path=s.lat_path,
+                expected=s.lat_expected,
+            )
+        )
+    return line_results
+
+
+def _make_backend(name: str, *, templates: Optional[Path] = None, cache: int = 0) -> OcrBackend:
+    backend: OcrBackend
+    if name == "pytesseract":
+        backend = PyTesseractBackend()
+    elif name == "tesserocr":
+        backend = TesserOcrBackend()
+    elif name == "template":
+        backend = TemplateBackend(templates)
+    else:
+        raise ValueError(f"Unknown backend: {name}")
+    if cache > 0:
+        backend = CachedBackend(backend, max_entries=cache)
+    return backend
+
+
+# Process-pool worker state: one backend (one Tesseract instance) per worker process.
+_worker_backend: Optional[OcrBackend] = None
+
+
+def _init_worker(name: str, templates: Optional[Path], cache: int, packed: Optional[Path]) -> None:
+    global _worker_backend
+    _open_packed(packed)
+    _worker_backend = _make_backend(name, templates=templates, cache=cache)
+
+
+def _cache_counts(backend: Optional[OcrBackend]) -> Tuple[int, int]:
+    if isinstance(backend, CachedBackend):
+        st = backend.engine.stats()
+        return st.hits, st.misses
+    return 0, 0
+
+
+def _run_chunk(
+    job: Tuple[PreprocessVariant, PreprocessConfig, List[Sample]],
+) -> Tuple[List[LineResult], int, int]:
+    """Worker: run one chunk of samples; also returns this chunk's cache hits/misses."""
+    variant, cfg, samples = job
+    assert _worker_backend is not None
+    h0, m0 = _cache_counts(_worker_backend)
+    results = _run_samples(backend=_worker_backend, cfg=cfg, variant=variant, samples=samples)
+    h1, m1 = _cache_counts(_worker_backend)
+    return results, h1 - h0, m1 - m0
+
+
+class _Runner:
+    """Runs sample sets on one backend, in-process (workers=1) or fanned out over processes."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        templates: Optional[Path],
+        cache: int,
+        workers: int,
+        packed: Optional[Path] = None,
+    ) -> None:
+        # Built in the parent too: fails fast (e.g. tesserocr missing) and serves workers=1.
+        self._backend = _make_backend(name, templates=templates, cache=cache)
+        self.name = self._backend.name
+        self.workers = max(1, workers)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(name, templates, cache, packed),
+            )
+
+    def run(self, variant: PreprocessVariant, cfg: PreprocessConfig, samples: List[Sample]) -> List[LineResult]:
+        if self._pool is None:
+            return self.run_local(variant, cfg, samples)
+
+        # ~4 chunks per worker: balances load without per-sample IPC.
+        n_chunks = self.workers * 4
+        size = max(1, -(-len(samples) // n_chunks))
+        jobs = [(variant, cfg, samples[i : i + size]) for i in range(0, len(samples), size)]
+        results: List[LineResult] = []
+        for chunk, hits, misses in self._pool.map(_run_chunk, jobs):
+            results.extend(chunk)
+            self.cache_hits += hits
+            self.cache_misses += misses
+        return results
+
+    def run_local(self, variant: PreprocessVariant, cfg: PreprocessConfig, samples: List[Sample]) -> List[LineResult]:
+        """In this process, on the parent backend (and its cache) whatever `workers` is."""
+        h0, m0 = _cache_counts(self._backend)
+        results = _run_samples(backend=self._backend, cfg=cfg, variant=variant, samples=samples)
+        h1, m1 = _cache_counts(self._backend)
+        self.cache_hits += h1 - h0
+        self.cache_misses += m1 - m0
+        return results
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+        if hasattr(self._backend, "close"):
+            try:
+                self._backend.close()  # type: ignore[attr-defined]
+            except Exception:
+                pass
+
+
+def _batch_parity(samples: List[Sample], variant: PreprocessVariant, cfg: PreprocessConfig) -> Dict[str, float]:
+    """
+    TesserDigitsEngine per line vs recognize_batch([lon, lat]) on the same
+    preprocessed lines: how often the answers differ, accuracy and ms per pair.
+    """
+    engine = TesserDigitsEngine()
+    mismatches = single_ok = batch_ok = 0
+    t_single = t_batch = 0.0
+
+    def parse(text: str) -> Optional[int]:
+        digits = _digits_only(text)
+        return int(digits) if digits else None
+
+    try:
+        for s in samples:
+            lines = [
+                preprocess_line(_load_line(s.lon_path), variant=variant, cfg=cfg),
+                preprocess_line(_load_line(s.lat_path), variant=variant, cfg=cfg),
+            ]
+            expected = [s.lon_expected, s.lat_expected]
+
+            t0 = time.perf_counter()
+            single = [parse(engine.recognize_digits(img)) for img in lines]
+            t1 = time.perf_counter()
+            batch = [parse(t) for t in engine.recognize_batch(lines)]
+            t2 = time.perf_counter()
+
+            t_single += t1 - t0
+            t_batch += t2 - t1
+            mismatches += sum(1 for a, b in zip(single, batch, strict=True) if a != b)
+            single_ok += sum(1 for a, e in zip(single, expected, strict=True) if a == e)
+            batch_ok += sum(1 for b, e in zip(batch, expected, strict=True) if b == e)
+    finally:
+        engine.close()
+
+    n = max(1, len(samples))
+    return {
+        "lines": 2 * len(samples),
+        "mismatches": mismatches,
+        "single_ok": single_ok,
+        "batch_ok": batch_ok,
+        "single_ms_pair": 1000.0 * t_single / n,
+        "batch_ms_pair": 1000.0 * t_batch / n,
+    }
+
+
+_STAGES = ("decode", "preprocess", "ocr", "total")
+
+
+def _stage_stats(lines: List[LineResult]) -> Dict[str, Dict[str, float]]:
+    """Per-stage latency distribution (ms): mean, p50, p95, p99, max."""
+    out: Dict[str, Dict[str, float]] = {}
+    for stage in _STAGES:
+        xs = np.asarray([getattr(r, f"ms_{stage}") for r in lines], dtype=np.float64)
+        if xs.size == 0:
+            out[stage] = {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+            continue
+        p50, p95, p99 = np.percentile(xs, [50, 95, 99])
+        out[stage] = {
+            "mean": float(xs.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "max": float(xs.max()),
+        }
+    return out
+
+
+def _format_stage_stats(stats: Dict[str, Dict[str, float]]) -> str:
+    return "\n".join(
+        f"{stage:>10}: p50={st['p50']:.3f} p95={st['p95']:.3f} p99={st['p99']:.3f} "
+        f"mean={st['mean']:.3f} max={st['max']:.3f} ms"
+        for stage, st in stats.items()
+    )
+
+
+def _accuracy(lines: List[LineResult], pairs: List[PairResult]) -> Dict[str, Dict[str, int]]:
+    out: Dict[str, Dict[str, int]] = {}
+    for kind in ("lon", "lat"):
+        xs = [r for r in lines if r.kind == kind]
+        out[kind] = {
+            "total": len(xs),
+            "ok": sum(1 for r in xs if r.ok),
+            "none": sum(1 for r in xs if r.predicted is None),
+            "fp": sum(1 for r in xs if r.predicted is not None and not r.ok),
+        }
+    out["pair"] = {"total": len(pairs), "ok": sum(1 for p in pairs if p.pair_ok)}
+    return out
+
+
 def _summarize(lines: List[LineResult], pairs: List[PairResult]) -> str:
     def _stats(kind: str) -> Tuple[int, int, int, float]:
         xs = [r for r in lines if r.kind == kind]
@@ -280,16 +613,21 @@ def _write_failures_csv(path: Path, results: List[LineResult]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
-        w.writerow(["sample_id", "kind", "expected", "predicted", "ok", "ms_total"])
+        w.writerow(["sample_id", "kind", "expected", "predicted", "ok", "ms_decode", "ms_preprocess", "ms_ocr", "ms_total"])
         for r in results:
             if r.ok:
                 continue
-            w.writerow([r.sample_id, r.kind, r.expected, r.predicted, r.ok, f"{r.ms_total:.3f}"])
+            w.writerow([
+                r.sample_id, r.kind, r.expected, r.predicted, r.ok,
+                f"{r.ms_decode:.3f}", f"{r.ms_preprocess:.3f}", f"{r.ms_ocr:.3f}", f"{r.ms_total:.3f}",
+            ])
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--root", type=Path, required=True, help="Dataset root with 'lon/' and 'lat/' folders")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--root", type=Path, help="Dataset root with 'lon/' and 'lat/' folders")
+    src.add_argument("--packed", type=Path, help="Packed dataset dir (see packed.py / prepare_files.py)")
     ap.add_argument("--out", type=Path, default=Path("out_ocr_tests"), help="Output folder for reports")
     ap.add_argument(
         "--variants",
@@ -301,12 +639,41 @@ def main() -> int:
         "--backends",
         nargs="*",
         default=["pytesseract", "tesserocr"],
-        help="OCR backends to run (tesserocr is optional if installed)",
+        help="OCR backends to run: pytesseract, tesserocr, template (tesserocr is optional if installed)",
+    )
+    ap.add_argument(
+        "--templates",
+        type=Path,
+        default=None,
+        help="Digit templates .npz for the template backend (default: resources/digit_templates.npz)",
     )
     ap.add_argument("--limit", type=int, default=0, help="Limit samples (0 = all)")
+    ap.add_argument(
+        "--cache",
+        type=int,
+        default=0,
+        help="Wrap each backend in CachedDigitsEngine with this many entries and check parity (0 = off)",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes, each with its own backend instance (1 = in-process)",
+    )
+    ap.add_argument(
+        "--batch",
+        action="store_true",
+        help="With tesserocr: compare TesserDigitsEngine single-line reads against recognize_batch([lon, lat])",
+    )
+    ap.add_argument("--report", type=Path, default=None, help="JSON report path (default: <out>/report.json)")
     args = ap.parse_args()
 
-    samples = _collect_samples(args.root)
+    if args.packed is not None:
+        _open_packed(args.packed)
+        assert _packed is not None
+        samples = _collect_packed_samples(_packed)
+    else:
+        samples = _collect_samples(args.root)
     if args.limit and args.limit > 0:
         samples = samples[: args.limit]
 
@@ -316,68 +683,95 @@ def main() -> int:
     for v in args.variants:
         requested_variants.append(v)  # type: ignore[arg-type]
 
-    backends: List[OcrBackend] = []
+    runners: List[_Runner] = []
     for b in args.backends:
-        if b == "pytesseract":
-            backends.append(PyTesseractBackend())
-        elif b == "tesserocr":
-            try:
-                backends.append(TesserOcrBackend())
-            except Exception as e:
-                print(f"[WARN] Skipping tesserocr: {e}")
-        else:
-            raise ValueError(f"Unknown backend: {b}")
+        try:
+            runners.append(
+                _Runner(b, templates=args.templates, cache=args.cache, workers=args.workers, packed=args.packed)
+            )
+        except Exception as e:
+            print(f"[WARN] Skipping {b}: {e}")
 
-    if not backends:
+    if not runners:
         print("No OCR backends available.")
         return 2
 
     args.out.mkdir(parents=True, exist_ok=True)
-
-    for backend in backends:
+    report: Dict[str, object] = {
+        "root": str(args.packed or args.root),
+        "samples": len(samples),
+        "workers": args.workers,
+        "preprocess_config": asdict(cfg),
+        "runs": [],
+    }
+    runs: List[Dict[str, object]] = report["runs"]  # type: ignore[assignment]
+
+    for runner in runners:
         for variant in requested_variants:
-            line_results: List[LineResult] = []
-
-            for s in samples:
-                line_results.append(
-                    _run_one_line(
-                        backend=backend,
-                        cfg=cfg,
-                        variant=variant,
-                        sample_id=s.sample_id,
-                        kind="lon",
-                        path=s.lon_path,
-                        expected=s.lon_expected,
-                    )
-                )
-                line_results.append(
-                    _run_one_line(
-                        backend=backend,
-                        cfg=cfg,
-                        variant=variant,
-                        sample_id=s.sample_id,
-                        kind="lat",
-                        path=s.lat_path,
-                        expected=s.lat_expected,
-                    )
-                )
+            t0 = time.perf_counter()
+            line_results = runner.run(variant, cfg, samples)
+            wall_s = time.perf_counter() - t0
 
             pairs = _build_pairs(line_results)
             summary = _summarize(line_results, pairs)
+            stages = _stage_stats(line_results)
 
             print("\n" + "=" * 80)
-            print(f"backend={backend.name} variant={variant}")
+            print(f"backend={runner.name} variant={variant} workers={runner.workers}")
             print(summary)
+            print(_format_stage_stats(stages))
+            print(f"wall={wall_s:.2f}s lines/s={len(line_results) / wall_s if wall_s > 0 else 0.0:.1f}")
 
-            fail_csv = args.out / f"failures__{backend.name}__{variant}.csv"
+            fail_csv = args.out / f"failures__{runner.name}__{variant}.csv"
             _write_failures_csv(fail_csv, line_results)
 
-        # Close backend if needed
-        if hasattr(backend, "close"):
-            try:
-                backend.close()  # type: ignore[attr-defined]
-            except Exception:
-                pass
+            run: Dict[str, object] = {
+                "backend": runner.name,
+                "variant": variant,
+                "accuracy": _accuracy(line_results, pairs),
+                "timing_ms": stages,
+                "wall_s": wall_s,
+                "lines_per_s": (len(line_results) / wall_s) if wall_s > 0 else 0.0,
+            }
+
+            if args.cache > 0:
+                # Second pass is served from the cache; it must reproduce the first pass exactly.
+                # Both passes stay in this process: over the pool, a chunk's second pass may land
+                # on a worker whose cache never saw it, and the hit rate would follow scheduling.
+                if runner.workers > 1:
+                    runner.run_local(variant, cfg, samples)  # warm this process's cache
+                runner.cache_hits = runner.cache_misses = 0
+                again = runner.run_local(variant, cfg, samples)
+                mismatches = sum(1 for a, b in zip(line_results, again, strict=True) if a.predicted != b.predicted)
+                total = runner.cache_hits + runner.cache_misses
+                hit_rate = (runner.cache_hits / total) if total else 0.0
+                print(
+                    f"Cache parity: mismatches={mismatches}/{len(again)}, "
+                    f"hits={runner.cache_hits} misses={runner.cache_misses} hit_rate={100.0 * hit_rate:.2f}%"
+                )
+                run["cache_parity"] = {"mismatches": mismatches, "hit_rate": hit_rate}
+
+            if args.batch and runner.name.startswith("tesserocr"):
+                try:
+                    bp = _batch_parity(samples, variant, cfg)
+                except RuntimeError as e:
+                    print(f"[WARN] Batch parity skipped: {e}")
+                else:
+                    print(
+                        f"Batch parity: mismatches={bp['mismatches']}/{bp['lines']}, "
+                        f"ok single={bp['single_ok']} batch={bp['batch_ok']}, "
+                        f"ms/pair single={bp['single_ms_pair']:.2f} batch={bp['batch_ms_pair']:.2f}"
+                    )
+                    run["batch_parity"] = bp
+
+            runs.append(run)
+
+        runner.close()
+
+    report_path = args.report or (args.out / "report.json")
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nReport: {report_path}")
 
     return 0
 
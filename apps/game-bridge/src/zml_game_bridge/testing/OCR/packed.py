@@ -0,0 +1,128 @@
+# packed.py
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+PIXELS_FILE = "pixels.npy"
+INDEX_FILE = "index.npz"
+
+
+@dataclass(frozen=True, slots=True)
+class PackedLine:
+    kind: str  # "lon" | "lat"
+    sample_id: str
+    expected: int
+    img: np.ndarray  # read-only view into the memory map
+
+
+class PackedDataset:
+    """
+    The labelled lon/lat crops as one directory:
+
+    - pixels.npy: every grayscale crop, row-major, concatenated into one uint8 array
+    - index.npz: kind, sample_id, expected value, offset and (h, w) per line
+
+    pixels.npy is memory-mapped, so opening is O(index) and image(i) is a view:
+    no PNG decode, no copy, and worker processes share the page cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._pixels = np.load(path / PIXELS_FILE, mmap_mode="r")
+        with np.load(path / INDEX_FILE) as idx:
+            self.kinds: np.ndarray = idx["kinds"]
+            self.sample_ids: np.ndarray = idx["sample_ids"]
+            self.labels: np.ndarray = idx["labels"]
+            self._offsets: np.ndarray = idx["offsets"]
+            self._shapes: np.ndarray = idx["shapes"]
+
+    @staticmethod
+    def is_packed(path: Path) -> bool:
+        return (path / PIXELS_FILE).is_file() and (path / INDEX_FILE).is_file()
+
+    @classmethod
+    def build(cls, root: Path, out: Path) -> PackedDataset:
+        """Pack every '<id>_<digits>.png' under root/lon and root/lat."""
+        kinds: list[str] = []
+        sample_ids: list[str] = []
+        labels: list[int] = []
+        imgs: list[np.ndarray] = []
+        for kind in ("lon", "lat"):
+            for p in sorted((root / kind).glob("*.png")):
+                sid, _, label = p.stem.partition("_")
+                img = cv2.imread(str(p), cv2.IMREAD_GRAYSCALE)
+                if img is None or not label.isdigit():
+                    print(f"[WARN] Skipping {p}")
+                    continue
+                kinds.append(kind)
+                sample_ids.append(sid)
+                labels.append(int(label))
+                imgs.append(np.ascontiguousarray(img, dtype=np.uint8))
+
+        sizes = np.asarray([img.size for img in imgs], dtype=np.int64)
+        offsets = np.zeros(len(imgs), dtype=np.int64)
+        if len(imgs) > 1:
+            np.cumsum(sizes[:-1], out=offsets[1:])
+
+        out.mkdir(parents=True, exist_ok=True)
+        pixels = np.lib.format.open_memmap(out / PIXELS_FILE, mode="w+", dtype=np.uint8, shape=(int(sizes.sum()),))
+        for img, off in zip(imgs, offsets, strict=True):
+            pixels[off : off + img.size] = img.reshape(-1)
+        pixels.flush()
+        del pixels
+
+        np.savez(
+            out / INDEX_FILE,
+            kinds=np.asarray(kinds, dtype="U3"),
+            sample_ids=np.asarray(sample_ids),
+            labels=np.asarray(labels, dtype=np.int64),
+            offsets=offsets,
+            shapes=np.asarray([img.shape for img in imgs], dtype=np.int32).reshape(-1, 2),
+        )
+        return cls(out)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._pixels.size)
+
+    def __len__(self) -> int:
+        return int(self.labels.shape[0])
+
+    def image(self, i: int) -> np.ndarray:
+        h, w = (int(v) for v in self._shapes[i])
+        off = int(self._offsets[i])
+        return self._pixels[off : off + h * w].reshape(h, w)
+
+    def find(self, kind: str, sample_id: str) -> int:
+        hits = np.flatnonzero((self.kinds == kind) & (self.sample_ids == sample_id))
+        if hits.size == 0:
+            raise KeyError((kind, sample_id))
+        return int(hits[0])
+
+    def lines(self, kind: str | None = None) -> Iterator[PackedLine]:
+        for i in range(len(self)):
+            k = str(self.kinds[i])
+            if kind is not None and k != kind:
+                continue
+            yield PackedLine(kind=k, sample_id=str(self.sample_ids[i]), expected=int(self.labels[i]), img=self.image(i))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Pack the labelled lon/lat PNGs into a memory-mappable dataset.")
+    ap.add_argument("--root", type=Path, required=True, help="Dataset root with 'lon/' and 'lat/' folders")
+    ap.add_argument("--out", type=Path, required=True, help="Output directory")
+    args = ap.parse_args()
+
+    ds = PackedDataset.build(args.root, args.out)
+    print(f"lines={len(ds)} bytes={ds.nbytes} -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
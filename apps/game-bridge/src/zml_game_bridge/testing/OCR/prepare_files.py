@@ -2,10 +2,13 @@
 from pathlib import Path
 from PIL import Image
 
+from zml_game_bridge.testing.OCR.packed import PackedDataset
+
 INPUT_DIR: Path = Path("player_coords")
 OUTPUT_TOP_DIR: Path = INPUT_DIR / "lon"
 OUTPUT_BOTTOM_DIR: Path = INPUT_DIR / "lat"
 LEFT_CROP: int = 42
+PACKED_DIR: Path = INPUT_DIR / "packed"
 
 def split_and_save(
     id: int,
@@ -77,5 +80,13 @@ def process_all(
             split_and_save(id, p, out_top, out_bottom)
             id += 1
 
+def pack(input_dir: Path = INPUT_DIR, out_dir: Path = PACKED_DIR) -> None:
+    """
+    Pakuje lon/lat do jednego zbioru (pixels.npy + index.npz) dla ocr_tests/sweep (--packed).
+    """
+    ds = PackedDataset.build(input_dir, out_dir)
+    print(f"Spakowano: {len(ds)} linii -> {out_dir}")
+
 if __name__ == "__main__":
     process_all()
+    pack()
@@ -0,0 +1,92 @@
+# preprocess_bench.py
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.preprocess import (
+    DigitsPreprocessConfig,
+    DigitsPreprocessor,
+)
+from zml_game_bridge.testing.OCR.preprocess import PreprocessConfig, preprocess_line
+
+
+def digits_config_from_p3(cfg: PreprocessConfig) -> DigitsPreprocessConfig:
+    """The production config that performs exactly the p3_tophat_otsu_cc steps."""
+    return DigitsPreprocessConfig(
+        upscale=cfg.upscale,
+        interpolation=cfg.interpolation,
+        tophat_kernel=cfg.tophat_kernel,
+        blur_ksize=cfg.p3_blur_ksize,
+        morph_close_kernel=cfg.p3_morph_close_kernel,
+        morph_close_iterations=cfg.p3_morph_close_iterations,
+        remove_small_cc=cfg.p3_remove_small_cc,
+        min_cc_area=cfg.p3_min_cc_area,
+        force_white_bg=cfg.p3_force_white_bg,
+    )
+
+
+def _load(root: Path) -> list[np.ndarray]:
+    out: list[np.ndarray] = []
+    for kind in ("lon", "lat"):
+        for p in sorted((root / kind).glob("*.png")):
+            img = cv2.imread(str(p), cv2.IMREAD_GRAYSCALE)
+            if img is not None:
+                out.append(img)
+    return out
+
+
+def _time_us(fn: Callable[[np.ndarray], np.ndarray], imgs: list[np.ndarray], repeat: int) -> list[float]:
+    per_line: list[float] = []
+    for _ in range(repeat):
+        for img in imgs:
+            t0 = time.perf_counter_ns()
+            fn(img)
+            per_line.append((time.perf_counter_ns() - t0) / 1000.0)
+    return per_line
+
+
+def _fmt(name: str, xs: list[float]) -> str:
+    xs = sorted(xs)
+    p95 = xs[min(len(xs) - 1, int(0.95 * len(xs)))]
+    return f"{name:<8} mean={statistics.fmean(xs):7.1f}us p50={statistics.median(xs):7.1f}us p95={p95:7.1f}us"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="p3 reference preprocessing vs buffer-reusing DigitsPreprocessor.")
+    ap.add_argument("--root", type=Path, required=True, help="Dataset root with 'lon/' and 'lat/' folders")
+    ap.add_argument("--repeat", type=int, default=20, help="Passes over the dataset per implementation")
+    args = ap.parse_args()
+
+    imgs = _load(args.root)
+    if not imgs:
+        print("No samples found.")
+        return 2
+
+    ref_cfg = PreprocessConfig()
+    pre = DigitsPreprocessor(digits_config_from_p3(ref_cfg))
+
+    mismatches = sum(
+        1 for img in imgs if not np.array_equal(preprocess_line(img, "p3_tophat_otsu_cc", ref_cfg), pre.process(img))
+    )
+    print(f"lines={len(imgs)} parity_mismatches={mismatches}")
+
+    def reference(img: np.ndarray) -> np.ndarray:
+        return preprocess_line(img, "p3_tophat_otsu_cc", ref_cfg)
+
+    before = _time_us(reference, imgs, args.repeat)
+    after = _time_us(pre.process, imgs, args.repeat)
+    print(_fmt("before", before))
+    print(_fmt("after", after))
+    print(f"speedup={statistics.fmean(before) / statistics.fmean(after):.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
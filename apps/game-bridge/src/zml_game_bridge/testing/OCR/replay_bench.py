@@ -0,0 +1,73 @@
+# replay_bench.py
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.capture.frame_source import FrameSource
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect
+from zml_game_bridge.inputs.ocr.capture.replay_source import open_replay_source
+from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition
+from zml_game_bridge.inputs.ocr.runner import start_ocr_input
+
+
+class _CountingSource:
+    """Wraps a FrameSource and counts frames handed to the OCR loop."""
+
+    def __init__(self, inner: FrameSource) -> None:
+        self._inner = inner
+        self.frames = 0
+
+    def grab(self) -> np.ndarray:
+        frame = self._inner.grab()
+        self.frames += 1
+        return frame
+
+    def grab_rois(self, rois: Sequence[RoiRect]) -> list[np.ndarray | None]:
+        out = self._inner.grab_rois(rois)
+        self.frames += 1
+        return out
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Run the OCR loop headless against recorded frames.")
+    ap.add_argument("--replay", type=Path, required=True, help="Frames directory or raw video file")
+    ap.add_argument("--width", type=int, default=2560, help="Raw video frame width")
+    ap.add_argument("--height", type=int, default=1440, help="Raw video frame height")
+    ap.add_argument("--hz", type=float, default=1000.0, help="OCR loop target rate (high = unthrottled)")
+    ap.add_argument("--seconds", type=float, default=10.0, help="Benchmark duration")
+    args = ap.parse_args()
+
+    source = _CountingSource(open_replay_source(args.replay, width=args.width, height=args.height))
+    positions: list[OcrPosition] = []
+    stop = threading.Event()
+    timer = threading.Timer(args.seconds, stop.set)
+
+    t0 = time.perf_counter()
+    timer.start()
+    try:
+        start_ocr_input(
+            position_sink=positions.append,
+            stop_event=stop,
+            target_hz=args.hz,
+            frame_source_factory=lambda: source,
+        )
+    finally:
+        timer.cancel()
+    elapsed = time.perf_counter() - t0
+
+    print(f"frames={source.frames} positions={len(positions)} elapsed_s={elapsed:.2f}")
+    print(f"achieved_hz={source.frames / elapsed:.1f} ms_per_frame={1000.0 * elapsed / max(1, source.frames):.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,458 @@
+# sweep.py
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import cast
+
+import cv2
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.cached_engine import CachedDigitsEngine
+from zml_game_bridge.inputs.ocr.pipelines.position.engine import DigitsEngine
+from zml_game_bridge.inputs.ocr.pipelines.position.preprocess import (
+    DigitsPreprocessConfig,
+    DigitsPreprocessor,
+    remove_small_components,
+)
+from zml_game_bridge.testing.OCR.packed import PackedDataset
+
+
+@dataclass(frozen=True, slots=True)
+class SearchSpace:
+    """Values tried per DigitsPreprocessConfig field; fields not listed keep their defaults."""
+
+    upscale: tuple[int, ...] = (2, 3, 4)
+    interpolation: tuple[int, ...] = (cv2.INTER_LINEAR, cv2.INTER_CUBIC)
+    tophat_kernel: tuple[tuple[int, int], ...] = ((7, 7), (9, 9), (11, 11), (13, 13))
+    blur_ksize: tuple[int, ...] = (0, 3)
+    morph_close_iterations: tuple[int, ...] = (0, 1, 2)
+    remove_small_cc: tuple[bool, ...] = (False, True)
+    min_cc_area: tuple[int, ...] = (8, 12, 20)
+
+
+SEARCH_SPACE = SearchSpace()
+
+# Stage-cache keys: the config fields each StagedPreprocessor stage depends on.
+_UpKey = tuple[int, int]
+_TophatKey = tuple[int, int, tuple[int, int]]
+_OtsuKey = tuple[int, int, tuple[int, int], int]
+
+
+@dataclass(frozen=True, slots=True)
+class Line:
+    kind: str
+    expected: int
+    img: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    cfg: DigitsPreprocessConfig
+    ok: int
+    total: int
+    ms_preprocess: float
+    ms_ocr: float
+
+    @property
+    def accuracy(self) -> float:
+        return (self.ok / self.total) if self.total else 0.0
+
+    @property
+    def ms_line(self) -> float:
+        return self.ms_preprocess + self.ms_ocr
+
+
+def load_lines(root: Path, *, packed: bool = False) -> list[Line]:
+    """
+    Every '<id>_<digits>.png' under lon/ and lat/, decoded once; with packed=True
+    root is a PackedDataset and the images are views into its memory map.
+    """
+    if packed:
+        return [Line(kind=ln.kind, expected=ln.expected, img=ln.img) for ln in PackedDataset(root).lines()]
+
+    out: list[Line] = []
+    for kind in ("lon", "lat"):
+        for p in sorted((root / kind).glob("*.png")):
+            _, _, label = p.stem.partition("_")
+            img = cv2.imread(str(p), cv2.IMREAD_GRAYSCALE)
+            if img is None or not label.isdigit():
+                print(f"[WARN] Skipping {p}")
+                continue
+            out.append(Line(kind=kind, expected=int(label), img=img))
+    return out
+
+
+def grid_configs(space: SearchSpace = SEARCH_SPACE) -> list[DigitsPreprocessConfig]:
+    out: list[DigitsPreprocessConfig] = []
+    seen: set[DigitsPreprocessConfig] = set()
+    for up, interp, tophat, blur, close_it, cc, cc_area in itertools.product(
+        space.upscale,
+        space.interpolation,
+        space.tophat_kernel,
+        space.blur_ksize,
+        space.morph_close_iterations,
+        space.remove_small_cc,
+        space.min_cc_area,
+    ):
+        cfg = _canonical(
+            DigitsPreprocessConfig(
+                upscale=up,
+                interpolation=interp,
+                tophat_kernel=tophat,
+                blur_ksize=blur,
+                morph_close_iterations=close_it,
+                remove_small_cc=cc,
+                min_cc_area=cc_area,
+            )
+        )
+        if cfg not in seen:
+            seen.add(cfg)
+            out.append(cfg)
+    return out
+
+
+def random_configs(
+    n: int,
+    *,
+    seed: int = 0,
+    space: SearchSpace = SEARCH_SPACE,
+) -> list[DigitsPreprocessConfig]:
+    rng = random.Random(seed)
+    grid = grid_configs(space)
+    return rng.sample(grid, min(n, len(grid)))
+
+
+_DEFAULT = DigitsPreprocessConfig()
+
+
+def _canonical(cfg: DigitsPreprocessConfig) -> DigitsPreprocessConfig:
+    # min_cc_area is irrelevant with the filter off; collapse those duplicates.
+    if not cfg.remove_small_cc:
+        cfg = replace(cfg, min_cc_area=_DEFAULT.min_cc_area)
+    return cfg
+
+
+def _stage_order(
+    cfg: DigitsPreprocessConfig,
+) -> tuple[int, int, tuple[int, int], int, tuple[int, int], int, bool, int]:
+    """Sort key: configs sharing upscale/tophat/blur end up adjacent and reuse cached stages."""
+    return (
+        cfg.upscale,
+        cfg.interpolation,
+        cfg.tophat_kernel,
+        cfg.blur_ksize,
+        cfg.morph_close_kernel,
+        cfg.morph_close_iterations,
+        cfg.remove_small_cc,
+        cfg.min_cc_area,
+    )
+
+
+class StagedPreprocessor:
+    """
+    DigitsPreprocessor split at its stage boundaries, with each prefix cached
+    for the whole dataset: upscale -> tophat -> blur+otsu. Consecutive configs
+    that differ only in later stages (close, small-cc filter) skip the earlier
+    ones. Output equals DigitsPreprocessor(cfg).process() pixel for pixel.
+    """
+
+    def __init__(self, imgs: list[np.ndarray]) -> None:
+        self._imgs = imgs
+        # One live entry per stage: configs arrive sorted by _stage_order.
+        self._up: tuple[_UpKey, list[np.ndarray]] | None = None
+        self._tophat: tuple[_TophatKey, list[np.ndarray]] | None = None
+        self._otsu: tuple[_OtsuKey, list[np.ndarray]] | None = None
+        self.stage_runs = {"upscale": 0, "tophat": 0, "otsu": 0}
+
+    def run(self, cfg: DigitsPreprocessConfig) -> list[np.ndarray]:
+        binaries = self._otsu_stage(cfg)
+        close_kernel = cv2.getStructuringElement(
+            cv2.MORPH_RECT,
+            (max(1, int(cfg.morph_close_kernel[0])), max(1, int(cfg.morph_close_kernel[1]))),
+        )
+
+        out: list[np.ndarray] = []
+        for b in binaries:
+            cur = b
+            if cfg.morph_close_iterations > 0:
+                cur = cv2.morphologyEx(cur, cv2.MORPH_CLOSE, close_kernel, iterations=int(cfg.morph_close_iterations))
+            if cfg.remove_small_cc and cfg.min_cc_area > 0:
+                dst = np.empty_like(cur)
+                labels = np.empty(cur.shape, dtype=np.int32)
+                remove_small_components(cur, int(cfg.min_cc_area), dst=dst, labels=labels)
+                cur = dst
+            if cfg.force_white_bg and 2 * cv2.countNonZero(cur) < cur.size:
+                cur = cv2.bitwise_not(cur)
+            elif cur is b:
+                cur = b.copy()  # the cached stage must not leak out
+            out.append(cur)
+        return out
+
+    def _up_stage(self, cfg: DigitsPreprocessConfig) -> list[np.ndarray]:
+        key: _UpKey = (cfg.upscale, cfg.interpolation)
+        if self._up is None or self._up[0] != key:
+            self.stage_runs["upscale"] += 1
+            ups: list[np.ndarray] = []
+            for img in self._imgs:
+                if cfg.upscale > 1:
+                    h, w = img.shape[:2]
+                    img = cv2.resize(img, (w * cfg.upscale, h * cfg.upscale), interpolation=cfg.interpolation)
+                ups.append(img)
+            self._up = (key, ups)
+        return self._up[1]
+
+    def _tophat_stage(self, cfg: DigitsPreprocessConfig) -> list[np.ndarray]:
+        key: _TophatKey = (cfg.upscale, cfg.interpolation, cfg.tophat_kernel)
+        if self._tophat is None or self._tophat[0] != key:
+            self.stage_runs["tophat"] += 1
+            kx, ky = max(1, int(cfg.tophat_kernel[0])), max(1, int(cfg.tophat_kernel[1]))
+            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kx, ky))
+            self._tophat = (key, [cv2.morphologyEx(u, cv2.MORPH_TOPHAT, kernel) for u in self._up_stage(cfg)])
+        return self._tophat[1]
+
+    def _otsu_stage(self, cfg: DigitsPreprocessConfig) -> list[np.ndarray]:
+        key: _OtsuKey = (cfg.upscale, cfg.interpolation, cfg.tophat_kernel, cfg.blur_ksize)
+        if self._otsu is None or self._otsu[0] != key:
+            self.stage_runs["otsu"] += 1
+            k = int(cfg.blur_ksize)
+            k = (k + 1 if k % 2 == 0 else k) if k >= 3 else 0
+            out: list[np.ndarray] = []
+            for t in self._tophat_stage(cfg):
+                if k:
+                    t = cv2.GaussianBlur(t, (k, k), 0)
+                _, b = cv2.threshold(t, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+                out.append(b)
+            self._otsu = (key, out)
+        return self._otsu[1]
+
+
+def pareto_front(results: list[SweepResult]) -> list[SweepResult]:
+    """Non-dominated results (higher accuracy, lower ms/line), fastest first."""
+    front: list[SweepResult] = []
+    for r in sorted(results, key=lambda r: (r.ms_line, -r.accuracy)):
+        if not front or r.accuracy > front[-1].accuracy:
+            front.append(r)
+    return front
+
+
+def best(results: list[SweepResult]) -> SweepResult:
+    """Most accurate; ties go to the faster config."""
+    return max(results, key=lambda r: (r.ok, -r.ms_line))
+
+
+def config_to_json(cfg: DigitsPreprocessConfig) -> dict[str, object]:
+    return asdict(cfg)
+
+
+def config_from_json(data: dict[str, object]) -> DigitsPreprocessConfig:
+    known = {f.name for f in fields(DigitsPreprocessConfig)}
+    # JSON turns the kernel tuples into lists.
+    kwargs = {k: (tuple(cast(list[int], v)) if isinstance(v, list) else v) for k, v in data.items() if k in known}
+    return DigitsPreprocessConfig(**kwargs)  # type: ignore[arg-type]
+
+
+def make_engine(name: str, *, templates: Path | None = None) -> DigitsEngine:
+    if name == "tesserocr":
+        from zml_game_bridge.inputs.ocr.pipelines.position.engine import TesserDigitsEngine
+
+        return TesserDigitsEngine()
+    if name == "template":
+        from zml_game_bridge.inputs.ocr.pipelines.position.template_engine import (
+            TemplateDigitsEngine,
+        )
+
+        if templates is None:
+            return TemplateDigitsEngine()
+        return TemplateDigitsEngine(templates_path=templates)
+    raise ValueError(f"Unknown engine: {name}")
+
+
+def _parse(text: str) -> int | None:
+    digits = "".join(ch for ch in text if ch.isdigit())
+    return int(digits) if digits else None
+
+
+@dataclass(frozen=True, slots=True)
+class _WorkerState:
+    """Process-pool worker state: dataset, stage cache and engine live for the worker's lifetime."""
+
+    lines: list[Line]
+    staged: StagedPreprocessor
+    inner: DigitsEngine
+    engine: CachedDigitsEngine
+    timing_lines: int
+
+
+_worker: _WorkerState | None = None
+
+
+def _init_worker(root: str, packed: bool, engine: str, templates: str | None, timing_lines: int) -> None:
+    global _worker
+    lines = load_lines(Path(root), packed=packed)
+    inner = make_engine(engine, templates=Path(templates) if templates else None)
+    _worker = _WorkerState(
+        lines=lines,
+        staged=StagedPreprocessor([ln.img for ln in lines]),
+        inner=inner,
+        # Many configs binarize a line to the same pixels; those OCR once per worker.
+        engine=CachedDigitsEngine(inner, max_entries=65536),
+        timing_lines=timing_lines,
+    )
+
+
+def _evaluate(cfg: DigitsPreprocessConfig) -> SweepResult:
+    w = _worker
+    assert w is not None, "_init_worker not called"
+    binaries = w.staged.run(cfg)
+    texts = w.engine.recognize_many(binaries)
+    ok = sum(1 for ln, text in zip(w.lines, texts, strict=True) if _parse(text) == ln.expected)
+
+    # Cost is measured on the production path (no stage reuse, no OCR memo).
+    sample = w.lines[: w.timing_lines] if w.timing_lines > 0 else w.lines
+    pre = DigitsPreprocessor(cfg)
+    t_pre = t_ocr = 0
+    for ln in sample:
+        t0 = time.perf_counter_ns()
+        binary = pre.process(ln.img)
+        t1 = time.perf_counter_ns()
+        w.inner.recognize_digits(binary)
+        t2 = time.perf_counter_ns()
+        t_pre += t1 - t0
+        t_ocr += t2 - t1
+
+    n = max(1, len(sample))
+    return SweepResult(
+        cfg=cfg,
+        ok=ok,
+        total=len(w.lines),
+        ms_preprocess=t_pre / n / 1e6,
+        ms_ocr=t_ocr / n / 1e6,
+    )
+
+
+def _evaluate_chunk(cfgs: list[DigitsPreprocessConfig]) -> list[SweepResult]:
+    return [_evaluate(cfg) for cfg in cfgs]
+
+
+def run_sweep(
+    root: Path,
+    cfgs: list[DigitsPreprocessConfig],
+    *,
+    engine: str,
+    templates: Path | None = None,
+    workers: int = 1,
+    timing_lines: int = 64,
+    packed: bool = False,
+) -> list[SweepResult]:
+    cfgs = sorted(cfgs, key=_stage_order)
+    initargs = (str(root), packed, engine, str(templates) if templates else None, timing_lines)
+
+    if workers <= 1:
+        _init_worker(*initargs)
+        return _evaluate_chunk(cfgs)
+
+    # Contiguous chunks keep stage-sharing configs on one worker (cache hits);
+    # several chunks per worker keep the load balanced.
+    n_chunks = workers * 4
+    size = max(1, -(-len(cfgs) // n_chunks))
+    chunks = [cfgs[i : i + size] for i in range(0, len(cfgs), size)]
+    out: list[SweepResult] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        for part in pool.map(_evaluate_chunk, chunks):
+            out.extend(part)
+    return out
+
+
+def _row(r: SweepResult) -> str:
+    c = r.cfg
+    return (
+        f"acc={100.0 * r.accuracy:6.2f}% ms/line={r.ms_line:6.3f} (pre={r.ms_preprocess:.3f} ocr={r.ms_ocr:.3f}) "
+        f"up={c.upscale} interp={c.interpolation} tophat={c.tophat_kernel} blur={c.blur_ksize} "
+        f"close={c.morph_close_iterations} cc={c.min_cc_area if c.remove_small_cc else '-'}"
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Search DigitsPreprocessConfig for accuracy vs ms/line.")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--root", type=Path, help="Dataset root with 'lon/' and 'lat/' folders")
+    src.add_argument("--packed", type=Path, help="Packed dataset dir (see packed.py / prepare_files.py)")
+    ap.add_argument("--out", type=Path, default=Path("out_sweep"), help="Output folder")
+    ap.add_argument("--engine", default="tesserocr", help="Scoring engine: tesserocr (production) or template")
+    ap.add_argument("--templates", type=Path, default=None, help="Digit templates .npz for --engine template")
+    ap.add_argument("--mode", choices=("grid", "random"), default="grid")
+    ap.add_argument("--samples", type=int, default=64, help="Configs to try in random mode")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--timing-lines", type=int, default=64, help="Lines timed per config (0 = all)")
+    args = ap.parse_args()
+
+    cfgs = grid_configs() if args.mode == "grid" else random_configs(args.samples, seed=args.seed)
+    print(f"configs={len(cfgs)} engine={args.engine} workers={args.workers}")
+
+    t0 = time.perf_counter()
+    source: Path = args.packed or args.root
+    results = run_sweep(
+        source,
+        cfgs,
+        engine=args.engine,
+        templates=args.templates,
+        workers=args.workers,
+        timing_lines=args.timing_lines,
+        packed=args.packed is not None,
+    )
+    print(f"swept in {time.perf_counter() - t0:.1f}s")
+    if not results or results[0].total == 0:
+        print("No samples found.")
+        return 2
+
+    front = pareto_front(results)
+    print("\nPareto front (accuracy vs ms/line):")
+    for r in front:
+        print("  " + _row(r))
+
+    winner = best(results)
+    print("\nBest:")
+    print("  " + _row(winner))
+    print(f"  {winner.cfg!r}")
+
+    # The staged evaluator must agree with the production preprocessor it stands in for.
+    lines = load_lines(source, packed=args.packed is not None)
+    staged = StagedPreprocessor([ln.img for ln in lines]).run(winner.cfg)
+    pre = DigitsPreprocessor(winner.cfg)
+    mismatches = sum(1 for ln, s in zip(lines, staged, strict=True) if not np.array_equal(pre.process(ln.img), s))
+    print(f"  staged/production parity mismatches={mismatches}")
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    (args.out / "sweep.json").write_text(
+        json.dumps(
+            [
+                {"config": config_to_json(r.cfg), "ok": r.ok, "total": r.total,
+                 "ms_preprocess": r.ms_preprocess, "ms_ocr": r.ms_ocr}
+                for r in sorted(results, key=lambda r: (-r.ok, r.ms_line))
+            ],
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    (args.out / "pareto.json").write_text(
+        json.dumps([{"config": config_to_json(r.cfg), "accuracy": r.accuracy, "ms_line": r.ms_line} for r in front],
+                   indent=2),
+        encoding="utf-8",
+    )
+    best_path = args.out / "best_digits_config.json"
+    best_path.write_text(json.dumps(config_to_json(winner.cfg), indent=2), encoding="utf-8")
+    print(f"\nBest DigitsPreprocessConfig -> {best_path} (load with sweep.config_from_json)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+# train_templates.py
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.preprocess import DigitsPreprocessor
+from zml_game_bridge.inputs.ocr.pipelines.position.template_engine import (
+    TemplateDigitsEngine,
+    TemplateEngineConfig,
+    default_templates_path,
+    train_templates,
+)
+
+
+def _iter_lines(root: Path, pre: DigitsPreprocessor) -> Iterator[tuple[np.ndarray, str]]:
+    """(preprocessed line, expected digits) for every '<id>_<digits>.png' under lon/ and lat/."""
+    for kind in ("lon", "lat"):
+        for p in sorted((root / kind).glob("*.png")):
+            _, _, label = p.stem.partition("_")
+            img = cv2.imread(str(p), cv2.IMREAD_GRAYSCALE)
+            if img is None or not label.isdigit():
+                print(f"[WARN] Skipping {p}")
+                continue
+            yield pre.process(img).copy(), label  # process() reuses its output buffer
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Learn per-digit templates for TemplateDigitsEngine.")
+    ap.add_argument("--root", type=Path, required=True, help="Dataset root with 'lon/' and 'lat/' folders")
+    ap.add_argument("--out", type=Path, default=default_templates_path(), help="Output .npz")
+    args = ap.parse_args()
+
+    pre = DigitsPreprocessor()
+    cfg = TemplateEngineConfig()
+    lines = list(_iter_lines(args.root, pre))
+
+    templates, used = train_templates(lines, cfg=cfg)
+    templates.save(args.out)
+    print(f"lines={len(lines)} used={used} -> {args.out}")
+
+    # Resubstitution check: what the engine reads back on its own training set.
+    engine = TemplateDigitsEngine(templates, cfg=cfg)
+    ok = rejected = wrong = 0
+    for binary, label in lines:
+        got = engine.recognize_digits(binary)
+        if got == label:
+            ok += 1
+        elif got == "":
+            rejected += 1
+        else:
+            wrong += 1
+    print(f"ok={ok} rejected={rejected} wrong={wrong}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,6 +7,12 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+
+# Planet name of load-test marker lines: "[ZML Marker, <seq>, 0, 0, Waypoint]" becomes a
+# PlayerPosWaypoint whose position.x carries the sequence number through to SSE.
+MARKER_PLANET = "ZML Marker"
+
 
 @dataclass(frozen=True, slots=True)
 class GenConfig:
@@ -90,17 +96,49 @@ class ChatLogGenerator:
 				self._maybe_sleep()
 				continue
 
-			r = self._rng.random()
-			if r < self._cfg.p_system_mining:
-				yield self._gen_system_mining(dt)
-			elif r < self._cfg.p_system_mining + self._cfg.p_globals:
-				yield self._gen_globals(dt)
-			else:
-				yield self._gen_public(dt)
+			yield self._gen_one(dt)
 
 			produced += 1
 			self._maybe_sleep()
 
+	def bulk_lines(
+		self,
+		n: int,
+		*,
+		start_dt: datetime | None = None,
+		marker_every: int = 0,
+		pool_size: int = 4096,
+	) -> list[str]:
+		"""
+		n lines for load tests, without the per-line RNG path of iter_lines():
+		a pool of message bodies is rendered once, then bodies and timestamp steps
+		are drawn for all lines at once with numpy. No multiline tower messages.
+
+		marker_every > 0 replaces every marker_every-th line with marker_line(seq),
+		seq = 0, 1, 2, ... (the line index is seq * marker_every).
+		"""
+		if n <= 0:
+			return []
+		dt0 = start_dt or datetime(2026, 1, 10, 12, 37, 0)
+
+		# Bodies only: rendering with a fixed dt and cutting the timestamp off.
+		stamp_len = len(f"{dt0:%Y-%m-%d %H:%M:%S} ")
+		pool = np.array([self._gen_one(dt0)[stamp_len:] for _ in range(pool_size)], dtype=object)
+
+		nprng = np.random.default_rng(self._cfg.seed)
+		bodies = pool[nprng.integers(0, pool_size, size=n)]
+		seconds = np.cumsum(nprng.integers(1, 8, size=n))
+		stamps = np.datetime_as_string(np.datetime64(dt0, "s") + seconds.astype("timedelta64[s]"), unit="s")
+
+		lines = [f"{ts[:10]} {ts[11:]} {body}" for ts, body in zip(stamps.tolist(), bodies.tolist(), strict=True)]
+		if marker_every > 0:
+			for seq, i in enumerate(range(0, n, marker_every)):
+				lines[i] = self.marker_line(datetime.fromisoformat(stamps[i]), seq)
+		return lines
+
+	def marker_line(self, dt: datetime, seq: int) -> str:
+		return self._fmt(dt, "System", "", f"[{MARKER_PLANET}, {seq}, 0, 0, Waypoint]")
+
 	def write_file(self, path: Path, start_dt: datetime | None = None, mode: str = "a") -> None:
 		"""
 		Write generated lines to a file.
@@ -115,6 +153,14 @@ class ChatLogGenerator:
 
 	# ---------- Internals ----------
 
+	def _gen_one(self, dt: datetime) -> str:
+		r = self._rng.random()
+		if r < self._cfg.p_system_mining:
+			return self._gen_system_mining(dt)
+		if r < self._cfg.p_system_mining + self._cfg.p_globals:
+			return self._gen_globals(dt)
+		return self._gen_public(dt)
+
 	def _maybe_sleep(self) -> None:
 		if self._cfg.sleep_ms_max <= 0:
 			return
@@ -0,0 +1,260 @@
+# ingest_load_test.py
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+import httpx
+import uvicorn
+
+from zml_game_bridge.api.app import create_app
+from zml_game_bridge.settings import Settings
+from zml_game_bridge.testing.chat_log_gen import MARKER_PLANET, ChatLogGenerator, GenConfig
+
+# Writer tick: lines due since the last tick go out in one write() + flush().
+_TICK_S = 0.01
+
+
+@dataclass(frozen=True, slots=True)
+class StepResult:
+    target_lps: float
+    achieved_lps: float
+    lines: int
+    markers: int
+    delivered: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @property
+    def lost(self) -> int:
+        return self.markers - self.delivered
+
+
+class _SseMarkerClient(threading.Thread):
+    """Reads /events/stream and stamps the arrival of every marker event by its seq."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(name="load-sse-client", daemon=True)
+        self._url = url
+        self.connected = threading.Event()
+        self.received: dict[int, float] = {}
+        self.error: Exception | None = None  # why the stream ended early, if it did
+
+    def run(self) -> None:
+        try:
+            with httpx.Client(timeout=None) as client, client.stream("GET", self._url) as resp:
+                for line in resp.iter_lines():
+                    if line.startswith(": connected"):
+                        self.connected.set()
+                    elif line.startswith("data:") and MARKER_PLANET in line:
+                        t = time.perf_counter()
+                        payload = json.loads(line[5:])["payload"]
+                        self.received[int(payload["position"]["x"])] = t
+        except Exception as e:
+            self.error = e
+            # stdout is redirected to devnull while the app runs.
+            print(f"[load] SSE client failed: {e!r}", file=sys.stderr)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _percentile(xs: list[float], q: float) -> float:
+    if not xs:
+        return 0.0
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))]
+
+
+def _run_step(
+    f: TextIO,
+    lines: list[str],
+    start: int,
+    *,
+    rate: float,
+    seconds: float,
+    marker_every: int,
+    sent: dict[int, float],
+) -> tuple[int, float]:
+    """Append lines[start:] at `rate` lines/s for `seconds`; returns (lines written, elapsed s)."""
+    total = min(int(rate * seconds), len(lines) - start)
+    written = 0
+    t0 = time.perf_counter()
+    while written < total:
+        due = min(total, int(rate * (time.perf_counter() - t0))) - written
+        if due > 0:
+            i0, i1 = start + written, start + written + due
+            f.write("\n".join(lines[i0:i1]))
+            f.write("\n")
+            f.flush()
+            t = time.perf_counter()
+            first = -(-i0 // marker_every) * marker_every
+            for i in range(first, i1, marker_every):
+                sent[i // marker_every] = t
+            written += due
+        time.sleep(_TICK_S)
+    return written, time.perf_counter() - t0
+
+
+def _wait_connected(client: _SseMarkerClient, timeout_s: float) -> bool:
+    """True once the stream is up; False on timeout or when the client already failed."""
+    deadline = time.perf_counter() + timeout_s
+    while time.perf_counter() < deadline:
+        if client.connected.wait(timeout=0.05):
+            return True
+        if not client.is_alive():
+            return False
+    return False
+
+
+def _wait_drained(client: _SseMarkerClient, seqs: list[int], timeout_s: float) -> None:
+    deadline = time.perf_counter() + timeout_s
+    while time.perf_counter() < deadline:
+        if all(s in client.received for s in seqs):
+            return
+        time.sleep(0.05)
+
+
+def run_load_test(
+    *,
+    rates: list[float],
+    seconds: float,
+    marker_every: int,
+    drain_s: float,
+    max_p99_ms: float,
+    stop_on_saturation: bool = True,
+    workdir: Path | None = None,
+) -> list[StepResult]:
+    """
+    Ramp the write rate through `rates` against a real AppRuntime (tailer -> interpreter ->
+    EventChannel -> DbWriter -> bus -> SseHub -> HTTP SSE), OCR off.
+    Latency = marker line flushed to chat.log -> its event read off the SSE socket.
+    """
+    tmp = tempfile.TemporaryDirectory(prefix="zml-load-") if workdir is None else None
+    root = Path(tmp.name) if tmp is not None else workdir
+    assert root is not None
+    chat_log = root / "chat.log"
+    chat_log.write_text("", encoding="utf-8")
+
+    gen = ChatLogGenerator(GenConfig(sleep_ms_min=0, sleep_ms_max=0))
+    lines = gen.bulk_lines(int(sum(r * seconds for r in rates)) + 1, marker_every=marker_every)
+
+    port = _free_port()
+    settings = Settings(port=port, db_path=root / "load.sqlite3", chat_log_path=chat_log, ocr_enabled=False)
+    results: list[StepResult] = []
+
+    # The runtime prints every stored event; keep that cost but not the terminal flood.
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        server = uvicorn.Server(uvicorn.Config(create_app(settings), host="127.0.0.1", port=port, log_level="warning"))
+        t_server = threading.Thread(target=server.run, name="load-uvicorn", daemon=True)
+        t_server.start()
+        while not server.started:
+            time.sleep(0.02)
+
+        sent: dict[int, float] = {}
+        cursor = 0
+        try:
+            client = _SseMarkerClient(f"http://127.0.0.1:{port}/events/stream")
+            client.start()
+            # Without a live stream every marker would count as lost: no result is better.
+            if not _wait_connected(client, timeout_s=5.0):
+                raise RuntimeError(f"SSE client did not connect to /events/stream: {client.error!r}")
+            with chat_log.open("a", encoding="utf-8", newline="\n") as f:
+                for rate in rates:
+                    before = set(sent)
+                    written, elapsed = _run_step(
+                        f, lines, cursor, rate=rate, seconds=seconds, marker_every=marker_every, sent=sent
+                    )
+                    cursor += written
+                    seqs = sorted(set(sent) - before)
+                    _wait_drained(client, seqs, drain_s)
+
+                    lat = [1000.0 * (client.received[s] - sent[s]) for s in seqs if s in client.received]
+                    res = StepResult(
+                        target_lps=rate,
+                        achieved_lps=written / elapsed if elapsed > 0 else 0.0,
+                        lines=written,
+                        markers=len(seqs),
+                        delivered=len(lat),
+                        p50_ms=statistics.median(lat) if lat else 0.0,
+                        p95_ms=_percentile(lat, 0.95),
+                        p99_ms=_percentile(lat, 0.99),
+                        max_ms=max(lat) if lat else 0.0,
+                    )
+                    results.append(res)
+                    if stop_on_saturation and _saturated(res, max_p99_ms):
+                        break
+        finally:
+            server.should_exit = True
+            t_server.join(timeout=5.0)
+            if t_server.is_alive():
+                server.force_exit = True
+                t_server.join(timeout=2.0)
+
+    if tmp is not None:
+        tmp.cleanup()
+    return results
+
+
+def _saturated(r: StepResult, max_p99_ms: float) -> bool:
+    return r.achieved_lps < 0.95 * r.target_lps or r.lost > 0 or r.p99_ms > max_p99_ms
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Ingest load test: chat.log writes -> SSE delivery through AppRuntime.")
+    ap.add_argument("--rates", type=float, nargs="+", default=[1000, 2000, 5000, 10000, 20000], help="Lines/s per step")
+    ap.add_argument("--seconds", type=float, default=10.0, help="Duration of each step")
+    ap.add_argument("--marker-every", type=int, default=100, help="One latency marker per N lines")
+    ap.add_argument("--drain-s", type=float, default=10.0, help="Max wait for a step's markers to arrive")
+    ap.add_argument("--max-p99-ms", type=float, default=1000.0, help="p99 above this counts as saturated")
+    ap.add_argument("--no-stop", action="store_true", help="Run every step even after saturation")
+    args = ap.parse_args()
+
+    try:
+        results = run_load_test(
+            rates=args.rates,
+            seconds=args.seconds,
+            marker_every=max(1, args.marker_every),
+            drain_s=args.drain_s,
+            max_p99_ms=args.max_p99_ms,
+            stop_on_saturation=not args.no_stop,
+        )
+    except RuntimeError as e:
+        print(f"[load] {e}")
+        return 2
+
+    print(f"{'target/s':>9} {'got/s':>9} {'markers':>8} {'lost':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  ms")
+    saturation: float | None = None
+    for r in results:
+        sat = _saturated(r, args.max_p99_ms)
+        if sat and saturation is None:
+            saturation = r.target_lps
+        print(
+            f"{r.target_lps:9.0f} {r.achieved_lps:9.0f} {r.markers:8d} {r.lost:6d} "
+            f"{r.p50_ms:8.1f} {r.p95_ms:8.1f} {r.p99_ms:8.1f} {r.max_ms:8.1f}" + ("  SATURATED" if sat else "")
+        )
+    if saturation is None:
+        print("No saturation within the tested rates.")
+    else:
+        print(f"Saturation at ~{saturation:.0f} lines/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from zml_game_bridge.api.routes.admin import router
+from zml_game_bridge.common.tracing import TRACER
+from zml_game_bridge.settings import Settings
+
+
+def _client(*, profiler_enabled: bool) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.state.settings = Settings(profiler_enabled=profiler_enabled)
+    return TestClient(app)
+
+
+def test_tracing_routes_are_hidden_when_admin_is_off():
+    client = _client(profiler_enabled=False)
+
+    assert client.get("/admin/tracing").status_code == 404
+    assert client.put("/admin/tracing", params={"enabled": "true"}).status_code == 404
+    assert TRACER.enabled is False
+
+
+def test_tracing_can_be_switched_when_admin_is_on():
+    client = _client(profiler_enabled=True)
+    try:
+        r = client.put("/admin/tracing", params={"enabled": "true"})
+        assert r.status_code == 200 and r.json() == {"enabled": True}
+        assert client.get("/admin/tracing").json() == {"enabled": True}
+    finally:
+        TRACER.enabled = False
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from zml_game_bridge.api.routes import events
+from zml_game_bridge.api.sse_hub import KEEPALIVE, SseClient
+from zml_game_bridge.events.envelope import EventEnvelope
+from zml_game_bridge.events.recent_envelope_buffer import RecentEnvelopeBuffer
+
+
+def _env(i: int) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=i,
+        created_ts_ms=123,
+        event_dt=None,
+        event_type="TestEvent",
+        payload_json='{"x":1}',
+    )
+
+
+def _ring(ids: range, *, capacity: int = 100) -> RecentEnvelopeBuffer:
+    ring = RecentEnvelopeBuffer(capacity=capacity)
+    for i in ids:
+        ring.on_envelope(_env(i))
+    return ring
+
+
+def _ids(chunk: str) -> list[int]:
+    return [int(line[len("id: "):]) for line in chunk.splitlines() if line.startswith("id: ")]
+
+
+class _Hub:
+    """Stands in for SseHub: one client whose queue the test fills by hand."""
+
+    def __init__(self) -> None:
+        self.client = SseClient(client_id=1, queue=asyncio.Queue())
+        self.unregistered: list[int] = []
+
+    def register(self) -> SseClient:
+        return self.client
+
+    def unregister(self, client_id: int) -> None:
+        self.unregistered.append(client_id)
+
+
+def _queue_live(hub: _Hub, *envs: EventEnvelope) -> None:
+    for env in envs:
+        hub.client.queue.put_nowait(env)
+
+
+class _FakeReader:
+    def __init__(self, rows: list[EventEnvelope]) -> None:
+        self.rows = rows
+        self.calls: list[int] = []
+
+    def read_after(self, after_event_id: int, *, limit: int) -> list[EventEnvelope]:
+        self.calls.append(after_event_id)
+        return [r for r in self.rows if r.event_id > after_event_id][:limit]
+
+
+def _request(hub: _Hub, ring: RecentEnvelopeBuffer, *, last_event_id: str | None = None) -> SimpleNamespace:
+    headers = {} if last_event_id is None else {"last-event-id": last_event_id}
+    runtime = SimpleNamespace(sse_hub=hub, recent_events=ring)
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(runtime=runtime)), headers=headers)
+
+
+def _run(
+    hub: _Hub,
+    ring: RecentEnvelopeBuffer,
+    after: int | None,
+    scenario: Callable[[Callable[[], Awaitable[str]]], Awaitable[None]],
+    *,
+    last_event_id: str | None = None,
+) -> None:
+    """Open the stream, hand scenario() a next-chunk callable, then close the stream."""
+
+    async def main() -> None:
+        resp = await events.events_stream(
+            _request(hub, ring, last_event_id=last_event_id),  # type: ignore[arg-type]
+            after=after,
+        )
+        body: AsyncGenerator[str] = resp.body_iterator  # type: ignore[assignment]
+
+        async def next_chunk() -> str:
+            return await asyncio.wait_for(anext(body), timeout=2.0)
+
+        try:
+            assert (await next_chunk()).endswith(": connected\n\n")
+            await scenario(next_chunk)
+        finally:
+            await body.aclose()
+
+    asyncio.run(main())
+
+
+def test_last_event_id_header_wins_over_after_query() -> None:
+    hub, ring = _Hub(), _ring(range(1, 11))
+    seen: list[int] = []
+
+    async def scenario(next_chunk: Callable[[], Awaitable[str]]) -> None:
+        for _ in range(3):
+            seen.extend(_ids(await next_chunk()))
+
+    _run(hub, ring, 2, scenario, last_event_id="7")
+
+    assert seen == [8, 9, 10]
+    assert hub.unregistered == [1]
+
+
+def test_bad_last_event_id_header_falls_back_to_after_query() -> None:
+    hub, ring = _Hub(), _ring(range(1, 11))
+    seen: list[int] = []
+
+    async def scenario(next_chunk: Callable[[], Awaitable[str]]) -> None:
+        for _ in range(2):
+            seen.extend(_ids(await next_chunk()))
+
+    _run(hub, ring, 8, scenario, last_event_id="not-a-number")
+
+    assert seen == [9, 10]
+
+
+def test_replay_pages_past_the_page_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(events, "_REPLAY_PAGE_SIZE", 3)
+    hub, ring = _Hub(), _ring(range(1, 11))
+    seen: list[int] = []
+
+    async def scenario(next_chunk: Callable[[], Awaitable[str]]) -> None:
+        for _ in range(10):
+            seen.extend(_ids(await next_chunk()))
+
+    _run(hub, ring, 0, scenario)
+
+    assert seen == list(range(1, 11))
+    assert ring.stats().hits == 4  # pages of 3, 3, 3 and a short final 1
+
+
+def test_live_envelopes_already_replayed_are_skipped() -> None:
+    hub, ring = _Hub(), _ring(range(1, 11))
+    # Published while the replay ran: the overlap must not be sent twice.
+    _queue_live(hub, _env(9), _env(10), _env(11))
+    chunks: list[list[int]] = []
+
+    async def scenario(next_chunk: Callable[[], Awaitable[str]]) -> None:
+        for _ in range(3):
+            chunks.append(_ids(await next_chunk()))
+
+    _run(hub, ring, 8, scenario)
+
+    assert chunks == [[9], [10], [11]]
+
+
+def test_hole_in_live_queue_is_filled_from_the_ring() -> None:
+    hub, ring = _Hub(), _ring(range(1, 11))
+    chunks: list[list[int]] = []
+
+    async def scenario(next_chunk: Callable[[], Awaitable[str]]) -> None:
+        chunks.append(_ids(await next_chunk()))  # replay: 10, and the replay is done reading
+        for i in range(11, 15):
+            ring.on_envelope(_env(i))
+        _queue_live(hub, _env(11), _env(14))  # 12 and 13 dropped from the live queue
+        chunks.append(_ids(await next_chunk()))
+
+    _run(hub, ring, 9, scenario)
+
+    assert chunks == [[10], [11, 12, 13, 14]]
+
+
+def test_hole_in_live_queue_falls_back_to_sqlite_when_ring_moved_on(monkeypatch: pytest.MonkeyPatch) -> None:
+    reader = _FakeReader([_env(i) for i in range(1, 16)])
+
+    @contextmanager
+    def open_reader() -> Iterator[_FakeReader]:
+        yield reader
+
+    monkeypatch.setattr(events, "open_event_reader", open_reader)
+    hub, ring = _Hub(), _ring(range(8, 11), capacity=3)
+    chunks: list[list[int]] = []
+
+    async def scenario(next_chunk: Callable[[], Awaitable[str]]) -> None:
+        chunks.append(_ids(await next_chunk()))
+        for i in range(11, 16):
+            ring.on_envelope(_env(i))  # ring now holds 13..15 only
+        _queue_live(hub, _env(11), _env(15))
+        chunks.append(_ids(await next_chunk()))
+
+    _run(hub, ring, 9, scenario)
+
+    assert chunks == [[10], [11, 12, 13, 14, 15]]
+    assert reader.calls == [11]
+
+
+def test_envelopes_queued_together_go_out_as_one_chunk() -> None:
+    hub, ring = _Hub(), RecentEnvelopeBuffer(capacity=10)
+    _queue_live(hub, _env(1), _env(2), _env(3))
+    chunks: list[str] = []
+
+    async def scenario(next_chunk: Callable[[], Awaitable[str]]) -> None:
+        chunks.append(await next_chunk())
+
+    _run(hub, ring, None, scenario)
+
+    assert _ids(chunks[0]) == [1, 2, 3]
+
+
+def test_keepalive_only_batch_writes_a_comment() -> None:
+    hub, ring = _Hub(), RecentEnvelopeBuffer(capacity=10)
+    hub.client.queue.put_nowait(KEEPALIVE)
+    chunks: list[str] = []
+
+    async def scenario(next_chunk: Callable[[], Awaitable[str]]) -> None:
+        chunks.append(await next_chunk())
+
+    _run(hub, ring, None, scenario)
+
+    assert chunks == [": keep-alive\n\n"]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+from zml_game_bridge.api.position_frame import (
+    FLAG_HAS_Z,
+    POSITION_FRAME,
+    POSITION_FRAME_VERSION,
+    PositionFrame,
+)
+from zml_game_bridge.common.models import WorldPos
+from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition
+
+
+def _pos(z: int | None, confidence: float = 1.0) -> OcrPosition:
+    return OcrPosition(
+        ts_ms=1_768_000_000_123,
+        position=WorldPos(planet_name="Calypso", x=137_650, y=75_100, z=z),
+        confidence=confidence,
+    )
+
+
+def test_binary_frame_is_24_bytes_and_round_trips() -> None:
+    frame = PositionFrame.encode(_pos(z=None))
+
+    assert len(frame.binary) == 24
+    version, flags, confidence, x, y, z, ts_ms = POSITION_FRAME.unpack(frame.binary)
+    assert version == POSITION_FRAME_VERSION
+    assert flags & FLAG_HAS_Z == 0
+    assert confidence == 255
+    assert (x, y, ts_ms) == (137_650, 75_100, 1_768_000_000_123)
+    assert z == 0  # no z: flag bit clear, field zeroed
+
+
+def test_binary_frame_sets_z_flag() -> None:
+    frame = PositionFrame.encode(_pos(z=-120))
+
+    _, flags, _, _, _, z, _ = POSITION_FRAME.unpack(frame.binary)
+    assert flags & FLAG_HAS_Z
+    assert z == -120
+
+
+def test_json_text_matches_dto_shape() -> None:
+    frame = PositionFrame.encode(_pos(z=None))
+
+    assert json.loads(frame.json_text) == {
+        "ts_ms": 1_768_000_000_123,
+        "planet_name": "Calypso",
+        "x": 137_650,
+        "y": 75_100,
+        "z": None,
+        "confidence": 1.0,
+    }
+
+
+def test_confidence_is_quantized_to_a_byte() -> None:
+    frame = PositionFrame.encode(_pos(z=None, confidence=0.5))
+
+    _, _, confidence, *_ = POSITION_FRAME.unpack(frame.binary)
+    assert confidence == 128
+    assert json.loads(frame.json_text)["confidence"] == 0.5
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+
+from zml_game_bridge.api.sse_hub import KEEPALIVE, SseHub
+from zml_game_bridge.events.envelope import EventEnvelope
+
+
+def _env(i: int) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=i,
+        created_ts_ms=123,
+        event_dt=None,
+        event_type="TestEvent",
+        payload_json='{"x":1}',
+    )
+
+
+def _drain(q: asyncio.Queue[EventEnvelope | None]) -> list[EventEnvelope | None]:
+    items: list[EventEnvelope | None] = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    return items
+
+
+def test_ticker_only_fills_idle_queues() -> None:
+    async def main() -> None:
+        hub = SseHub(asyncio.get_running_loop(), keepalive_s=0.01)
+        idle, busy = hub.register(), hub.register()
+        queued = _env(1)
+        busy.queue.put_nowait(queued)
+
+        hub.start()
+        try:
+            await asyncio.sleep(0.1)  # several ticks
+        finally:
+            hub.stop()
+
+        assert _drain(idle.queue) == [KEEPALIVE]  # one tick, later ones saw it non-empty
+        assert _drain(busy.queue) == [queued]
+
+    asyncio.run(main())
+
+
+def test_stop_cancels_the_ticker() -> None:
+    async def main() -> None:
+        hub = SseHub(asyncio.get_running_loop(), keepalive_s=60.0)
+        hub.start()
+        (ticker,) = asyncio.all_tasks() - {asyncio.current_task()}
+
+        hub.stop()
+        await asyncio.sleep(0)
+
+        assert ticker.cancelled()
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from zml_game_bridge.app.event_channel import EventChannel
+from zml_game_bridge.app.health import check_pipeline
+from zml_game_bridge.app.runtime import AppRuntime
+from zml_game_bridge.common.heartbeat import Heartbeat, heartbeat
+
+
+class _Writer:
+    written = 3
+    last_event_id: int | None = 7
+
+
+class _Hub:
+    last_event_id: int | None = 5
+
+    def client_count(self) -> int:
+        return 2
+
+
+class _FakeRuntime:
+    """The slice of AppRuntime that check_pipeline reads."""
+
+    def __init__(self, threads: dict[str, threading.Thread | None]) -> None:
+        self._threads = threads
+        self.started_at = time.monotonic() - 60.0
+        self.ocr_enabled = False
+        self.event_channel = EventChannel()
+        self.event_channel.emitted = 4
+        self.db_writer = _Writer()
+        self.sse_hub = _Hub()
+
+    def loops(self) -> dict[str, threading.Thread | None]:
+        return self._threads
+
+    @property
+    def position_hub(self) -> _Hub:
+        return _Hub()
+
+
+def _alive_thread(stop: threading.Event) -> threading.Thread:
+    t = threading.Thread(target=stop.wait, daemon=True)
+    t.start()
+    return t
+
+
+def test_heartbeat_age_and_rate() -> None:
+    hb = Heartbeat("x")
+    assert hb.age_s() is None
+    for _ in range(5):
+        hb.beat()
+        time.sleep(0.01)
+    age = hb.age_s()
+    assert age is not None and 0.0 <= age < 1.0
+    assert hb.beats == 5 and 10.0 < hb.hz < 200.0
+
+
+def test_unstarted_runtime_is_down(tmp_path: Path) -> None:
+    rt = AppRuntime(db_path=tmp_path / "db.sqlite3", chat_log_path=tmp_path / "chat.log", ocr_enabled=False)
+    h = check_pipeline(rt, stall_s=5.0, min_ocr_hz=5.0)
+    assert h.status == "down"
+    assert h.problems == ["runtime not started"]
+
+
+def test_fresh_beats_are_ok_and_counters_reported() -> None:
+    stop = threading.Event()
+    try:
+        rt = _FakeRuntime({"test-ok": _alive_thread(stop)})
+        heartbeat("test-ok").beat()
+        h = check_pipeline(rt, stall_s=5.0, min_ocr_hz=5.0)  # type: ignore[arg-type]
+    finally:
+        stop.set()
+
+    assert h.status == "ok", h.problems
+    assert h.db_lag_events == 1
+    assert h.sse_lag_ids == 2
+    assert h.sse_clients == 2
+
+
+def test_silent_loop_is_stalled_and_dead_thread_is_down() -> None:
+    stop = threading.Event()
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    try:
+        rt = _FakeRuntime({"test-silent": _alive_thread(stop), "test-dead": dead})
+        h = check_pipeline(rt, stall_s=5.0, min_ocr_hz=5.0)  # type: ignore[arg-type]
+    finally:
+        stop.set()
+
+    assert h.status == "down"
+    assert any("test-silent loop stalled" in p for p in h.problems)
+    assert "test-dead thread is not running" in h.problems
+
+
+def test_dead_ocr_thread_is_degraded_not_down() -> None:
+    stop = threading.Event()
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    try:
+        rt = _FakeRuntime({"test-ok": _alive_thread(stop), "ocr": dead})
+        heartbeat("test-ok").beat()
+        h = check_pipeline(rt, stall_s=5.0, min_ocr_hz=5.0)  # type: ignore[arg-type]
+    finally:
+        stop.set()
+
+    assert h.status == "degraded"
+    assert h.problems == ["ocr thread is not running"]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from zml_game_bridge.app.profiler import ProfileResult, SamplingProfiler
+
+
+def _spin_here(stop: threading.Event) -> None:
+    while not stop.is_set():
+        time.sleep(0.001)
+
+
+def test_profile_counts_stacks_per_thread_name() -> None:
+    stop = threading.Event()
+    t = threading.Thread(target=_spin_here, args=(stop,), name="worker")
+    t.start()
+    try:
+        result = SamplingProfiler(interval_s=0.002).run({"zml-worker": t}, 0.2)
+    finally:
+        stop.set()
+        t.join()
+
+    assert result.samples > 10
+    assert set(result.stacks) == {"zml-worker"}
+    leafs = {stack.rsplit(";", 1)[-1] for stack in result.stacks["zml-worker"]}
+    assert "test_profiler._spin_here" in leafs
+    assert sum(result.stacks["zml-worker"].values()) <= result.samples
+
+
+def test_collapsed_puts_thread_name_at_root() -> None:
+    result = ProfileResult(seconds=1.0, samples=3, stacks={"zml-db": {"a.run;b.take": 2, "a.run": 1}})
+    assert result.collapsed() == "zml-db;a.run;b.take 2\nzml-db;a.run 1\n"
+
+
+def test_second_profile_while_running_is_rejected() -> None:
+    prof = SamplingProfiler()
+    started = threading.Thread(target=prof.run, args=({}, 0.3))
+    started.start()
+    time.sleep(0.05)
+    try:
+        with pytest.raises(RuntimeError):
+            prof.run({}, 0.01)
+    finally:
+        started.join()
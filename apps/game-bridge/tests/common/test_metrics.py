@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from zml_game_bridge.common.metrics import Counter, Histogram, MetricsRegistry
+
+
+def test_render_counter_gauge_with_help_and_labels() -> None:
+    reg = MetricsRegistry()
+    reg.counter("zml_lines_total", "Lines read", result="event").inc(3)
+    reg.counter("zml_lines_total", "Lines read", result="unparsed").inc()
+    reg.gauge("zml_depth", "Queue depth").set_function(lambda: 7)
+
+    text = reg.render()
+
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert "# HELP zml_lines_total Lines read" in lines
+    assert "# TYPE zml_lines_total counter" in lines
+    assert 'zml_lines_total{result="event"} 3' in lines
+    assert 'zml_lines_total{result="unparsed"} 1' in lines
+    assert "# TYPE zml_depth gauge" in lines
+    assert "zml_depth 7" in lines
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    reg = MetricsRegistry()
+    h = reg.histogram("zml_wait_seconds", buckets=(0.1, 1.0), stage="x")
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(v)
+
+    lines = reg.render().splitlines()
+
+    assert 'zml_wait_seconds_bucket{stage="x",le="0.1"} 2' in lines
+    assert 'zml_wait_seconds_bucket{stage="x",le="1"} 3' in lines
+    assert 'zml_wait_seconds_bucket{stage="x",le="+Inf"} 4' in lines
+    assert 'zml_wait_seconds_sum{stage="x"} 3.65' in lines
+    assert 'zml_wait_seconds_count{stage="x"} 4' in lines
+
+
+def test_same_name_and_labels_return_same_handle() -> None:
+    reg = MetricsRegistry()
+    assert reg.counter("c", a="1") is reg.counter("c", a="1")
+    assert reg.counter("c", a="1") is not reg.counter("c", a="2")
+
+
+def test_type_mismatch_raises() -> None:
+    reg = MetricsRegistry()
+    reg.counter("zml_x")
+    with pytest.raises(ValueError):
+        reg.gauge("zml_x")
+
+
+def test_label_values_are_escaped() -> None:
+    reg = MetricsRegistry()
+    reg.counter("c", matcher='a"b\\c\nd').inc()
+    assert 'c{matcher="a\\"b\\\\c\\nd"} 1' in reg.render().splitlines()
+
+
+def test_failing_gauge_function_is_skipped() -> None:
+    reg = MetricsRegistry()
+    reg.gauge("bad").set_function(lambda: 1 / 0)
+    reg.counter("good").inc()
+    lines = reg.render().splitlines()
+    assert "good 1" in lines
+    assert not any(ln.startswith("bad ") for ln in lines)
+
+
+def _per_call_s(fn, n: int = 20_000, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / n)
+    return best
+
+
+def test_hot_path_recording_is_under_one_microsecond() -> None:
+    c = Counter()
+    h = Histogram()
+    assert _per_call_s(c.inc) < 1e-6
+    assert _per_call_s(lambda: h.observe(0.003)) < 1e-6
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from zml_game_bridge.app.event_channel import EventChannel
+from zml_game_bridge.common.tracing import STAGES, Trace, Tracer
+from zml_game_bridge.events.envelope import EventEnvelope
+
+
+def test_tracer_off_returns_no_trace() -> None:
+    assert Tracer().start() is None
+    assert isinstance(Tracer(enabled=True).start(), Trace)
+
+
+def test_trace_stamps_are_monotonic_from_tail() -> None:
+    trace = Trace()
+    for stage in STAGES[1:-1]:
+        trace.mark(stage)
+    trace.end("sse_write")
+
+    got = trace.as_dict()
+    assert list(got) == list(STAGES[:-1])  # end() observes but does not store
+    assert got["tail"] == 0
+    assert list(got.values()) == sorted(got.values())
+
+
+def test_channel_carries_trace_next_to_event() -> None:
+    ch = EventChannel(maxsize=4)
+    trace = Trace()
+    ev = object()
+
+    ch.emit(ev, trace)  # type: ignore[arg-type]
+    got = ch.take_traced(timeout_s=0.1)
+
+    assert got is not None and got[0] is ev and got[1] is trace
+    assert [s for s, _ in trace.stamps] == ["tail", "enqueue"]
+
+
+def test_envelope_equality_ignores_trace() -> None:
+    a = EventEnvelope(event_id=1, created_ts_ms=1, event_dt=None, event_type="T", payload_json="{}")
+    b = EventEnvelope(event_id=1, created_ts_ms=1, event_dt=None, event_type="T", payload_json="{}", trace=Trace())
+    assert a == b
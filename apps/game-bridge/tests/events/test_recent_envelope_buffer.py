@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from zml_game_bridge.events.envelope import EventEnvelope
+from zml_game_bridge.events.recent_envelope_buffer import RecentEnvelopeBuffer
+
+
+def _env(i: int) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=i,
+        created_ts_ms=123,
+        event_dt=None,
+        event_type="TestEvent",
+        payload_json='{"x":1}',
+    )
+
+
+def _ids(rows: list[EventEnvelope] | None) -> list[int] | None:
+    return None if rows is None else [r.event_id for r in rows]
+
+
+def test_empty_buffer_misses() -> None:
+    buf = RecentEnvelopeBuffer(capacity=4)
+
+    assert buf.read_after(0, limit=10) is None
+    assert buf.read_latest(limit=1) is None
+    assert buf.stats().misses == 2
+
+
+def test_read_after_serves_window_inside_ring() -> None:
+    buf = RecentEnvelopeBuffer(capacity=10)
+    for i in range(5, 11):
+        buf.on_envelope(_env(i))
+
+    assert _ids(buf.read_after(4, limit=100)) == [5, 6, 7, 8, 9, 10]
+    assert _ids(buf.read_after(7, limit=2)) == [8, 9]
+    assert _ids(buf.read_after(10, limit=5)) == []
+
+
+def test_read_after_older_than_ring_falls_back() -> None:
+    buf = RecentEnvelopeBuffer(capacity=10)
+    for i in range(5, 11):
+        buf.on_envelope(_env(i))
+
+    assert buf.read_after(3, limit=10) is None
+
+
+def test_ring_wraps_and_evicts_oldest() -> None:
+    buf = RecentEnvelopeBuffer(capacity=3)
+    for i in range(1, 8):
+        buf.on_envelope(_env(i))
+
+    st = buf.stats()
+    assert (st.size, st.first_event_id, st.last_event_id) == (3, 5, 7)
+    assert _ids(buf.read_after(4, limit=10)) == [5, 6, 7]
+    assert _ids(buf.read_after(5, limit=10)) == [6, 7]
+    assert buf.read_after(3, limit=10) is None
+
+
+def test_read_latest_needs_full_window() -> None:
+    buf = RecentEnvelopeBuffer(capacity=5)
+    for i in range(1, 4):
+        buf.on_envelope(_env(i))
+
+    assert _ids(buf.read_latest(limit=2)) == [2, 3]
+    assert buf.read_latest(limit=4) is None
+
+
+def test_ignores_non_increasing_ids() -> None:
+    buf = RecentEnvelopeBuffer(capacity=5)
+    buf.on_envelope(_env(2))
+    buf.on_envelope(_env(2))
+    buf.on_envelope(_env(1))
+
+    assert buf.stats().size == 1
+
+
+def test_hit_rate() -> None:
+    buf = RecentEnvelopeBuffer(capacity=5)
+    buf.on_envelope(_env(1))
+
+    buf.read_after(0, limit=1)
+    buf.read_after(0, limit=1)
+    buf.read_latest(limit=3)
+
+    st = buf.stats()
+    assert (st.hits, st.misses) == (2, 1)
+    assert abs(st.hit_rate - 2 / 3) < 1e-9
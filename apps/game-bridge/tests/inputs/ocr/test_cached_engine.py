@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.cached_engine import CachedDigitsEngine
+
+
+class _CountingEngine:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.closed = False
+
+    def recognize_digits(self, img_u8: np.ndarray) -> str:
+        self.calls += 1
+        return str(int(img_u8.sum()))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _img(v: int, shape: tuple[int, int] = (4, 8)) -> np.ndarray:
+    img = np.zeros(shape, dtype=np.uint8)
+    img[0, 0] = v
+    return img
+
+
+def test_identical_images_hit_the_cache():
+    inner = _CountingEngine()
+    eng = CachedDigitsEngine(inner)
+
+    assert eng.recognize_digits(_img(7)) == "7"
+    assert eng.recognize_digits(_img(7).copy()) == "7"
+    assert inner.calls == 1
+
+    st = eng.stats()
+    assert (st.hits, st.misses, st.size) == (1, 1, 1)
+    assert st.hit_rate == 0.5
+
+
+def test_shape_is_part_of_the_key():
+    inner = _CountingEngine()
+    eng = CachedDigitsEngine(inner)
+    eng.recognize_digits(_img(1, (4, 8)))
+    eng.recognize_digits(_img(1, (8, 4)))
+    assert inner.calls == 2
+
+
+def test_lru_evicts_least_recently_used():
+    inner = _CountingEngine()
+    eng = CachedDigitsEngine(inner, max_entries=2)
+    eng.recognize_digits(_img(1))
+    eng.recognize_digits(_img(2))
+    eng.recognize_digits(_img(1))  # refresh 1
+    eng.recognize_digits(_img(3))  # evicts 2
+    assert inner.calls == 3
+
+    eng.recognize_digits(_img(1))
+    assert inner.calls == 3
+    eng.recognize_digits(_img(2))
+    assert inner.calls == 4
+    assert eng.stats().size == 2
+
+
+def test_close_closes_inner():
+    inner = _CountingEngine()
+    CachedDigitsEngine(inner).close()
+    assert inner.closed
+
+
+def test_recognize_many_sends_only_misses_to_inner():
+    calls: list[int] = []
+
+    class _BatchEngine(_CountingEngine):
+        def recognize_many(self, imgs):
+            calls.append(len(imgs))
+            return [self.recognize_digits(i) for i in imgs]
+
+    eng = CachedDigitsEngine(_BatchEngine())
+    eng.recognize_digits(_img(1))
+    assert eng.recognize_many([_img(1), _img(2), _img(3)]) == ["1", "2", "3"]
+    assert calls == [2]
+    assert eng.recognize_many([_img(3), _img(1)]) == ["3", "1"]
+    assert calls == [2]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect, crop_gray, group_rois, union_rect
+
+
+def _bgra(h: int = 10, w: int = 12) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=(h, w, 4), dtype=np.uint8)
+
+
+def test_view_is_zero_copy_and_clamped() -> None:
+    frame = _bgra()
+    view = RoiRect(x1=8, x2=50, y1=-3, y2=4).view(frame)
+
+    assert view is not None
+    assert view.shape == (4, 4, 4)
+    assert np.shares_memory(view, frame)
+
+
+def test_view_outside_frame_is_none() -> None:
+    assert RoiRect(x1=20, x2=30, y1=0, y2=5).view(_bgra()) is None
+
+
+def test_crop_gray_matches_full_conversion() -> None:
+    frame = _bgra()
+    roi = RoiRect(x1=2, x2=9, y1=3, y2=8)
+
+    got = crop_gray(frame, roi)
+    want = cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)[3:8, 2:9]
+
+    assert got is not None
+    assert got.flags["C_CONTIGUOUS"]
+    assert np.array_equal(got, want)
+
+
+def test_union_rect_and_offset() -> None:
+    u = union_rect([RoiRect(x1=5, x2=10, y1=2, y2=4), RoiRect(x1=1, x2=6, y1=3, y2=9)])
+
+    assert u == RoiRect(x1=1, x2=10, y1=2, y2=9)
+    assert RoiRect(x1=5, x2=10, y1=2, y2=4).offset(-u.x1, -u.y1) == RoiRect(x1=4, x2=9, y1=0, y2=2)
+
+
+def test_group_rois_keeps_far_apart_rois_separate() -> None:
+    compass = RoiRect(x1=2185, y1=965, x2=2551, y2=1411)
+    finder = RoiRect(x1=20, y1=20, x2=700, y2=250)
+    deeds = RoiRect(x1=20, y1=260, x2=700, y2=520)
+
+    assert group_rois([compass, finder, deeds]) == [[0], [1, 2]]
+    assert group_rois([compass]) == [[0]]
+    assert group_rois([]) == []
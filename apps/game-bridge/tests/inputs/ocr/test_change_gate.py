@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.change_gate import ChangeGateConfig, RoiChangeGate
+
+
+def _roi(value: int = 40) -> np.ndarray:
+    img = np.full((20, 60), value, dtype=np.uint8)
+    img[5:15, 10:50] = 220  # "digits"
+    return img
+
+
+def test_first_check_is_a_change_then_identical_frames_are_skipped():
+    gate = RoiChangeGate()
+    assert gate.changed(_roi())
+    assert not gate.changed(_roi())
+    assert not gate.changed(_roi())
+
+    st = gate.stats()
+    assert (st.checks, st.skips) == (3, 2)
+    assert abs(st.skip_rate - 2 / 3) < 1e-9
+
+
+def test_small_noise_is_ignored_but_new_digits_are_not():
+    gate = RoiChangeGate(ChangeGateConfig(downscale=2, mad_threshold=2.0))
+    gate.changed(_roi())
+
+    noisy = _roi()
+    noisy[::7, ::5] += 3
+    assert not gate.changed(noisy)
+
+    other = _roi()
+    other[5:15, 30:50] = 40  # half the glyphs gone
+    assert gate.changed(other)
+
+
+def test_reference_is_last_changed_frame_so_drift_adds_up():
+    gate = RoiChangeGate(ChangeGateConfig(downscale=1, mad_threshold=2.0))
+    gate.changed(_roi(40))
+    assert not gate.changed(_roi(41))
+    assert not gate.changed(_roi(42))
+    assert gate.changed(_roi(45))
+
+
+def test_reset_and_shape_change_force_a_change():
+    gate = RoiChangeGate()
+    gate.changed(_roi())
+    gate.reset()
+    assert gate.changed(_roi())
+    assert gate.changed(np.zeros((10, 10), dtype=np.uint8))
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.engine import (
+    TesserDigitsEngine,
+    split_textlines,
+    stack_lines,
+)
+
+
+def _line(h: int, w: int, v: int = 0) -> np.ndarray:
+    return np.full((h, w), v, dtype=np.uint8)
+
+
+def test_stack_lines_places_each_crop_at_its_span():
+    a, b = _line(20, 60, 10), _line(24, 50, 20)
+    canvas, spans = stack_lines([a, b], min_gap=16)
+
+    assert spans == [(16, 36), (52, 76)]
+    assert canvas.shape == (16 + 20 + 16 + 24 + 16, 60 + 2 * 16)
+    assert np.all(canvas[16:36, 16:76] == 10)
+    assert np.all(canvas[52:76, 16:66] == 20)
+    assert np.all(canvas[52:76, 66:] == 255)  # narrower line padded with background
+    assert np.all(canvas[36:52] == 255)
+
+
+def test_split_textlines_maps_boxes_to_rows():
+    spans = [(16, 36), (52, 76)]
+    found = [
+        ("6789\n", (20, 54, 70, 74)),
+        ("123", (16, 18, 40, 34)),
+        ("45", (42, 18, 60, 34)),  # same row, further right
+    ]
+    assert split_textlines(found, spans) == ["12345", "6789"]
+
+
+def test_split_textlines_uses_nearest_row_and_leaves_missing_empty():
+    spans = [(16, 36), (52, 76), (92, 112)]
+    # Box drifted into the gap below row 0: closer to row 0 than row 1.
+    assert split_textlines([("1", (0, 30, 10, 46))], spans) == ["1", "", ""]
+
+
+class _FakeApi:
+    """Stands in for PyTessBaseAPI: 'finds' one line per non-white band of the canvas."""
+
+    def __init__(self) -> None:
+        self.psm_calls: list[str] = []
+        self.recognize_calls = 0
+        self._rows: list[tuple[int, int, int]] = []
+
+    def SetPageSegMode(self, psm: str) -> None:
+        self.psm_calls.append(psm)
+
+    def SetImageBytes(self, data: bytes, w: int, h: int, bpp: int, bpl: int) -> None:
+        img = np.frombuffer(data, dtype=np.uint8).reshape(h, w)
+        ink = np.flatnonzero((img < 255).any(axis=1))
+        self._rows = []
+        start = prev = None
+        for y in ink:
+            if start is None:
+                start = prev = y
+            elif y != prev + 1:
+                self._rows.append((start, prev + 1, int(img[start, 16])))
+                start = y
+            prev = y
+        if start is not None:
+            self._rows.append((start, prev + 1, int(img[start, 16])))
+
+    def Recognize(self) -> None:
+        self.recognize_calls += 1
+
+    def GetIterator(self):
+        return [
+            SimpleNamespace(
+                GetUTF8Text=lambda _level, v=v: f"{v}\n",
+                BoundingBox=lambda _level, y0=y0, y1=y1: (16, y0, 40, y1),
+            )
+            for y0, y1, v in self._rows
+        ]
+
+
+def _engine_with(api: _FakeApi) -> TesserDigitsEngine:
+    engine = TesserDigitsEngine.__new__(TesserDigitsEngine)
+    engine._api = api
+    engine._batch = True
+    engine._tesserocr = SimpleNamespace(
+        RIL=SimpleNamespace(TEXTLINE="textline"),
+        PSM=SimpleNamespace(SINGLE_BLOCK="block", SINGLE_LINE="line"),
+        iterate_level=lambda it, _level: iter(it),
+    )
+    return engine
+
+
+def test_recognize_batch_is_one_pass_and_restores_single_line_mode():
+    api = _FakeApi()
+    engine = _engine_with(api)
+
+    out = engine.recognize_many([_line(20, 60, 11), _line(20, 55, 22), _line(18, 40, 33)])
+
+    assert out == ["11", "22", "33"]
+    assert api.recognize_calls == 1
+    assert api.psm_calls == ["block", "line"]
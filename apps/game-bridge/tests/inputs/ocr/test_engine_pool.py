@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import ClassVar
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.engine_pool import EnginePool
+
+
+class _SlowEngine:
+    """Stands in for Tesseract: sleeps (GIL released) and reports its owner thread."""
+
+    instances: ClassVar[list[_SlowEngine]] = []
+
+    def __init__(self) -> None:
+        self.owner = threading.get_ident()
+        self.closed = False
+        _SlowEngine.instances.append(self)
+
+    def recognize_digits(self, img_u8: np.ndarray) -> str:
+        assert threading.get_ident() == self.owner
+        time.sleep(0.05)
+        return str(int(img_u8[0, 0]))
+
+    def recognize_many(self, imgs):
+        return [self.recognize_digits(i) for i in imgs]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _img(v: int) -> np.ndarray:
+    return np.full((2, 2), v, dtype=np.uint8)
+
+
+def test_recognize_many_runs_in_parallel_and_keeps_order():
+    _SlowEngine.instances = []
+    pool = EnginePool(_SlowEngine, size=2)
+    try:
+        pool.recognize_many([_img(0), _img(0)])  # warm up: engines are created lazily
+
+        t0 = time.perf_counter()
+        out = pool.recognize_many([_img(1), _img(2)])
+        elapsed = time.perf_counter() - t0
+    finally:
+        pool.close()
+
+    assert out == ["1", "2"]
+    assert elapsed < 0.09  # ~max(), not sum() of 2 x 50 ms
+    assert len(_SlowEngine.instances) == 2
+    assert all(e.closed for e in _SlowEngine.instances)
+
+
+def test_single_recognize_goes_through_the_pool():
+    _SlowEngine.instances = []
+    pool = EnginePool(_SlowEngine, size=1)
+    try:
+        assert pool.recognize_digits(_img(7)) == "7"
+    finally:
+        pool.close()
+    assert _SlowEngine.instances[0].owner != threading.get_ident()
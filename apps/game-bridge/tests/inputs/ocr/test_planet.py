@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.planet import (
+    KNOWN_PLANETS,
+    PlanetRecognizer,
+    edit_distance,
+    snap_to_known,
+)
+
+
+class _TextEngine:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+
+    def recognize_text(self, img_u8: np.ndarray) -> str:
+        self.calls += 1
+        return self.text
+
+    def close(self) -> None:
+        pass
+
+
+def _header(v: int) -> np.ndarray:
+    img = np.zeros((30, 339), dtype=np.uint8)
+    img[8:22, 10 : 10 + v] = 220
+    return img
+
+
+def test_edit_distance():
+    assert edit_distance("calypso", "calypso") == 0
+    assert edit_distance("ca1ypso", "calypso") == 1
+    assert edit_distance("", "abc") == 3
+    assert edit_distance("kitten", "sitting") == 3
+
+
+def test_snap_tolerates_ocr_noise_and_rejects_garbage():
+    assert snap_to_known("Ca1ypso\n", KNOWN_PLANETS) == "Calypso"
+    assert snap_to_known("PLANET ARKAD1A", KNOWN_PLANETS) == "Planet Arkadia"
+    assert snap_to_known("Rocktropia", KNOWN_PLANETS) == "ROCKtropia"
+    assert snap_to_known("Loading...", KNOWN_PLANETS) is None
+    assert snap_to_known("", KNOWN_PLANETS) is None
+
+
+def test_ocr_runs_only_when_header_changes():
+    engine = _TextEngine("Calypso")
+    rec = PlanetRecognizer(engine)
+
+    assert rec.read(_header(80)) == "Calypso"
+    for _ in range(10):
+        assert rec.read(_header(80)) == "Calypso"
+    assert engine.calls == 1
+
+    engine.text = "Next lsland"
+    assert rec.read(_header(120)) == "Next Island"
+    assert rec.reads == 2
+
+
+def test_unrecognized_read_keeps_last_name():
+    engine = _TextEngine("Planet Cyrene")
+    rec = PlanetRecognizer(engine)
+    rec.read(_header(80))
+
+    engine.text = "@@##"
+    assert rec.read(_header(200)) == "Planet Cyrene"
+
+
+def test_area_outside_the_list_needs_extra_names():
+    engine = _TextEngine("Crysta1 Palace")
+    assert PlanetRecognizer(engine).read(_header(80)) is None
+    assert PlanetRecognizer(engine, names=(*KNOWN_PLANETS, "Crystal Palace")).read(_header(80)) == "Crystal Palace"
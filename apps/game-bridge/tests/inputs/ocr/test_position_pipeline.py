@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect
+from zml_game_bridge.inputs.ocr.pipelines.position.model import PositionRois
+from zml_game_bridge.inputs.ocr.pipelines.position.pipeline import PositionPipeline
+
+ROIS = PositionRois(
+    planet=RoiRect(x1=23, x2=362, y1=0, y2=30),
+    lon=RoiRect(x1=85, x2=145, y1=350, y2=370),
+    lat=RoiRect(x1=90, x2=145, y1=375, y2=395),
+)
+
+
+class _ScriptedEngine:
+    """Answers by line width (lon and lat ROIs differ), records batch sizes."""
+
+    def __init__(self, answers: dict[int, str]) -> None:
+        self.answers = answers
+        self.batches: list[int] = []
+
+    def recognize_digits(self, img_u8: np.ndarray) -> str:
+        return self.recognize_many([img_u8])[0]
+
+    def recognize_many(self, imgs):
+        self.batches.append(len(imgs))
+        return [self.answers[int(img.shape[1])] for img in imgs]
+
+    def close(self) -> None:
+        pass
+
+
+def _compass(lon_v: int, lat_v: int) -> np.ndarray:
+    img = np.zeros((400, 370), dtype=np.uint8)
+    img[352:368, 90 : 90 + lon_v] = 200
+    img[377:393, 95 : 95 + lat_v] = 200
+    return img
+
+
+def test_reads_both_lines_in_one_batch_then_skips_unchanged_frames():
+    # Preprocessing upscales x2: lon ROI is 60 px wide -> 120, lat 55 -> 110.
+    engine = _ScriptedEngine({120: "137546", 110: "80912"})
+    pipe = PositionPipeline(ROIS, engine=engine)
+
+    pos = pipe.step(_compass(30, 30), ts_ms=1)
+    assert pos is not None
+    assert (pos.position.x, pos.position.y) == (137546, 80912)
+    assert engine.batches == [2]
+
+    assert pipe.step(_compass(30, 30), ts_ms=2) is None
+    assert engine.batches == [2]
+    assert pipe.gate_stats()["lon"].skips == 1
+
+
+def test_only_the_changed_line_is_read_again():
+    engine = _ScriptedEngine({120: "137546", 110: "80912"})
+    pipe = PositionPipeline(ROIS, engine=engine)
+    pipe.step(_compass(30, 30), ts_ms=1)
+
+    engine.answers[120] = "137547"
+    pos = pipe.step(_compass(45, 30), ts_ms=2)
+    assert pos is not None
+    assert (pos.position.x, pos.position.y) == (137547, 80912)
+    assert engine.batches == [2, 1]
+
+
+def test_failed_read_is_retried_on_an_identical_frame():
+    engine = _ScriptedEngine({120: "", 110: "80912"})
+    pipe = PositionPipeline(ROIS, engine=engine)
+
+    assert pipe.step(_compass(30, 30), ts_ms=1) is None
+    assert engine.batches == [2]
+
+    engine.answers[120] = "137546"
+    pos = pipe.step(_compass(30, 30), ts_ms=2)
+    assert pos is not None
+    assert (pos.position.x, pos.position.y) == (137546, 80912)
+    assert engine.batches == [2, 1]  # only the failed line is read again
+
+
+def test_planet_name_is_filled_and_a_planet_change_is_emitted():
+    class _Planet:
+        def __init__(self) -> None:
+            self.name = "Calypso"
+
+        def read(self, roi):
+            return self.name
+
+        def close(self) -> None:
+            pass
+
+    planet = _Planet()
+    engine = _ScriptedEngine({120: "137546", 110: "80912"})
+    pipe = PositionPipeline(ROIS, engine=engine, planet=planet)  # type: ignore[arg-type]
+
+    pos = pipe.step(_compass(30, 30), ts_ms=1)
+    assert pos is not None and pos.position.planet_name == "Calypso"
+
+    planet.name = "Planet Arkadia"
+    pos = pipe.step(_compass(30, 30), ts_ms=2)
+    assert pos is not None and pos.position.planet_name == "Planet Arkadia"
+    assert engine.batches == [2]  # coordinates unchanged: no digit OCR
+
+
+def test_tracker_drops_a_misread_and_quick_reads_skip_the_full_engine():
+    from zml_game_bridge.inputs.ocr.pipelines.position.tracker import PositionTracker
+
+    full = _ScriptedEngine({120: "137546", 110: "80912"})
+    quick = _ScriptedEngine({120: "", 110: ""})  # rejects until taught otherwise
+    pipe = PositionPipeline(ROIS, engine=full, tracker=PositionTracker(), quick_engine=quick)
+
+    pos = pipe.step(_compass(30, 30), ts_ms=0)
+    assert pos is not None and pos.confidence == 0.5
+
+    # Full engine misreads lon 137547 as 187547: dropped, nothing emitted.
+    full.answers[120] = "187547"
+    assert pipe.step(_compass(40, 30), ts_ms=100) is None
+
+    # The rejection forces both lines to be re-read; cheap reads agree with the track,
+    # so the full engine is not needed.
+    quick.answers.update({120: "137547", 110: "80912"})
+    batches = len(full.batches)
+    pos = pipe.step(_compass(41, 30), ts_ms=200)
+    assert pos is not None
+    assert (pos.position.x, pos.position.y) == (137547, 80912)
+    assert pos.confidence > 0.5
+    assert len(full.batches) == batches
+    assert pipe.quick_reads >= 1
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.preprocess import (
+    DigitsPreprocessConfig,
+    DigitsPreprocessor,
+)
+
+
+def _line(seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    img = rng.integers(20, 60, size=(20, 60), dtype=np.uint8)
+    cv2.putText(img, "13754", (2, 16), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 230, 1, cv2.LINE_AA)
+    img[2, 55] = 255  # speck for the small-component filter
+    return img
+
+
+def _reference(img: np.ndarray, cfg: DigitsPreprocessConfig) -> np.ndarray:
+    """Straightforward allocating version of the same steps."""
+    h, w = img.shape
+    work = cv2.resize(img, (w * cfg.upscale, h * cfg.upscale), interpolation=cfg.interpolation)
+    top = cv2.morphologyEx(work, cv2.MORPH_TOPHAT, cv2.getStructuringElement(cv2.MORPH_RECT, cfg.tophat_kernel))
+    _, bw = cv2.threshold(top, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    bw = cv2.morphologyEx(
+        bw,
+        cv2.MORPH_CLOSE,
+        cv2.getStructuringElement(cv2.MORPH_RECT, cfg.morph_close_kernel),
+        iterations=cfg.morph_close_iterations,
+    )
+    n, labels, stats, _ = cv2.connectedComponentsWithStats((bw > 0).astype(np.uint8), connectivity=8)
+    out = np.zeros_like(bw)
+    for label in range(1, n):
+        if stats[label, cv2.CC_STAT_AREA] >= cfg.min_cc_area:
+            out[labels == label] = 255
+    if np.count_nonzero(out) / out.size < 0.5:
+        out = cv2.bitwise_not(out)
+    return out
+
+
+def test_matches_reference_with_small_component_filter():
+    cfg = DigitsPreprocessConfig(remove_small_cc=True, min_cc_area=12)
+    pre = DigitsPreprocessor(cfg)
+    for seed in range(5):
+        img = _line(seed)
+        assert np.array_equal(pre.process(img), _reference(img, cfg))
+
+
+def test_output_buffer_is_reused_per_slot():
+    pre = DigitsPreprocessor()
+    a = pre.process(_line(0))
+    a_copy = a.copy()
+    b = pre.process(_line(1), slot=1)
+    assert not np.shares_memory(a, b)
+    assert np.array_equal(a, a_copy)
+
+    again = pre.process(_line(2))
+    assert np.shares_memory(a, again)
+
+
+def test_workspaces_for_old_shapes_are_dropped():
+    pre = DigitsPreprocessor()
+    first = pre.process(_line(0))
+    # A window resize gives every ROI a new shape; old workspaces must not pile up.
+    for w in range(61, 81):
+        pre.process(np.full((20, w), 40, dtype=np.uint8))
+
+    assert not np.shares_memory(first, pre.process(_line(0)))
+
+
+def test_accepts_bgra_and_bgr():
+    pre = DigitsPreprocessor()
+    gray = _line()
+    want = pre.process(gray).copy()
+    assert np.array_equal(pre.process(cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)), want)
+    assert np.array_equal(pre.process(cv2.cvtColor(gray, cv2.COLOR_GRAY2BGRA)), want)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from zml_game_bridge.inputs.ocr.capture.frame_source import FrameSourceExhausted
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect
+from zml_game_bridge.inputs.ocr.capture.replay_source import (
+    DirectoryReplaySource,
+    RawVideoReplaySource,
+)
+
+
+def _frames(n: int, h: int = 6, w: int = 8, c: int = 4) -> np.ndarray:
+    return np.stack([np.full((h, w, c), i, dtype=np.uint8) for i in range(n)])
+
+
+def test_raw_video_replays_frames_in_order_and_loops(tmp_path: Path) -> None:
+    path = tmp_path / "frames.raw"
+    _frames(3).tofile(path)
+
+    src = RawVideoReplaySource(path, width=8, height=6, channels=4)
+    got = [int(src.grab()[0, 0, 0]) for _ in range(5)]
+    src.close()
+
+    assert got == [0, 1, 2, 0, 1]
+
+
+def test_raw_video_without_loop_is_exhausted(tmp_path: Path) -> None:
+    path = tmp_path / "frames.raw"
+    _frames(2).tofile(path)
+
+    src = RawVideoReplaySource(path, width=8, height=6, channels=4, loop=False)
+    src.grab()
+    src.grab()
+    with pytest.raises(FrameSourceExhausted):
+        src.grab()
+
+
+def test_directory_replay_reads_sorted_frames(tmp_path: Path) -> None:
+    for i, v in enumerate([10, 20, 30]):
+        cv2.imwrite(str(tmp_path / f"frame_{i:03d}.png"), np.full((4, 5, 3), v, dtype=np.uint8))
+
+    src = DirectoryReplaySource(tmp_path, loop=False)
+    got = [int(src.grab()[0, 0, 0]) for _ in range(3)]
+
+    assert got == [10, 20, 30]
+    with pytest.raises(FrameSourceExhausted):
+        src.grab()
+
+
+def test_raw_video_grab_rois_returns_gray_crops(tmp_path: Path) -> None:
+    path = tmp_path / "frames.raw"
+    frames = _frames(1, h=6, w=8, c=4)
+    frames[0, 1:3, 2:5] = (10, 20, 30, 255)
+    frames.tofile(path)
+
+    src = RawVideoReplaySource(path, width=8, height=6, channels=4)
+    inside, outside = src.grab_rois([RoiRect(x1=2, x2=5, y1=1, y2=3), RoiRect(x1=50, x2=60, y1=0, y2=1)])
+
+    assert outside is None
+    assert inside is not None
+    assert inside.shape == (2, 3)
+    assert np.all(inside == cv2.cvtColor(frames[0, 1:3, 2:5], cv2.COLOR_BGRA2GRAY))
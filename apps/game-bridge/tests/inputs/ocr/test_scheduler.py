@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.capture.model import RoiRect
+from zml_game_bridge.inputs.ocr.scheduler import PipelineScheduler, PipelineSpec
+
+ROI = RoiRect(x1=0, y1=0, x2=10, y2=10)
+
+
+class _Pipeline:
+    def __init__(self, run_s: float = 0.0) -> None:
+        self.run_s = run_s
+        self.steps: list[int] = []
+        self.done = threading.Event()
+        self.closed = False
+
+    def step(self, roi: np.ndarray, ts_ms: int) -> None:
+        time.sleep(self.run_s)
+        self.steps.append(ts_ms)
+        self.done.set()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _wait_idle(s: PipelineScheduler, name: str, runs: int) -> None:
+    deadline = time.perf_counter() + 1.0
+    while time.perf_counter() < deadline:
+        if next(st for st in s.stats() if st.name == name).runs >= runs:
+            return
+        time.sleep(0.005)
+    raise AssertionError("worker did not finish")
+
+
+def test_each_pipeline_runs_at_its_own_rate():
+    s = PipelineScheduler()
+    s.add(PipelineSpec(name="fast", roi=ROI, target_hz=2.0, budget_ms=100.0), _Pipeline)
+    s.add(PipelineSpec(name="slow", roi=ROI, target_hz=1.0, budget_ms=100.0), _Pipeline)
+
+    assert [p.name for p in s.due(10.0)] == ["fast", "slow"]
+    assert s.due(10.2) == []
+    assert [p.name for p in s.due(10.5)] == ["fast"]
+    assert [p.name for p in s.due(11.0)] == ["fast", "slow"]
+
+
+def test_busy_pipeline_is_skipped_and_loop_never_waits():
+    slow = _Pipeline(run_s=0.2)
+    s = PipelineScheduler()
+    s.add(PipelineSpec(name="deeds", roi=ROI, target_hz=100.0, budget_ms=1000.0), lambda: slow)
+    s.start()
+    try:
+        t0 = time.perf_counter()
+        (spec,) = s.due(t0)
+        s.submit(spec.name, np.zeros((2, 2), np.uint8), ts_ms=1)
+        assert time.perf_counter() - t0 < 0.05  # handed off, not run inline
+
+        time.sleep(0.05)
+        assert s.due(time.perf_counter() + 1.0) == []  # still running -> skipped
+        _wait_idle(s, "deeds", 1)
+        st = s.stats()[0]
+        assert (st.runs, st.skipped_busy) == (1, 1)
+    finally:
+        s.stop()
+    assert slow.closed
+
+
+def test_over_budget_run_defers_the_next_one():
+    p = _Pipeline(run_s=0.03)
+    s = PipelineScheduler()
+    s.add(PipelineSpec(name="finder", roi=ROI, target_hz=10.0, budget_ms=10.0), lambda: p)
+    s.start()
+    try:
+        now = time.perf_counter()
+        s.due(now)
+        s.submit("finder", np.zeros((2, 2), np.uint8), ts_ms=1)
+        _wait_idle(s, "finder", 1)
+
+        st = s.stats()[0]
+        assert st.deferred == 1 and st.last_ms >= 30.0
+        # ~30 ms over a 10 ms budget -> pushed back >= 3 periods (300 ms) from the run's end.
+        assert s.due(time.perf_counter() + 0.15) == []
+        assert [x.name for x in s.due(time.perf_counter() + 0.4)] == ["finder"]
+    finally:
+        s.stop()
+
+
+def test_pipeline_is_built_and_closed_on_its_worker_thread():
+    built_on: list[str] = []
+    pipe = _Pipeline()
+
+    def factory() -> _Pipeline:
+        built_on.append(threading.current_thread().name)
+        return pipe
+
+    s = PipelineScheduler()
+    s.add(PipelineSpec(name="finder", roi=ROI, target_hz=10.0, budget_ms=100.0), factory)
+    s.start()
+    (spec,) = s.due(time.perf_counter())
+    s.submit(spec.name, np.zeros((2, 2), np.uint8), ts_ms=1)
+    _wait_idle(s, "finder", 1)
+    s.stop()
+
+    assert built_on == ["ocr-finder"]
+    assert pipe.closed
+
+
+def test_failed_factory_disables_only_that_pipeline():
+    def broken() -> _Pipeline:
+        raise RuntimeError("no tesseract")
+
+    s = PipelineScheduler()
+    s.add(PipelineSpec(name="deeds", roi=ROI, target_hz=10.0, budget_ms=100.0), broken)
+    s.add(PipelineSpec(name="finder", roi=ROI, target_hz=10.0, budget_ms=100.0), _Pipeline)
+    s.start()
+    s.threads()["ocr-deeds"].join(timeout=1.0)
+    try:
+        assert [p.name for p in s.due(time.perf_counter())] == ["finder"]
+    finally:
+        s.stop()
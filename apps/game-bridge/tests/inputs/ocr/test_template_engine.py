@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from zml_game_bridge.inputs.ocr.pipelines.position.template_engine import (
+    DigitTemplates,
+    TemplateDigitsEngine,
+    segment_glyphs,
+    train_templates,
+)
+
+
+def _render(digits: str, *, xs: list[int] | None = None) -> np.ndarray:
+    """Binary line like DigitsPreprocessor output: dark digits on white."""
+    xs = xs or [6 + i * 24 for i in range(len(digits))]
+    img = np.full((48, xs[-1] + 32), 255, dtype=np.uint8)
+    for x, ch in zip(xs, digits, strict=True):
+        cv2.putText(img, ch, (x, 38), cv2.FONT_HERSHEY_SIMPLEX, 1.2, 0, 3, cv2.LINE_8)
+    return img
+
+
+def _engine() -> TemplateDigitsEngine:
+    labels = ["0123456789", "9876543210", "135792468"]
+    templates, used = train_templates((_render(s), s) for s in labels)
+    assert used == len(labels)
+    return TemplateDigitsEngine(templates)
+
+
+def test_segments_one_range_per_digit():
+    assert len(segment_glyphs(_render("137546"))) == 6
+
+
+def test_touching_digits_are_split_by_pitch():
+    # The middle pair is drawn closer than the glyph width, so it shares ink columns.
+    img = _render("5880", xs=[6, 30, 48, 72])
+    glyphs = segment_glyphs(img)
+    assert len(glyphs) == 4
+    assert _engine().recognize_digits(img) == "5880"
+
+
+def test_reads_unseen_numbers():
+    engine = _engine()
+    for s in ("137546", "80912", "75484"):
+        assert engine.recognize_digits(_render(s)) == s
+
+
+def test_rejects_non_digit_blob_and_blank():
+    engine = _engine()
+
+    blob = _render("1234")
+    blob[10:40, 30:60] = 0
+    assert engine.recognize_digits(blob) == ""
+    assert engine.recognize_digits(np.full((48, 100), 255, dtype=np.uint8)) == ""
+
+
+def test_templates_roundtrip(tmp_path):
+    templates, _ = train_templates([(_render("0123456789"), "0123456789")])
+    path = tmp_path / "t.npz"
+    templates.save(path)
+
+    loaded = DigitTemplates.load(path)
+    assert loaded.glyph_size == templates.glyph_size
+    assert np.allclose(loaded.matrix, templates.matrix)
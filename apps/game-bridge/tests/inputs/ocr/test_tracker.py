@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from zml_game_bridge.inputs.ocr.pipelines.position.tracker import PositionTracker, TrackerConfig
+
+
+def _walk(t: PositionTracker, n: int, *, x0: int = 137_000, y0: int = 75_000, step: int = 2) -> int:
+    """n fixes at 10 Hz moving +step in x; returns the next ts_ms."""
+    for i in range(n):
+        assert t.update(x0 + step * i, y0, ts_ms=100 * i) is not None
+    return 100 * n
+
+
+def test_first_fix_is_accepted_with_initial_confidence_and_rises_on_track():
+    t = PositionTracker()
+    assert t.update(137_000, 75_000, ts_ms=0) == 0.5
+    _walk(t, 5)
+    assert t.update(137_010, 75_000, ts_ms=500) == 1.0
+
+
+def test_single_misread_digit_is_rejected():
+    t = PositionTracker()
+    ts = _walk(t, 5)
+
+    # 137010 read as 187010: 50 km in 100 ms.
+    assert t.update(187_010, 75_000, ts_ms=ts) is None
+    assert t.update(137_012, 75_000, ts_ms=ts + 100) is not None
+    assert (t.accepted, t.rejected, t.reacquired) == (6, 1, 0)
+
+
+def test_prediction_follows_constant_velocity():
+    t = PositionTracker()
+    t.update(1000, 2000, ts_ms=0)
+    t.update(1010, 2000, ts_ms=1000)
+    assert t.predict(2000) == (1020.0, 2000.0)
+    assert t.gate(2000) == 100.0 + 25.0
+
+
+def test_misread_after_idle_is_rejected_by_capped_gate():
+    t = PositionTracker()
+    ts = _walk(t, 5)
+
+    # 10 s without a fix (player standing still): the gate stops at max_velocity_gap_s.
+    idle = ts + 10_000
+    assert t.gate(idle) == 100.0 * 2.0 + 25.0
+    # 137010 read as 137910: 900 units, inside an uncapped 10 s gate (1025).
+    assert t.update(137_910, 75_000, ts_ms=idle) is None
+    assert t.update(137_010, 75_000, ts_ms=idle + 100) is not None
+
+
+def test_consistent_far_fixes_reacquire_the_track():
+    t = PositionTracker(TrackerConfig(reacquire_fixes=3))
+    ts = _walk(t, 5)
+
+    assert t.update(90_000, 20_000, ts_ms=ts) is None
+    assert t.update(90_001, 20_000, ts_ms=ts + 100) is None
+    assert t.update(90_002, 20_000, ts_ms=ts + 200) == 0.5
+    assert t.reacquired == 1
+    assert t.update(90_003, 20_000, ts_ms=ts + 300) is not None
+
+
+def test_scattered_misreads_do_not_reacquire():
+    t = PositionTracker()
+    ts = _walk(t, 5)
+    for i, x in enumerate((187_010, 737_010, 131_010 + 50_000)):
+        assert t.update(x, 75_000, ts_ms=ts + 100 * i) is None
+    assert t.reacquired == 0
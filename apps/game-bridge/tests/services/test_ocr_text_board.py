@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from zml_game_bridge.inputs.ocr.pipelines.text.model import OcrText
+from zml_game_bridge.services.ocr_text_board import OcrTextBoard
+
+
+def test_keeps_latest_text_per_source() -> None:
+    board = OcrTextBoard()
+    assert board.latest() == []
+
+    board.on_text(OcrText(source="finder", ts_ms=1, lines=("Depth 12",)))
+    board.on_text(OcrText(source="deeds", ts_ms=2, lines=("Zorn Star Ore",)))
+    board.on_text(OcrText(source="finder", ts_ms=3, lines=("Depth 14",)))
+
+    assert [(t.source, t.ts_ms, t.lines) for t in board.latest()] == [
+        ("deeds", 2, ("Zorn Star Ore",)),
+        ("finder", 3, ("Depth 14",)),
+    ]
+    assert board.updates == 3
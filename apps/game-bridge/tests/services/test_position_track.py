@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+
+from zml_game_bridge.common.models import WorldPos
+from zml_game_bridge.inputs.ocr.pipelines.position.model import OcrPosition
+from zml_game_bridge.services.position_track import (
+    PositionTrack,
+    TrackSlice,
+    douglas_peucker,
+    simplify_track,
+)
+
+
+def _pos(ts_ms: int, x: int, y: int, planet: str = "Calypso") -> OcrPosition:
+    return OcrPosition(ts_ms=ts_ms, position=WorldPos(planet_name=planet, x=x, y=y, z=None))
+
+
+def test_read_range_is_inclusive_and_ordered() -> None:
+    track = PositionTrack(capacity=10)
+    for i in range(5):
+        track.append(_pos(1000 + i * 100, i, -i))
+
+    sl = track.read_range(1100, 1300)
+    assert sl.ts_ms.tolist() == [1100, 1200, 1300]
+    assert sl.x.tolist() == [1, 2, 3]
+    assert sl.y.tolist() == [-1, -2, -3]
+
+
+def test_ring_keeps_latest_points_after_wrap() -> None:
+    track = PositionTrack(capacity=3)
+    for i in range(7):
+        track.append(_pos(i, i, i))
+
+    assert track.oldest_ts_ms() == 4
+    assert track.read_range(0, 100).ts_ms.tolist() == [4, 5, 6]
+
+
+def test_read_range_filters_by_planet() -> None:
+    track = PositionTrack(capacity=10)
+    for i in range(6):
+        track.append(_pos(i, i, 0, planet="Calypso" if i % 2 == 0 else "Arkadia"))
+
+    assert track.read_range(0, 100, planet="Arkadia").ts_ms.tolist() == [1, 3, 5]
+    assert track.read_range(1, 4, planet="Calypso").x.tolist() == [2, 4]
+    assert len(track.read_range(0, 100, planet="Toulan")) == 0
+    assert len(track.read_range(0, 100)) == 6
+
+
+def test_drain_pending_returns_rows_once() -> None:
+    track = PositionTrack(capacity=10)
+    track.append(_pos(1, 10, 20))
+    track.append(_pos(2, 11, 21))
+
+    assert track.drain_pending() == [(1, "Calypso", 10, 20, None), (2, "Calypso", 11, 21, None)]
+    assert track.drain_pending() == []
+
+
+def test_douglas_peucker_drops_collinear_points() -> None:
+    x = np.array([0, 1, 2, 3, 4, 4, 4])
+    y = np.array([0, 0, 0, 0, 0, 1, 2])
+
+    assert douglas_peucker(x, y, epsilon=0.5).tolist() == [0, 4, 6]
+
+
+def test_simplify_track_respects_max_points() -> None:
+    n = 5000
+    t = np.arange(n, dtype=np.int64)
+    sl = TrackSlice(
+        ts_ms=t,
+        x=(np.cos(t / 50.0) * 1000).astype(np.int32),
+        y=(np.sin(t / 70.0) * 1000).astype(np.int32),
+    )
+
+    out = simplify_track(sl, tolerance=0.0, max_points=200)
+
+    assert 2 <= len(out) <= 200
+    assert out.ts_ms[0] == 0 and out.ts_ms[-1] == n - 1
+    assert np.all(np.diff(out.ts_ms) > 0)